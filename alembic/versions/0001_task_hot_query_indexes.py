@@ -0,0 +1,61 @@
+"""Add indexes for task hot queries
+
+Composite indexes for group/personal/assignee listings plus partial
+indexes (Postgres and SQLite) for the reminder, overdue and cleanup
+sweeps so they stop scanning completed tasks.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REMINDABLE = "status IN ('PENDING', 'IN_PROGRESS')"
+OPEN = "status IN ('PENDING', 'IN_PROGRESS', 'SUBMITTED')"
+
+# (name, columns, partial predicate or None)
+INDEXES = [
+    ("ix_tasks_group_status_created", ["group_id", "status", "created_at"], None),
+    ("ix_tasks_user_status_created", ["user_id", "status", "created_at"], None),
+    ("ix_tasks_assignee_open", ["assignee_id", "group_id", "created_at"], OPEN),
+    (
+        "ix_tasks_reminder_sweep",
+        ["group_id", "reminder_interval_minutes", "due_date"],
+        f"{REMINDABLE} AND reminder_interval_minutes IS NOT NULL",
+    ),
+    (
+        "ix_tasks_overdue_sweep",
+        ["due_date"],
+        f"{REMINDABLE} AND group_id IS NOT NULL AND due_date IS NOT NULL",
+    ),
+    ("ix_tasks_completed_verified", ["verified_at"], "status = 'COMPLETED'"),
+    ("ix_tasks_reminder_at", ["reminder_at"], "reminder_at IS NOT NULL"),
+]
+
+
+def upgrade() -> None:
+    # Tables may already carry these indexes if created by init_db()
+    for name, columns, predicate in INDEXES:
+        where = {}
+        if predicate:
+            where = {
+                "postgresql_where": sa.text(predicate),
+                "sqlite_where": sa.text(predicate),
+            }
+        op.create_index(name, "tasks", columns, if_not_exists=True, **where)
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="tasks", if_exists=True)
@@ -0,0 +1,76 @@
+"""Add tasks.next_reminder_at for the reminder sweep
+
+Materializes last_reminder_sent + reminder_interval_minutes so
+process_group_reminders becomes one indexed range scan instead of
+loading every active task and filtering in Python. Replaces the
+ix_tasks_reminder_sweep index from 0001.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+REMINDABLE = "status IN ('PENDING', 'IN_PROGRESS')"
+
+# Never-reminded tasks are due right away, so created_at (always in the
+# past) stands in for "now"
+NEXT_REMINDER_SQL = {
+    "postgresql": (
+        "COALESCE(last_reminder_sent + reminder_interval_minutes * INTERVAL '1 minute', "
+        "created_at)"
+    ),
+    "sqlite": (
+        "COALESCE(datetime(last_reminder_sent, '+' || reminder_interval_minutes || ' minutes'), "
+        "created_at)"
+    ),
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {c["name"] for c in inspector.get_columns("tasks")}
+    # Tables created by init_db() after this change already have the column
+    if "next_reminder_at" not in columns:
+        op.add_column(
+            "tasks",
+            sa.Column("next_reminder_at", sa.DateTime(timezone=True), nullable=True),
+        )
+
+    op.execute(
+        f"UPDATE tasks SET next_reminder_at = {NEXT_REMINDER_SQL[bind.dialect.name]} "
+        f"WHERE group_id IS NOT NULL AND reminder_interval_minutes IS NOT NULL "
+        f"AND {REMINDABLE}"
+    )
+
+    op.drop_index("ix_tasks_reminder_sweep", table_name="tasks", if_exists=True)
+    op.create_index(
+        "ix_tasks_next_reminder", "tasks", ["next_reminder_at"], if_not_exists=True,
+        postgresql_where=sa.text("next_reminder_at IS NOT NULL"),
+        sqlite_where=sa.text("next_reminder_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_next_reminder", table_name="tasks", if_exists=True)
+    predicate = f"{REMINDABLE} AND reminder_interval_minutes IS NOT NULL"
+    op.create_index(
+        "ix_tasks_reminder_sweep", "tasks",
+        ["group_id", "reminder_interval_minutes", "due_date"], if_not_exists=True,
+        postgresql_where=sa.text(predicate),
+        sqlite_where=sa.text(predicate),
+    )
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("next_reminder_at")
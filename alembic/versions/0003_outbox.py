@@ -0,0 +1,62 @@
+"""Add the notification outbox
+
+Group reminders and overdue notices are written to outbox in the same
+transaction as the task update and delivered by OutboxRelay.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING = "status = 'PENDING'"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # Databases created by init_db() after this change already have it
+    if not sa.inspect(bind).has_table("outbox"):
+        op.create_table(
+            "outbox",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("idempotency_key", sa.String(128), nullable=False, unique=True),
+            sa.Column("chat_id", sa.BigInteger(), nullable=False),
+            sa.Column("text", sa.Text(), nullable=False),
+            sa.Column("parse_mode", sa.String(16), nullable=True),
+            sa.Column("priority", sa.SmallInteger(), nullable=False),
+            sa.Column(
+                "status",
+                sa.Enum("PENDING", "SENT", "FAILED", name="outboxstatus"),
+                nullable=False,
+            ),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("last_error", sa.Text(), nullable=True),
+            sa.Column("available_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column(
+                "created_at", sa.DateTime(timezone=True),
+                server_default=sa.func.now(), nullable=False,
+            ),
+            sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        )
+    op.create_index(
+        "ix_outbox_pending", "outbox", ["available_at"], if_not_exists=True,
+        postgresql_where=sa.text(PENDING),
+        sqlite_where=sa.text(PENDING),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_pending", table_name="outbox", if_exists=True)
+    op.drop_table("outbox")
+    sa.Enum(name="outboxstatus").drop(op.get_bind(), checkfirst=True)
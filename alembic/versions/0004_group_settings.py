@@ -0,0 +1,40 @@
+"""Add per-group settings
+
+Starts with reminder_digest: groups that turn it on get one combined
+reminder message per cycle instead of one message per task.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases created by init_db() after this change already have it
+    if sa.inspect(op.get_bind()).has_table("group_settings"):
+        return
+    op.create_table(
+        "group_settings",
+        sa.Column("group_id", sa.BigInteger(), primary_key=True, autoincrement=False),
+        sa.Column("reminder_digest", sa.Boolean(), nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True),
+            server_default=sa.func.now(), nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("group_settings")
@@ -0,0 +1,36 @@
+"""Add group_settings.dashboard_message_id
+
+Message ID of the pinned task dashboard the bot edits in place; NULL
+means the group has no dashboard.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    columns = {c["name"] for c in sa.inspect(op.get_bind()).get_columns("group_settings")}
+    # Tables created by init_db() after this change already have the column
+    if "dashboard_message_id" not in columns:
+        op.add_column(
+            "group_settings",
+            sa.Column("dashboard_message_id", sa.BigInteger(), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("group_settings") as batch_op:
+        batch_op.drop_column("dashboard_message_id")
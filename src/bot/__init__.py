@@ -1,5 +1,17 @@
 # src/bot/__init__.py
 """Bot module exports."""
+import importlib
+
 from .app import create_bot, create_dispatcher, on_startup, on_shutdown
+from .webhook import create_webhook_app, run_webhook
+
+_update_executor = importlib.import_module(".update-executor", package=__name__)
+ChatOrderedExecutor = _update_executor.ChatOrderedExecutor
+ChatOrderedDispatcher = _update_executor.ChatOrderedDispatcher
+get_update_executor = _update_executor.get_update_executor
 
-__all__ = ["create_bot", "create_dispatcher", "on_startup", "on_shutdown"]
+__all__ = [
+    "create_bot", "create_dispatcher", "on_startup", "on_shutdown",
+    "create_webhook_app", "run_webhook",
+    "ChatOrderedExecutor", "ChatOrderedDispatcher", "get_update_executor",
+]
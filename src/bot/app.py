@@ -1,5 +1,7 @@
 # src/bot/app.py
 """Bot and Dispatcher initialization."""
+import importlib
+
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
@@ -7,33 +9,64 @@ from aiogram.fsm.storage.redis import RedisStorage
 
 from src.core.config import settings
 from src.database import async_session_factory
+from src.services import (
+    create_rate_limiter, create_update_dedup, get_group_dashboard, get_user_cache
+)
+
+_update_executor = importlib.import_module("src.bot.update-executor")
 
 
 def create_bot() -> Bot:
     """Create and configure bot instance."""
-    return Bot(
+    from src.bot.middlewares import get_outbound_dispatcher
+
+    bot = Bot(
         token=settings.BOT_TOKEN,
         default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN)
     )
+    if settings.OUTBOUND_ENABLED:
+        # Every send/edit goes through the paced priority queue
+        bot.session.middleware(get_outbound_dispatcher())
+    return bot
 
 
 def create_dispatcher() -> Dispatcher:
     """Create dispatcher with routers and middlewares."""
     from src.bot.handlers import (
         commands_router, tasks_router, callbacks_router,
-        group_tasks_router, group_task_fsm_router, dm_task_fsm_router
+        group_tasks_router, group_task_fsm_router, dm_task_fsm_router,
+        chat_members_router
+    )
+    from src.bot.middlewares import (
+        AuthMiddleware, RateLimitMiddleware, GroupRateLimitMiddleware, DbSessionMiddleware,
+        UpdateDedupMiddleware
     )
-    from src.bot.middlewares import AuthMiddleware, RateLimitMiddleware, GroupRateLimitMiddleware
 
     # Use RedisStorage for FSM state persistence
     storage = RedisStorage.from_url(settings.REDIS_URL)
-    dp = Dispatcher(storage=storage)
+    # Updates run in order per chat, chats in parallel on a bounded pool
+    dp = _update_executor.ChatOrderedDispatcher(
+        _update_executor.get_update_executor(), storage=storage
+    )
+
+    # Rate limiter shares the FSM Redis connection when RATE_LIMIT_BACKEND=redis
+    limiter = create_rate_limiter(storage.redis)
 
     # Register middlewares (outer = runs first)
-    dp.message.outer_middleware(GroupRateLimitMiddleware(max_per_minute=30))
-    dp.message.outer_middleware(RateLimitMiddleware())
-    dp.message.middleware(AuthMiddleware())
-    dp.callback_query.middleware(AuthMiddleware())
+    # Redelivered updates stop here, before rate limits, DB sessions and handlers;
+    # only polling feeds updates in order, which the restart floor relies on
+    dp.update.outer_middleware(UpdateDedupMiddleware(
+        create_update_dedup(),
+        finished_below=dp.finished_below if settings.BOT_MODE == "polling" else None,
+    ))
+    dp.message.outer_middleware(GroupRateLimitMiddleware(limiter, max_per_minute=30))
+    dp.message.outer_middleware(RateLimitMiddleware(limiter))
+    # One DB session per update, shared by AuthMiddleware and handlers
+    dp.message.middleware(DbSessionMiddleware(async_session_factory))
+    dp.callback_query.middleware(DbSessionMiddleware(async_session_factory))
+    auth = AuthMiddleware(get_user_cache())
+    dp.message.middleware(auth)
+    dp.callback_query.middleware(auth)
 
     # Register routers
     dp.include_router(commands_router)
@@ -42,6 +75,7 @@ def create_dispatcher() -> Dispatcher:
     dp.include_router(group_task_fsm_router)
     dp.include_router(dm_task_fsm_router)
     dp.include_router(callbacks_router)
+    dp.include_router(chat_members_router)
 
     return dp
 
@@ -51,12 +85,22 @@ async def on_startup(bot: Bot):
     from loguru import logger
     me = await bot.get_me()
     logger.info(f"Bot started: @{me.username}")
+    get_user_cache().start()
+    get_group_dashboard().configure(bot, async_session_factory)
 
 
 async def on_shutdown(bot: Bot):
     """Shutdown hook."""
     from loguru import logger
     logger.info("Bot shutting down...")
+    # Finish queued updates while caches and the outbound queue still work
+    await _update_executor.get_update_executor().close()
+    await get_user_cache().stop()
+    from src.scheduler import get_timer_notifier
+    await get_timer_notifier().close()
+    await get_group_dashboard().close()
+    from src.bot.middlewares import get_outbound_dispatcher
+    await get_outbound_dispatcher().close()
 
 
 def get_session():
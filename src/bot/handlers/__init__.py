@@ -10,10 +10,12 @@ from .callbacks import callbacks_router
 group_tasks = importlib.import_module("src.bot.handlers.group-tasks")
 group_task_fsm = importlib.import_module("src.bot.handlers.group-task-fsm")
 dm_task_fsm = importlib.import_module("src.bot.handlers.dm-task-fsm")
+chat_members = importlib.import_module("src.bot.handlers.chat-members")
 
 group_tasks_router = group_tasks.group_tasks_router
 group_task_fsm_router = group_task_fsm.group_task_fsm_router
 dm_task_fsm_router = dm_task_fsm.dm_task_fsm_router
+chat_members_router = chat_members.chat_members_router
 
 __all__ = [
     "commands_router",
@@ -22,4 +24,5 @@ __all__ = [
     "group_tasks_router",
     "group_task_fsm_router",
     "dm_task_fsm_router",
+    "chat_members_router",
 ]
@@ -3,10 +3,14 @@
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from aiogram.fsm.context import FSMContext
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.constants import MSG_CONFIRM_DELETE, MSG_HELP
-from src.database import async_session_factory, TaskRepository, TaskStatus
-from src.bot.keyboards.inline import TaskCallback, get_confirm_delete_keyboard, get_task_list_keyboard
+from src.database import TaskRepository, TaskStatus
+from src.bot.keyboards.inline import (
+    TaskCallback, TaskListCallback, get_confirm_delete_keyboard, get_task_list_keyboard
+)
+from src.database.repositories.keyset import decode_cursor
 from src.bot.handlers.tasks import AddTaskStates
 import importlib
 
@@ -20,23 +24,48 @@ TaskService = _task_service.TaskService
 # === Main Menu Callbacks ===
 
 @callbacks_router.callback_query(F.data == "menu_tasks")
-async def callback_menu_tasks(callback: CallbackQuery):
+async def callback_menu_tasks(callback: CallbackQuery, session: AsyncSession):
     """Handle View Tasks button."""
-    async with async_session_factory() as session:
-        repo = TaskRepository(session)
-        tasks = await repo.get_all_by_user(callback.from_user.id, limit=10)
+    repo = TaskRepository(session)
+    page = await repo.get_all_by_user(callback.from_user.id, limit=10)
 
-    if not tasks:
+    if not page.items:
         await callback.message.edit_text("You don't have any tasks yet.\n\nUse /add to create one!")
     else:
-        text = "*Your Tasks:*\n\n"
-        for i, task in enumerate(tasks[:10], 1):
-            status_emoji = "✅" if task.status == TaskStatus.COMPLETED else "⏳"
-            text += f"{i}. {status_emoji} {task.title}\n"
-        await callback.message.edit_text(text, reply_markup=get_task_list_keyboard(tasks))
+        await _show_task_page(callback, page)
     await callback.answer()
 
 
+@callbacks_router.callback_query(TaskListCallback.filter())
+async def callback_task_page(
+    callback: CallbackQuery, callback_data: TaskListCallback, session: AsyncSession
+):
+    """Show next/previous page of personal tasks from keyset cursor."""
+    repo = TaskRepository(session)
+    page = await repo.get_all_by_user(
+        callback.from_user.id,
+        limit=10,
+        cursor=decode_cursor(callback_data.ts, callback_data.tid),
+        backward=callback_data.back
+    )
+    if not page.items:
+        return await callback.answer("No more tasks.")
+    await _show_task_page(callback, page)
+    await callback.answer()
+
+
+async def _show_task_page(callback: CallbackQuery, page):
+    """Render one page of personal tasks into the callback message."""
+    text = "*Your Tasks:*\n\n"
+    for i, task in enumerate(page.items, 1):
+        status_emoji = "✅" if task.status == TaskStatus.COMPLETED else "⏳"
+        text += f"{i}. {status_emoji} {task.title}\n"
+    await callback.message.edit_text(
+        text,
+        reply_markup=get_task_list_keyboard(page.items, page.next_cursor, page.prev_cursor)
+    )
+
+
 @callbacks_router.callback_query(F.data == "menu_add")
 async def callback_menu_add(callback: CallbackQuery, state: FSMContext):
     """Handle Add Task button - start FSM."""
@@ -53,54 +82,59 @@ async def callback_menu_help(callback: CallbackQuery):
 
 
 @callbacks_router.callback_query(TaskCallback.filter(F.action == "view"))
-async def callback_view_task(callback: CallbackQuery, callback_data: TaskCallback):
+async def callback_view_task(
+    callback: CallbackQuery, callback_data: TaskCallback, session: AsyncSession
+):
     """View task details."""
-    async with async_session_factory() as session:
-        service = TaskService(session)
-        try:
-            task = await service.get_task(callback_data.task_id, callback.from_user.id)
-            due = task.due_date.strftime('%Y-%m-%d') if task.due_date else 'Not set'
-            text = f"*Task Details*\n\n*Title:* {task.title}\n*Status:* {task.status.value}\n*Priority:* {task.priority.value}\n*Due:* {due}\n*ID:* `{task.id}`"
-            await callback.message.edit_text(text)
-        except Exception as e:
-            await callback.answer(f"Error: {e}", show_alert=True)
+    service = TaskService(session)
+    try:
+        task = await service.get_task(callback_data.task_id, callback.from_user.id)
+        due = task.due_date.strftime('%Y-%m-%d') if task.due_date else 'Not set'
+        text = f"*Task Details*\n\n*Title:* {task.title}\n*Status:* {task.status.value}\n*Priority:* {task.priority.value}\n*Due:* {due}\n*ID:* `{task.id}`"
+        await callback.message.edit_text(text)
+    except Exception as e:
+        await callback.answer(f"Error: {e}", show_alert=True)
     await callback.answer()
 
 
 @callbacks_router.callback_query(TaskCallback.filter(F.action == "complete"))
-async def callback_complete_task(callback: CallbackQuery, callback_data: TaskCallback):
+async def callback_complete_task(
+    callback: CallbackQuery, callback_data: TaskCallback, session: AsyncSession
+):
     """Mark task as completed."""
-    async with async_session_factory() as session:
-        service = TaskService(session)
-        try:
-            task = await service.complete_task(callback_data.task_id, callback.from_user.id)
-            await session.commit()
-            await callback.answer(f"Task '{task.title}' completed!")
-            await callback.message.delete()
-        except Exception as e:
-            await callback.answer(f"Error: {e}", show_alert=True)
+    service = TaskService(session)
+    try:
+        task = await service.complete_task(callback_data.task_id, callback.from_user.id)
+        await session.commit()
+        await callback.answer(f"Task '{task.title}' completed!")
+        await callback.message.delete()
+    except Exception as e:
+        await session.rollback()
+        await callback.answer(f"Error: {e}", show_alert=True)
 
 
 @callbacks_router.callback_query(TaskCallback.filter(F.action == "delete"))
-async def callback_delete_confirm(callback: CallbackQuery, callback_data: TaskCallback):
+async def callback_delete_confirm(
+    callback: CallbackQuery, callback_data: TaskCallback, session: AsyncSession
+):
     """Show delete confirmation."""
-    async with async_session_factory() as session:
-        service = TaskService(session)
-        task = await service.get_task(callback_data.task_id, callback.from_user.id)
-        await callback.message.edit_text(
-            MSG_CONFIRM_DELETE.format(title=task.title),
-            reply_markup=get_confirm_delete_keyboard(task.id)
-        )
+    service = TaskService(session)
+    task = await service.get_task(callback_data.task_id, callback.from_user.id)
+    await callback.message.edit_text(
+        MSG_CONFIRM_DELETE.format(title=task.title),
+        reply_markup=get_confirm_delete_keyboard(task.id)
+    )
     await callback.answer()
 
 
 @callbacks_router.callback_query(TaskCallback.filter(F.action == "confirm_delete"))
-async def callback_delete_task(callback: CallbackQuery, callback_data: TaskCallback):
+async def callback_delete_task(
+    callback: CallbackQuery, callback_data: TaskCallback, session: AsyncSession
+):
     """Actually delete the task."""
-    async with async_session_factory() as session:
-        service = TaskService(session)
-        await service.delete_task(callback_data.task_id, callback.from_user.id)
-        await session.commit()
+    service = TaskService(session)
+    await service.delete_task(callback_data.task_id, callback.from_user.id)
+    await session.commit()
     await callback.answer("Task deleted!")
     await callback.message.delete()
 
@@ -0,0 +1,24 @@
+# src/bot/handlers/chat-members.py
+"""Chat member updates - keep admin roster cache fresh."""
+import importlib
+
+from aiogram import Router
+from aiogram.types import ChatMemberUpdated
+
+admin_cache = importlib.import_module("src.bot.utils.admin-cache")
+
+chat_members_router = Router(name="chat_members")
+
+
+@chat_members_router.chat_member()
+async def on_chat_member(event: ChatMemberUpdated):
+    """Invalidate roster when someone gains or loses admin rights."""
+    statuses = (event.old_chat_member.status, event.new_chat_member.status)
+    if any(status in admin_cache.ADMIN_STATUSES for status in statuses):
+        admin_cache.get_admin_cache().invalidate(event.chat.id)
+
+
+@chat_members_router.my_chat_member()
+async def on_my_chat_member(event: ChatMemberUpdated):
+    """Invalidate roster when the bot itself is added, promoted or removed."""
+    admin_cache.get_admin_cache().invalidate(event.chat.id)
@@ -6,10 +6,11 @@ from aiogram import Router
 from aiogram.filters import Command, CommandStart, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.constants import MSG_WELCOME, MSG_HELP, BOT_NAME, BOT_VERSION
 from src.bot.keyboards.inline import get_main_menu_keyboard, get_settings_keyboard
-from src.database import async_session_factory, TaskRepository, TaskStatus
+from src.database import TaskRepository, TaskStatus
 
 # Import for kebab-case modules
 deep_link_helper = importlib.import_module("src.bot.utils.deep-link-helper")
@@ -56,7 +57,8 @@ async def cmd_start_deep_link(message: Message, command: CommandObject, state: F
     elif parsed["command"] == "bulktask":
         await state.set_state(dm_task_fsm.BulkTaskFSM.input_tasks)
         await message.answer(
-            "<b>Tao Hang Loat</b>\n\nNhap danh sach task (moi dong 1 task):",
+            "<b>Tao Hang Loat</b>\n\nNhap danh sach task (moi dong 1 task):\n"
+            "Bat dau dong bang @username de giao cho thanh vien.",
             parse_mode="HTML"
         )
 
@@ -97,13 +99,12 @@ async def cmd_help(message: Message):
 
 
 @commands_router.message(Command("status"))
-async def cmd_status(message: Message):
+async def cmd_status(message: Message, session: AsyncSession):
     """Handle /status command - show bot status."""
-    async with async_session_factory() as session:
-        repo = TaskRepository(session)
-        user_id = message.from_user.id
-        pending = await repo.get_all_by_user(user_id, TaskStatus.PENDING, limit=100)
-        completed = await repo.get_all_by_user(user_id, TaskStatus.COMPLETED, limit=100)
+    repo = TaskRepository(session)
+    user_id = message.from_user.id
+    pending = (await repo.get_all_by_user(user_id, TaskStatus.PENDING, limit=100)).items
+    completed = (await repo.get_all_by_user(user_id, TaskStatus.COMPLETED, limit=100)).items
 
     status_text = f"""<b>Bot Status</b>
 
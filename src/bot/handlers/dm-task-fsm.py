@@ -1,13 +1,17 @@
 # src/bot/handlers/dm-task-fsm.py
 """FSM handlers for task operations in DM. No timeout - user controls via /cancel."""
 import importlib
+import re
 from datetime import datetime
 from aiogram import Router, F, Bot
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+from sqlalchemy.ext.asyncio import AsyncSession
 from zoneinfo import ZoneInfo
 from src.core.config import settings
+from src.database import UserRepository
+from src.bot.middlewares import SendPriority, send_priority
 
 TIMEZONE = ZoneInfo(settings.TIMEZONE)
 dm_task_fsm_router = Router(name="dm_task_fsm")
@@ -41,6 +45,31 @@ def get_edit_field_keyboard() -> InlineKeyboardMarkup:
         [InlineKeyboardButton(text="Huy", callback_data="dm_cancel")]
     ])
 
+_BULK_USERNAME_LINE = re.compile(r"^@([A-Za-z0-9_]{5,32})\s+(.+)$")
+
+def _parse_bulk_lines(message: Message) -> list[dict]:
+    """Split bulk input into one item per line: title plus optional assignee.
+
+    A line may start with @username or a text mention to target a member.
+    """
+    mentions = {e.extract_from(message.text): e.user for e in message.entities or []
+                if e.type == "text_mention" and e.user}
+    items = []
+    for line in message.text.strip().split("\n"):
+        line = line.strip()
+        item = {"title": line}
+        match = _BULK_USERNAME_LINE.match(line)
+        if match:
+            item = {"title": match.group(2).strip(), "username": match.group(1)}
+        else:
+            for name, user in mentions.items():
+                if line.startswith(name + " "):
+                    item = {"title": line[len(name):].strip(), "assignee_id": user.id, "label": name}
+                    break
+        if len(item["title"]) >= 3:
+            items.append(item)
+    return items
+
 def _parse_deadline(text: str):
     for fmt in ["%d/%m %H:%M", "%d/%m/%Y %H:%M"]:
         try:
@@ -192,31 +221,47 @@ async def confirm_edittask(callback: CallbackQuery, state: FSMContext, bot: Bot,
 
 # BULK TASK HANDLERS
 @dm_task_fsm_router.message(BulkTaskFSM.input_tasks, F.chat.type == "private")
-async def process_bulk_input(message: Message, state: FSMContext):
-    lines = [l.strip() for l in message.text.strip().split("\n") if l.strip() and len(l.strip()) >= 3]
-    if not lines:
+async def process_bulk_input(message: Message, state: FSMContext, session: AsyncSession):
+    items = _parse_bulk_lines(message)
+    if not items:
         return await message.answer("Nhap it nhat 1 task (moi task >= 3 ky tu).")
-    await state.update_data(bulk_tasks=lines)
+    # Resolve @username lines against registered users before confirming
+    usernames = [i["username"] for i in items if "username" in i]
+    known = await UserRepository(session).get_ids_by_usernames(usernames)
+    unknown = sorted({u for u in usernames if u.lower() not in known})
+    if unknown:
+        return await message.answer(
+            "Khong tim thay user: " + ", ".join(f"@{u}" for u in unknown)
+            + "\nUser can nhan tin voi bot truoc, hoac tag truc tiep.")
+    data = await state.get_data()
+    for item in items:
+        if "username" in item:
+            item["assignee_id"] = known[item["username"].lower()]
+            item["label"] = f"@{item.pop('username')}"
+        item.setdefault("assignee_id", data["creator_id"])
+    await state.update_data(bulk_tasks=items)
     await state.set_state(BulkTaskFSM.confirm)
-    task_list = "\n".join([f"  {i+1}. {t}" for i, t in enumerate(lines)])
-    await message.answer(f"<b>Xac nhan tao {len(lines)} task:</b>\n\n{task_list}",
+    task_list = "\n".join([f"  {i+1}. {t['title']}" + (f" ({t['label']})" if t.get("label") else "")
+                           for i, t in enumerate(items)])
+    await message.answer(f"<b>Xac nhan tao {len(items)} task:</b>\n\n{task_list}",
                          reply_markup=get_confirm_keyboard("bulktask"), parse_mode="HTML")
 
 @dm_task_fsm_router.callback_query(BulkTaskFSM.confirm, F.data == "dm_confirm_bulktask")
-async def confirm_bulktask(callback: CallbackQuery, state: FSMContext, bot: Bot, session):
+async def confirm_bulktask(callback: CallbackQuery, state: FSMContext, bot: Bot, session: AsyncSession):
     gts = importlib.import_module("src.services.group-task-service")
     data = await state.get_data()
     service = gts.GroupTaskService(session)
     tasks = data.get("bulk_tasks", [])
     try:
-        for title in tasks:
-            await service.create_group_task(
-                group_id=data["source_group_id"], title=title,
-                assignee_id=data["creator_id"], assigned_by_id=data["creator_id"])
+        await service.create_group_tasks_bulk(
+            group_id=data["source_group_id"],
+            items=[(t["title"], t["assignee_id"]) for t in tasks],
+            assigned_by_id=data["creator_id"])
         await session.commit()
         await callback.message.edit_text(f"Da tao {len(tasks)} task!")
-        await bot.send_message(data["source_group_id"],
-            f"<b>{callback.from_user.mention_html()}</b> da tao {len(tasks)} task moi.", parse_mode="HTML")
+        with send_priority(SendPriority.NOTICE):
+            await bot.send_message(data["source_group_id"],
+                f"<b>{callback.from_user.mention_html()}</b> da tao {len(tasks)} task moi.", parse_mode="HTML")
         await callback.answer(f"Da tao {len(tasks)} task!")
     except Exception as e:
         await session.rollback()
@@ -228,8 +273,9 @@ async def confirm_bulktask(callback: CallbackQuery, state: FSMContext, bot: Bot,
 async def _notify_source_group(bot: Bot, group_id: int, action: str, task, user):
     action_text = {"newtask": "tao", "edittask": "cap nhat"}
     try:
-        await bot.send_message(group_id,
-            f"Task da duoc {action_text.get(action, 'xu ly')}!\n\n<b>{task.title}</b>\nBoi: {user.mention_html()}",
-            parse_mode="HTML")
+        with send_priority(SendPriority.NOTICE):
+            await bot.send_message(group_id,
+                f"Task da duoc {action_text.get(action, 'xu ly')}!\n\n<b>{task.title}</b>\nBoi: {user.mention_html()}",
+                parse_mode="HTML")
     except Exception:
         pass
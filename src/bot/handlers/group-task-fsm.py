@@ -15,6 +15,7 @@ from src.core.config import settings
 # Import modules using importlib for kebab-case
 keyboards = importlib.import_module("src.bot.keyboards.group-task-keyboards")
 deep_link_helper = importlib.import_module("src.bot.utils.deep-link-helper")
+admin_cache = importlib.import_module("src.bot.utils.admin-cache")
 
 TIMEZONE = ZoneInfo(settings.TIMEZONE)
 
@@ -51,8 +52,7 @@ async def cmd_task_start(message: Message, state: FSMContext):
         return
 
     # Check if user is admin
-    member = await message.chat.get_member(message.from_user.id)
-    if member.status not in ["creator", "administrator"]:
+    if not await admin_cache.is_chat_admin(message.bot, message.chat.id, message.from_user.id):
         await message.answer("Chỉ admin mới có thể tạo task.")
         return
 
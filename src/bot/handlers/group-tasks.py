@@ -4,6 +4,7 @@ import importlib
 from datetime import datetime
 
 from aiogram import Router, F
+from aiogram.exceptions import TelegramAPIError
 from aiogram.filters import Command
 from aiogram.types import Message, CallbackQuery
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,14 +12,21 @@ from zoneinfo import ZoneInfo
 
 from src.core.config import settings
 from src.database.models.task import TaskStatus
+from src.database.repositories import GroupSettingsRepository
+from src.database.repositories.keyset import decode_cursor
+from src.bot.middlewares import SendPriority, send_priority
 
 # Import with kebab-case support
 keyboards = importlib.import_module("src.bot.keyboards.group-task-keyboards")
 gts = importlib.import_module("src.services.group-task-service")
 wh = importlib.import_module("src.services.working-hours")
+admin_cache = importlib.import_module("src.bot.utils.admin-cache")
+group_dashboard = importlib.import_module("src.services.group-dashboard")
 
 GroupTaskService = gts.GroupTaskService
 GroupTaskCallback = keyboards.GroupTaskCallback
+TaskPageCallback = keyboards.TaskPageCallback
+is_chat_admin = admin_cache.is_chat_admin
 TIMEZONE = ZoneInfo(settings.TIMEZONE)
 
 group_tasks_router = Router(name="group_tasks")
@@ -37,8 +45,7 @@ async def cmd_assign(message: Message, session: AsyncSession):
         return
 
     # Check admin
-    member = await message.chat.get_member(message.from_user.id)
-    if member.status not in ["creator", "administrator"]:
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
         await message.reply(
             f"{message.from_user.mention_html()} Chỉ admin mới có thể giao task.",
             parse_mode="HTML"
@@ -114,10 +121,10 @@ async def cmd_my_tasks(message: Message, session: AsyncSession):
     """View tasks assigned to me."""
     service = GroupTaskService(session)
     group_id = message.chat.id if message.chat.type in ["group", "supergroup"] else None
-    tasks = await service.get_user_tasks(message.from_user.id, group_id)
+    page = await service.get_user_tasks(message.from_user.id, group_id)
     is_group = message.chat.type in ["group", "supergroup"]
 
-    if not tasks:
+    if not page.items:
         if is_group:
             await message.reply(
                 f"{message.from_user.mention_html()} Bạn không có task nào.",
@@ -127,17 +134,17 @@ async def cmd_my_tasks(message: Message, session: AsyncSession):
             await message.answer("Bạn không có task nào.")
         return
 
+    markup = keyboards.get_task_list_keyboard(
+        page.items, "my", page.next_cursor, page.prev_cursor
+    )
     if is_group:
         await message.reply(
-            f"{message.from_user.mention_html()} 📋 Task của bạn ({len(tasks)}):",
-            reply_markup=keyboards.get_task_list_keyboard(tasks),
+            f"{message.from_user.mention_html()} 📋 Task của bạn:",
+            reply_markup=markup,
             parse_mode="HTML"
         )
     else:
-        await message.answer(
-            f"📋 Task của bạn ({len(tasks)}):",
-            reply_markup=keyboards.get_task_list_keyboard(tasks),
-        )
+        await message.answer("📋 Task của bạn:", reply_markup=markup)
 
 
 @group_tasks_router.message(Command("tasks"))
@@ -148,8 +155,7 @@ async def cmd_all_tasks(message: Message, session: AsyncSession):
         return
 
     # Check admin
-    member = await message.chat.get_member(message.from_user.id)
-    if member.status not in ["creator", "administrator"]:
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
         await message.reply(
             f"{message.from_user.mention_html()} Chỉ admin mới có thể xem tất cả task.",
             parse_mode="HTML"
@@ -157,9 +163,9 @@ async def cmd_all_tasks(message: Message, session: AsyncSession):
         return
 
     service = GroupTaskService(session)
-    tasks = await service.get_group_tasks(message.chat.id)
+    page = await service.get_group_tasks(message.chat.id)
 
-    if not tasks:
+    if not page.items:
         await message.reply(
             f"{message.from_user.mention_html()} Không có task nào trong nhóm này.",
             parse_mode="HTML"
@@ -167,8 +173,10 @@ async def cmd_all_tasks(message: Message, session: AsyncSession):
         return
 
     await message.reply(
-        f"{message.from_user.mention_html()} 📋 Task nhóm ({len(tasks)}):",
-        reply_markup=keyboards.get_task_list_keyboard(tasks),
+        f"{message.from_user.mention_html()} 📋 Task nhóm:",
+        reply_markup=keyboards.get_task_list_keyboard(
+            page.items, "all", page.next_cursor, page.prev_cursor
+        ),
         parse_mode="HTML"
     )
 
@@ -225,15 +233,16 @@ async def cmd_done(message: Message, session: AsyncSession):
 
         # Send notification to group with verify buttons
         if task.group_id:
-            await message.bot.send_message(
-                task.group_id,
-                f"📤 Task đã Submit\n\n"
-                f"📋 {task.title}\n"
-                f"👤 Bởi: {message.from_user.mention_html()}\n\n"
-                f"Admin, vui lòng xác nhận:",
-                reply_markup=keyboards.get_verify_keyboard(task_id),
-                parse_mode="HTML",
-            )
+            with send_priority(SendPriority.NOTICE):
+                await message.bot.send_message(
+                    task.group_id,
+                    f"📤 Task đã Submit\n\n"
+                    f"📋 {task.title}\n"
+                    f"👤 Bởi: {message.from_user.mention_html()}\n\n"
+                    f"Admin, vui lòng xác nhận:",
+                    reply_markup=keyboards.get_verify_keyboard(task_id),
+                    parse_mode="HTML",
+                )
     except Exception as e:
         await session.rollback()
         if is_group:
@@ -267,8 +276,7 @@ async def cmd_verify(message: Message, session: AsyncSession):
         await message.answer("Lệnh này chỉ hoạt động trong nhóm.")
         return
 
-    member = await message.chat.get_member(message.from_user.id)
-    if member.status not in ["creator", "administrator"]:
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
         await message.reply(
             f"{message.from_user.mention_html()} Chỉ admin mới có thể xác nhận task.",
             parse_mode="HTML"
@@ -317,8 +325,7 @@ async def cmd_reject(message: Message, session: AsyncSession):
         await message.answer("Lệnh này chỉ hoạt động trong nhóm.")
         return
 
-    member = await message.chat.get_member(message.from_user.id)
-    if member.status not in ["creator", "administrator"]:
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
         await message.reply(
             f"{message.from_user.mention_html()} Chỉ admin mới có thể từ chối task.",
             parse_mode="HTML"
@@ -419,6 +426,112 @@ async def cmd_set_reminder(message: Message, session: AsyncSession):
             await message.answer(f"Lỗi: {e}")
 
 
+# ============ Group Settings ============
+
+@group_tasks_router.message(Command("digest"))
+async def cmd_digest(message: Message, session: AsyncSession):
+    """Show or toggle reminder digest mode for the group (admin only)."""
+    if message.chat.type not in ["group", "supergroup"]:
+        await message.answer("Lệnh này chỉ hoạt động trong nhóm.")
+        return
+
+    args = message.text.split()
+    repo = GroupSettingsRepository(session)
+    if len(args) < 2:
+        enabled = bool(await repo.get_digest_groups({message.chat.id}))
+        await message.reply(
+            f"{message.from_user.mention_html()} Nhắc nhở gộp: "
+            f"{'bật' if enabled else 'tắt'}\n"
+            "Sử dụng: /digest on|off",
+            parse_mode="HTML"
+        )
+        return
+
+    mode = args[1].lower()
+    if mode not in ("on", "off"):
+        await message.reply(
+            f"{message.from_user.mention_html()} Sử dụng: /digest on|off",
+            parse_mode="HTML"
+        )
+        return
+
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
+        await message.reply(
+            f"{message.from_user.mention_html()} Chỉ admin mới có thể đổi cài đặt nhóm.",
+            parse_mode="HTML"
+        )
+        return
+
+    enabled = mode == "on"
+    await repo.set_reminder_digest(message.chat.id, enabled)
+    await session.commit()
+    if enabled:
+        text = "📋 Đã bật nhắc nhở gộp: mỗi chu kỳ gửi một tin nhắn cho cả nhóm."
+    else:
+        text = "📋 Đã tắt nhắc nhở gộp: mỗi task được nhắc riêng."
+    await message.reply(f"{message.from_user.mention_html()} {text}", parse_mode="HTML")
+
+
+@group_tasks_router.message(Command("dashboard"))
+async def cmd_dashboard(message: Message, session: AsyncSession):
+    """Post and pin a live task dashboard, or turn it off (admin only)."""
+    if message.chat.type not in ["group", "supergroup"]:
+        await message.answer("Lệnh này chỉ hoạt động trong nhóm.")
+        return
+
+    args = message.text.split()
+    if len(args) < 2 or args[1].lower() not in ("on", "off"):
+        await message.reply(
+            f"{message.from_user.mention_html()} Sử dụng: /dashboard on|off",
+            parse_mode="HTML"
+        )
+        return
+
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
+        await message.reply(
+            f"{message.from_user.mention_html()} Chỉ admin mới có thể đổi cài đặt nhóm.",
+            parse_mode="HTML"
+        )
+        return
+
+    repo = GroupSettingsRepository(session)
+    old_message_id = await repo.get_dashboard_message_id(message.chat.id)
+    if old_message_id is not None:
+        try:
+            await message.bot.unpin_chat_message(message.chat.id, message_id=old_message_id)
+        except TelegramAPIError:
+            pass  # Already unpinned or deleted
+
+    if args[1].lower() == "off":
+        await repo.set_dashboard_message(message.chat.id, None)
+        await session.commit()
+        await message.reply(
+            f"{message.from_user.mention_html()} 📌 Đã tắt bảng theo dõi task.",
+            parse_mode="HTML"
+        )
+        return
+
+    counts, rows = await GroupTaskService(session).get_dashboard_tasks(
+        message.chat.id, settings.DASHBOARD_TASKS_PER_STATUS
+    )
+    body = group_dashboard.render_dashboard(counts, rows)
+    posted = await message.answer(group_dashboard.dashboard_text(body), parse_mode="HTML")
+    await repo.set_dashboard_message(message.chat.id, posted.message_id)
+    await session.commit()
+    group_dashboard.get_group_dashboard().remember(message.chat.id, posted.message_id, body)
+
+    try:
+        await message.bot.pin_chat_message(
+            message.chat.id, posted.message_id, disable_notification=True
+        )
+    except TelegramAPIError:
+        await message.reply(
+            f"{message.from_user.mention_html()} 📌 Bảng theo dõi sẽ được cập nhật tự động, "
+            "nhưng bot cần quyền ghim tin nhắn để ghim nó.",
+            parse_mode="HTML"
+        )
+
+
 # ============ Reassign ============
 
 @group_tasks_router.message(Command("reassign"))
@@ -446,8 +559,7 @@ async def cmd_reassign(message: Message, session: AsyncSession):
         await message.answer("Lệnh này chỉ hoạt động trong nhóm.")
         return
 
-    member = await message.chat.get_member(message.from_user.id)
-    if member.status not in ["creator", "administrator"]:
+    if not await is_chat_admin(message.bot, message.chat.id, message.from_user.id):
         await message.reply(
             f"{message.from_user.mention_html()} Chỉ admin mới có thể chuyển giao task.",
             parse_mode="HTML"
@@ -485,6 +597,47 @@ async def cmd_reassign(message: Message, session: AsyncSession):
 
 # ============ Callback Handlers ============
 
+@group_tasks_router.callback_query(TaskPageCallback.filter())
+async def task_page_callback(
+    callback: CallbackQuery,
+    callback_data: TaskPageCallback,
+    session: AsyncSession,
+):
+    """Show next/previous page of a task list from its keyset cursor."""
+    chat = callback.message.chat
+    is_group = chat.type in ["group", "supergroup"]
+    cursor = decode_cursor(callback_data.ts, callback_data.tid)
+    service = GroupTaskService(session)
+
+    if callback_data.scope == "all":
+        if not is_group or not await is_chat_admin(
+            callback.bot, chat.id, callback.from_user.id
+        ):
+            await callback.answer("Chỉ admin mới có thể xem tất cả task.", show_alert=True)
+            return
+        page = await service.get_group_tasks(
+            chat.id, cursor=cursor, backward=callback_data.back
+        )
+    else:
+        page = await service.get_user_tasks(
+            callback.from_user.id,
+            chat.id if is_group else None,
+            cursor=cursor,
+            backward=callback_data.back,
+        )
+
+    if not page.items:
+        await callback.answer("Không còn task nào.")
+        return
+
+    await callback.message.edit_reply_markup(
+        reply_markup=keyboards.get_task_list_keyboard(
+            page.items, callback_data.scope, page.next_cursor, page.prev_cursor
+        )
+    )
+    await callback.answer()
+
+
 @group_tasks_router.callback_query(GroupTaskCallback.filter(F.action == "view"))
 async def view_task_callback(
     callback: CallbackQuery,
@@ -512,8 +665,9 @@ async def view_task_callback(
     is_assignee = callback.from_user.id == task.assignee_id
     is_admin = False
     if callback.message.chat.type in ["group", "supergroup"]:
-        member = await callback.message.chat.get_member(callback.from_user.id)
-        is_admin = member.status in ["creator", "administrator"]
+        is_admin = await is_chat_admin(
+            callback.bot, callback.message.chat.id, callback.from_user.id
+        )
 
     deadline_str = task.due_date.strftime('%d/%m/%Y %H:%M') if task.due_date else "Không"
 
@@ -564,8 +718,9 @@ async def verify_task_callback(
 ):
     """Verify task from callback button."""
     if callback.message.chat.type in ["group", "supergroup"]:
-        member = await callback.message.chat.get_member(callback.from_user.id)
-        if member.status not in ["creator", "administrator"]:
+        if not await is_chat_admin(
+            callback.bot, callback.message.chat.id, callback.from_user.id
+        ):
             await callback.answer("Chỉ admin mới có thể xác nhận.", show_alert=True)
             return
 
@@ -593,8 +748,9 @@ async def reject_task_callback(
 ):
     """Reject task from callback button."""
     if callback.message.chat.type in ["group", "supergroup"]:
-        member = await callback.message.chat.get_member(callback.from_user.id)
-        if member.status not in ["creator", "administrator"]:
+        if not await is_chat_admin(
+            callback.bot, callback.message.chat.id, callback.from_user.id
+        ):
             await callback.answer("Chỉ admin mới có thể từ chối.", show_alert=True)
             return
 
@@ -2,19 +2,21 @@
 """Task management handlers with FSM."""
 from datetime import datetime
 import importlib
+from zoneinfo import ZoneInfo
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.core.config import settings
 from src.core.constants import MSG_NO_TASKS, MSG_TASK_CREATED, MSG_ERROR
-from src.database import async_session_factory
-from src.scheduler import get_scheduler
 from src.bot.keyboards.inline import get_task_list_keyboard, get_cancel_keyboard
 
 tasks_router = Router(name="tasks")
 _task_service = importlib.import_module("src.services.task-service")
 TaskService = _task_service.TaskService
+TIMEZONE = ZoneInfo(settings.TIMEZONE)
 
 
 class AddTaskStates(StatesGroup):
@@ -24,16 +26,17 @@ class AddTaskStates(StatesGroup):
 
 
 @tasks_router.message(Command("tasks"))
-async def cmd_tasks(message: Message):
+async def cmd_tasks(message: Message, session: AsyncSession):
     """List user's tasks."""
-    async with async_session_factory() as session:
-        tasks = await TaskService(session).get_user_tasks(message.from_user.id)
-    if not tasks:
+    page = await TaskService(session).get_user_tasks(message.from_user.id)
+    if not page.items:
         return await message.answer(MSG_NO_TASKS)
     text = "*Your Tasks:*\n\n"
-    for i, t in enumerate(tasks, 1):
+    for i, t in enumerate(page.items, 1):
         text += f"{i}. [{'v' if t.status.value == 'completed' else 'o'}] {t.title}\n"
-    await message.answer(text, reply_markup=get_task_list_keyboard(tasks))
+    await message.answer(
+        text, reply_markup=get_task_list_keyboard(page.items, page.next_cursor, page.prev_cursor)
+    )
 
 
 @tasks_router.message(Command("add"))
@@ -67,27 +70,26 @@ async def process_due_date(message: Message, state: FSMContext):
 
 
 @tasks_router.message(AddTaskStates.reminder)
-async def process_reminder(message: Message, state: FSMContext):
+async def process_reminder(message: Message, state: FSMContext, session: AsyncSession):
     data = await state.get_data()
     reminder_at = None
     if message.text.lower() != "skip":
         try:
-            reminder_at = datetime.strptime(message.text, "%Y-%m-%d %H:%M")
+            # Entered in local time; the reminder sweeper compares in TIMEZONE
+            reminder_at = datetime.strptime(message.text, "%Y-%m-%d %H:%M").replace(tzinfo=TIMEZONE)
         except ValueError:
             return await message.answer("Invalid format. Use YYYY-MM-DD HH:MM or 'skip'.")
     await state.clear()
     # Convert due_date string back to datetime
     due_date = datetime.strptime(data["due_date"], "%Y-%m-%d") if data.get("due_date") else None
-    async with async_session_factory() as session:
-        service = TaskService(session)
-        try:
-            task = await service.create_task(
-                user_id=message.from_user.id, title=data["title"],
-                due_date=due_date, reminder_at=reminder_at)
-            await session.commit()
-            if reminder_at:
-                get_scheduler().add_reminder(f"remind_{task.id}", reminder_at, message.from_user.id, task.id)
-            due = task.due_date.strftime("%Y-%m-%d") if task.due_date else "Not set"
-            await message.answer(MSG_TASK_CREATED.format(title=task.title, due_date=due, task_id=task.id))
-        except Exception as e:
-            await message.answer(MSG_ERROR.format(error=str(e)))
+    service = TaskService(session)
+    try:
+        task = await service.create_task(
+            user_id=message.from_user.id, title=data["title"],
+            due_date=due_date, reminder_at=reminder_at)
+        await session.commit()
+        due = task.due_date.strftime("%Y-%m-%d") if task.due_date else "Not set"
+        await message.answer(MSG_TASK_CREATED.format(title=task.title, due_date=due, task_id=task.id))
+    except Exception as e:
+        await session.rollback()
+        await message.answer(MSG_ERROR.format(error=str(e)))
@@ -2,6 +2,7 @@
 """Keyboard exports."""
 from .inline import (
     TaskCallback,
+    TaskListCallback,
     get_main_menu_keyboard,
     get_task_list_keyboard,
     get_task_actions_keyboard,
@@ -12,6 +13,7 @@ from .inline import (
 
 __all__ = [
     "TaskCallback",
+    "TaskListCallback",
     "get_main_menu_keyboard",
     "get_task_list_keyboard",
     "get_task_actions_keyboard",
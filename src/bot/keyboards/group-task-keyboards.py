@@ -4,6 +4,8 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.filters.callback_data import CallbackData
 
+from src.database.repositories.keyset import Cursor, encode_cursor
+
 
 class GroupTaskCallback(CallbackData, prefix="gtask"):
     """Callback data for group task actions."""
@@ -11,6 +13,17 @@ class GroupTaskCallback(CallbackData, prefix="gtask"):
     task_id: int
 
 
+class TaskPageCallback(CallbackData, prefix="gpage"):
+    """Callback data for task list navigation.
+
+    Carries the keyset cursor so each page is one indexed range query.
+    """
+    scope: str  # "all" (group tasks) or "my" (assignee's open tasks)
+    back: bool  # True = newer tasks (Prev), False = older tasks (Next)
+    ts: int  # Boundary row created_at, epoch microseconds
+    tid: int  # Boundary row id
+
+
 def get_skip_button(field: str) -> InlineKeyboardMarkup:
     """Get skip button for optional fields."""
     builder = InlineKeyboardBuilder()
@@ -68,15 +81,29 @@ def get_verify_keyboard(task_id: int) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+def _page_button(text: str, scope: str, back: bool, cursor: Cursor) -> InlineKeyboardButton:
+    ts, tid = encode_cursor(cursor)
+    return InlineKeyboardButton(
+        text=text,
+        callback_data=TaskPageCallback(scope=scope, back=back, ts=ts, tid=tid).pack()
+    )
+
+
 def get_task_list_keyboard(
-    tasks: list, page: int = 0, page_size: int = 5
+    tasks: list,
+    scope: str = "my",
+    next_cursor: Cursor | None = None,
+    prev_cursor: Cursor | None = None,
 ) -> InlineKeyboardMarkup:
-    """Get paginated task list keyboard."""
-    builder = InlineKeyboardBuilder()
+    """Get task list keyboard for one keyset page.
 
-    start = page * page_size
-    end = start + page_size
-    page_tasks = tasks[start:end]
+    Args:
+        tasks: Tasks on this page
+        scope: "all" or "my", echoed back in navigation callbacks
+        next_cursor: Cursor for the Next (older) button, if any
+        prev_cursor: Cursor for the Prev (newer) button, if any
+    """
+    builder = InlineKeyboardBuilder()
 
     status_emoji = {
         "pending": "⏳",
@@ -87,7 +114,7 @@ def get_task_list_keyboard(
         "cancelled": "🚫",
     }
 
-    for task in page_tasks:
+    for task in tasks:
         emoji = status_emoji.get(task.status.value, "❓")
         # Truncate title to fit button
         title = task.title[:28] + "..." if len(task.title) > 28 else task.title
@@ -101,14 +128,10 @@ def get_task_list_keyboard(
 
     # Pagination buttons
     nav_buttons = []
-    if page > 0:
-        nav_buttons.append(
-            InlineKeyboardButton(text="⬅️", callback_data=f"page_{page - 1}")
-        )
-    if end < len(tasks):
-        nav_buttons.append(
-            InlineKeyboardButton(text="➡️", callback_data=f"page_{page + 1}")
-        )
+    if prev_cursor:
+        nav_buttons.append(_page_button("⬅️", scope, True, prev_cursor))
+    if next_cursor:
+        nav_buttons.append(_page_button("➡️", scope, False, next_cursor))
 
     if nav_buttons:
         builder.row(*nav_buttons)
@@ -4,6 +4,8 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.filters.callback_data import CallbackData
 
+from src.database.repositories.keyset import Cursor, encode_cursor
+
 
 class TaskCallback(CallbackData, prefix="task"):
     """Callback data for task actions."""
@@ -11,6 +13,13 @@ class TaskCallback(CallbackData, prefix="task"):
     task_id: int
 
 
+class TaskListCallback(CallbackData, prefix="tpage"):
+    """Callback data for personal task list navigation (keyset cursor)."""
+    back: bool  # True = newer tasks, False = older tasks
+    ts: int  # Boundary row created_at, epoch microseconds
+    tid: int  # Boundary row id
+
+
 def get_main_menu_keyboard() -> InlineKeyboardMarkup:
     """Main menu keyboard."""
     builder = InlineKeyboardBuilder()
@@ -23,14 +32,29 @@ def get_main_menu_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_task_list_keyboard(tasks: list) -> InlineKeyboardMarkup:
-    """Keyboard with task action buttons."""
+def get_task_list_keyboard(
+    tasks: list,
+    next_cursor: Cursor | None = None,
+    prev_cursor: Cursor | None = None
+) -> InlineKeyboardMarkup:
+    """Keyboard with task action buttons and Prev/Next navigation."""
     builder = InlineKeyboardBuilder()
     for task in tasks[:5]:  # Limit to 5
         cb = TaskCallback(action="view", task_id=task.id)
         title = task.title[:20] + "..." if len(task.title) > 20 else task.title
         builder.add(InlineKeyboardButton(text=title, callback_data=cb.pack()))
     builder.adjust(1)
+
+    nav_buttons = []
+    for text, back, cursor in (("<< Prev", True, prev_cursor), ("Next >>", False, next_cursor)):
+        if cursor:
+            ts, tid = encode_cursor(cursor)
+            nav_buttons.append(InlineKeyboardButton(
+                text=text,
+                callback_data=TaskListCallback(back=back, ts=ts, tid=tid).pack()
+            ))
+    if nav_buttons:
+        builder.row(*nav_buttons)
     return builder.as_markup()
 
 
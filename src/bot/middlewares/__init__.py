@@ -11,4 +11,20 @@ RateLimitMiddleware = _rate_limit.RateLimitMiddleware
 _group_rate_limit = importlib.import_module(".group-rate-limit", package=__name__)
 GroupRateLimitMiddleware = _group_rate_limit.GroupRateLimitMiddleware
 
-__all__ = ["AuthMiddleware", "RateLimitMiddleware", "GroupRateLimitMiddleware"]
+_db_session = importlib.import_module(".db-session", package=__name__)
+DbSessionMiddleware = _db_session.DbSessionMiddleware
+
+_outbound = importlib.import_module(".outbound-dispatcher", package=__name__)
+OutboundDispatcher = _outbound.OutboundDispatcher
+SendPriority = _outbound.SendPriority
+send_priority = _outbound.send_priority
+get_outbound_dispatcher = _outbound.get_outbound_dispatcher
+
+_update_dedup = importlib.import_module(".update-dedup", package=__name__)
+UpdateDedupMiddleware = _update_dedup.UpdateDedupMiddleware
+
+__all__ = [
+    "AuthMiddleware", "RateLimitMiddleware", "GroupRateLimitMiddleware",
+    "DbSessionMiddleware", "OutboundDispatcher", "SendPriority", "send_priority",
+    "get_outbound_dispatcher", "UpdateDedupMiddleware",
+]
@@ -4,11 +4,19 @@ from typing import Any, Awaitable, Callable, Dict
 from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery
 
-from src.database import async_session_factory, UserRepository
+from src.services import UserProfileCache
 
 
 class AuthMiddleware(BaseMiddleware):
-    """Middleware to ensure user exists in database."""
+    """Middleware to ensure user exists in database.
+
+    Profiles go through UserProfileCache, so repeat senders with unchanged
+    profiles cost no DB round trip. Uses the per-update session injected by
+    DbSessionMiddleware for first-seen users.
+    """
+
+    def __init__(self, user_cache: UserProfileCache):
+        self.user_cache = user_cache
 
     async def __call__(
         self,
@@ -17,19 +25,6 @@ class AuthMiddleware(BaseMiddleware):
         data: Dict[str, Any]
     ) -> Any:
         user = event.from_user
-        if not user:
-            return await handler(event, data)
-
-        async with async_session_factory() as session:
-            repo = UserRepository(session)
-            db_user, created = await repo.get_or_create(
-                user_id=user.id,
-                username=user.username,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                language_code=user.language_code or "en"
-            )
-            await session.commit()
-            data["db_user"] = db_user
-
+        if user:
+            await self.user_cache.register(data["session"], user)
         return await handler(event, data)
@@ -0,0 +1,35 @@
+# src/bot/middlewares/db-session.py
+"""Database session middleware - one session per update."""
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class DbSessionMiddleware(BaseMiddleware):
+    """Open a single session per update and share it via handler data.
+
+    Must be registered before AuthMiddleware so both the auth step and the
+    handler use the same connection. The session is committed once after the
+    handler returns and rolled back if it raises.
+    """
+
+    def __init__(self, session_pool: async_sessionmaker[AsyncSession]):
+        self.session_pool = session_pool
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        async with self.session_pool() as session:
+            data["session"] = session
+            try:
+                result = await handler(event, data)
+                await session.commit()
+                return result
+            except Exception:
+                await session.rollback()
+                raise
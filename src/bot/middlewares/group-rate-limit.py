@@ -4,7 +4,6 @@ from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import BaseMiddleware
 from aiogram.types import Message
-from cachetools import TTLCache
 
 from src.core.config import settings
 
@@ -12,8 +11,8 @@ from src.core.config import settings
 class GroupRateLimitMiddleware(BaseMiddleware):
     """Rate limit requests per group (not per user)."""
 
-    def __init__(self, max_per_minute: int = 30):
-        self.cache: TTLCache = TTLCache(maxsize=1000, ttl=60)
+    def __init__(self, limiter, max_per_minute: int = 30):
+        self.limiter = limiter
         self.max_per_minute = max_per_minute
         self.admin_ids = set(settings.ADMIN_IDS)
 
@@ -38,15 +37,15 @@ class GroupRateLimitMiddleware(BaseMiddleware):
 
         # Group rate limiting
         group_id = event.chat.id
-        key = f"grp_{group_id}"
-        count = self.cache.get(key, 0)
-
-        if count >= self.max_per_minute:
-            await event.reply(
-                "Nhom dang qua tai. Thu lai sau 1 phut.",
-                parse_mode=None
-            )
+        key = f"grp:{group_id}"
+
+        if await self.limiter.hit(key, self.max_per_minute, 60):
+            # Rate-limit the warning itself so a flood stays inbound-only
+            if not await self.limiter.hit(f"{key}:notice", 1, 60):
+                await event.reply(
+                    "Nhom dang qua tai. Thu lai sau 1 phut.",
+                    parse_mode=None
+                )
             return  # Block handler
 
-        self.cache[key] = count + 1
         return await handler(event, data)
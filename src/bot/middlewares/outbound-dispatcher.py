@@ -0,0 +1,245 @@
+# src/bot/middlewares/outbound-dispatcher.py
+"""Paced, prioritized delivery of outgoing Telegram messages."""
+import asyncio
+import importlib
+import itertools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware, NextRequestMiddlewareType
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendChatAction, TelegramMethod
+from cachetools import TTLCache
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import settings
+
+_rate_limiter = importlib.import_module("src.services.rate-limiter")
+
+# Methods that post or change a chat message count against Telegram's limits
+_PACED_PREFIXES = ("Send", "Edit", "Copy", "Forward")
+
+
+class SendPriority(IntEnum):
+    """Outbound lanes, lowest value is sent first."""
+    INTERACTIVE = 0  # Replies to the user who just acted
+    NOTICE = 1       # Submit/verify notices to groups
+    REMINDER = 2     # Scheduled reminders and overdue alerts
+
+
+_priority: ContextVar[SendPriority] = ContextVar(
+    "outbound_priority", default=SendPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def send_priority(priority: SendPriority):
+    """Send everything inside the block on the given lane."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def _is_paced(method: TelegramMethod) -> bool:
+    if isinstance(method, SendChatAction):
+        return False
+    return type(method).__name__.startswith(_PACED_PREFIXES)
+
+
+def _create_limiter():
+    """Limiter for OUTBOUND_LIMITER_BACKEND ("memory" or "redis")."""
+    if settings.OUTBOUND_LIMITER_BACKEND == "redis":
+        # Short timeouts: a stalled Redis must not hold every send
+        redis = Redis.from_url(settings.REDIS_URL, socket_timeout=2, socket_connect_timeout=2)
+        return _rate_limiter.RedisRateLimiter(redis, prefix="outbound")
+    return _rate_limiter.MemoryRateLimiter(maxsize=50_000, ttl=120)
+
+
+class _Outgoing:
+    __slots__ = ("make_request", "bot", "method", "chat_id", "future", "retries")
+
+    def __init__(self, make_request, bot: Bot, method: TelegramMethod, future):
+        self.make_request = make_request
+        self.bot = bot
+        self.method = method
+        self.chat_id = getattr(method, "chat_id", None)
+        self.future = future
+        self.retries = 0
+
+
+class OutboundDispatcher(BaseRequestMiddleware):
+    """Session middleware that queues message sends behind rate limits.
+
+    Sends go into one priority queue (interactive > notices > reminders)
+    drained by a fixed number of workers. Each send takes a slot from the
+    global window (~30/s) and its chat's window (20/min for groups,
+    1/s for private chats); a send whose chat is saturated is parked
+    until its slot frees instead of holding a worker. TelegramRetryAfter
+    blocks the chat for the requested time and requeues the send. The
+    caller just awaits its result as before.
+
+    With OUTBOUND_LIMITER_BACKEND=redis the windows are shared by every
+    process sending as this bot, so the limits hold for the bot as a whole.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.OUTBOUND_WORKERS,
+        max_retries: int = 3,
+    ):
+        self.worker_count = workers
+        self.max_retries = max_retries
+        self.limiter = _create_limiter()
+        self._blocked: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+        self._seq = itertools.count()
+        self._depth: Counter = Counter()
+        self._delayed = 0
+        self._in_flight = 0
+        self._pending: set[_Outgoing] = set()
+        self._queue: asyncio.PriorityQueue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task] = []
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Any:
+        if not _is_paced(method):
+            return await make_request(bot, method)
+        self._ensure_started()
+        item = _Outgoing(make_request, bot, method, self._loop.create_future())
+        self._pending.add(item)
+        item.future.add_done_callback(lambda _: self._pending.discard(item))
+        self._put(_priority.get(), next(self._seq), item)
+        return await item.future
+
+    def stats(self) -> dict[str, int]:
+        """Queue depth per lane plus parked and in-flight sends."""
+        stats = {f"queued_{lane.name.lower()}": self._depth[lane] for lane in SendPriority}
+        stats["delayed"] = self._delayed
+        stats["in_flight"] = self._in_flight
+        return stats
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [
+            loop.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+
+    def _put(self, priority: SendPriority, seq: int, item: _Outgoing) -> None:
+        self._depth[priority] += 1
+        self._queue.put_nowait((priority, seq, item))
+
+    def _defer(self, delay: float, priority: SendPriority, seq: int, item: _Outgoing) -> None:
+        self._delayed += 1
+
+        def requeue():
+            self._delayed -= 1
+            self._put(priority, seq, item)
+
+        self._loop.call_later(delay, requeue)
+
+    async def _chat_wait(self, chat_id) -> float:
+        """Seconds until chat may receive another message (0 = take slot now)."""
+        blocked = self._blocked.get(chat_id, 0) - time.monotonic()
+        if blocked > 0:
+            return blocked
+        if isinstance(chat_id, int) and chat_id > 0:
+            limit, period = settings.OUTBOUND_PRIVATE_PER_SECOND, 1
+        else:
+            limit, period = settings.OUTBOUND_GROUP_PER_MINUTE, 60
+        return await self.limiter.hit(f"chat:{chat_id}", limit, period)
+
+    async def _global_slot(self) -> None:
+        while True:
+            wait = await self.limiter.hit(
+                "global", settings.OUTBOUND_GLOBAL_PER_SECOND, 1
+            )
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    async def _worker(self) -> None:
+        while True:
+            priority, seq, item = await self._queue.get()
+            self._depth[priority] -= 1
+            if item.future.done():
+                continue  # Caller was cancelled
+
+            if item.chat_id is not None:
+                wait = await self._chat_wait(item.chat_id)
+                if wait:
+                    self._defer(wait, priority, seq, item)
+                    continue
+            await self._global_slot()
+
+            self._in_flight += 1
+            try:
+                result = await item.make_request(item.bot, item.method)
+            except TelegramRetryAfter as e:
+                if item.retries >= self.max_retries:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                    continue
+                item.retries += 1
+                logger.warning(
+                    f"Flood control for chat {item.chat_id}, retrying in {e.retry_after}s"
+                )
+                self._blocked[item.chat_id] = time.monotonic() + e.retry_after
+                self._defer(e.retry_after, priority, seq, item)
+            except Exception as e:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            else:
+                if not item.future.done():
+                    item.future.set_result(result)
+            finally:
+                self._in_flight -= 1
+
+    async def close(self, timeout: float = 10) -> None:
+        """Let queued sends drain (up to timeout), then stop the workers."""
+        if not self._workers:
+            return
+        deadline = time.monotonic() + timeout
+        while (
+            sum(self._depth.values()) or self._delayed or self._in_flight
+        ) and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._loop = None
+        self._depth.clear()
+        self._delayed = 0
+        if self._pending:
+            logger.warning(f"Dropped {len(self._pending)} queued outbound messages on shutdown")
+            for item in list(self._pending):
+                item.future.cancel()
+
+
+_instance: OutboundDispatcher | None = None
+
+
+def get_outbound_dispatcher() -> OutboundDispatcher:
+    """Get process-wide outbound dispatcher."""
+    global _instance
+    if _instance is None:
+        _instance = OutboundDispatcher()
+    return _instance
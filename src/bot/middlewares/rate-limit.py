@@ -1,9 +1,8 @@
 # src/bot/middlewares/rate-limit.py
-"""Rate limiting middleware using cachetools."""
+"""Per-user rate limiting middleware."""
 from typing import Any, Awaitable, Callable, Dict
 from aiogram import BaseMiddleware
 from aiogram.types import Message
-from cachetools import TTLCache
 
 from src.core.config import settings
 from src.core.constants import MSG_RATE_LIMITED
@@ -12,9 +11,10 @@ from src.core.constants import MSG_RATE_LIMITED
 class RateLimitMiddleware(BaseMiddleware):
     """Middleware to limit request rate per user."""
 
-    def __init__(self):
-        self.cache = TTLCache(maxsize=10_000, ttl=settings.RATE_LIMIT_PERIOD)
+    def __init__(self, limiter):
+        self.limiter = limiter
         self.limit = settings.RATE_LIMIT_REQUESTS
+        self.period = settings.RATE_LIMIT_PERIOD
         self.admin_ids = set(settings.ADMIN_IDS)
 
     async def __call__(
@@ -27,8 +27,10 @@ class RateLimitMiddleware(BaseMiddleware):
         # Bypass rate limit for admins
         if user_id in self.admin_ids:
             return await handler(event, data)
-        current = self.cache.get(user_id, 0)
-        if current >= self.limit:
-            return await event.answer(MSG_RATE_LIMITED)
-        self.cache[user_id] = current + 1
+        key = f"user:{user_id}"
+        if await self.limiter.hit(key, self.limit, self.period):
+            # One "slow down" reply per window, not one per blocked message
+            if not await self.limiter.hit(f"{key}:notice", 1, self.period):
+                await event.answer(MSG_RATE_LIMITED)
+            return
         return await handler(event, data)
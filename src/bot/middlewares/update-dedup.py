@@ -0,0 +1,92 @@
+# src/bot/middlewares/update-dedup.py
+"""Skip updates Telegram delivers more than once."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import Update
+from loguru import logger
+
+
+def dedup_key(update: Update) -> str:
+    """Seen-set key: the message or callback itself rather than the update."""
+    if update.message:
+        message = update.message
+        return f"message:{message.chat.id}:{message.message_id}"
+    if update.edited_message:
+        message = update.edited_message
+        return f"edit:{message.chat.id}:{message.message_id}:{message.edit_date.timestamp():.0f}"
+    if update.callback_query:
+        return f"callback:{update.callback_query.id}"
+    return f"update:{update.update_id}"
+
+
+class UpdateDedupMiddleware(BaseMiddleware):
+    """Drop redelivered updates before any handler or DB work runs.
+
+    Telegram redelivers after a crash (unconfirmed getUpdates offset) or
+    a failed webhook response. An update is skipped if its seen-set key is
+    taken: by a copy still being handled, or by one handled within
+    UPDATE_DEDUP_TTL_SECONDS (Telegram keeps updates for 24 hours). Order
+    doesn't matter, so webhook updates that arrive out of order are all
+    handled. A handler that raises releases its key, so the redelivery
+    gets another try.
+
+    With finished_below (polling only, where updates arrive in update_id
+    order) the store also keeps a floor: the highest update_id at or below
+    which every update finished. Updates at or below the floor read at
+    startup are skipped as well, as a restart backstop to the seen-set.
+
+    Registered as an outer middleware on dp.update.
+    """
+
+    def __init__(self, dedup, finished_below: Callable[[], int | None] | None = None):
+        self.dedup = dedup
+        self.finished_below = finished_below
+        self._restart_floor: int | None = None
+        self._floor_loaded = False
+        self._floor_lock = asyncio.Lock()
+        self._advanced: int | None = None
+
+    async def _startup_floor(self) -> int | None:
+        if not self._floor_loaded:
+            async with self._floor_lock:
+                if not self._floor_loaded:
+                    self._restart_floor = await self.dedup.floor()
+                    self._floor_loaded = True
+        return self._restart_floor
+
+    async def _advance_floor(self) -> None:
+        floor = self.finished_below()
+        if floor is not None and (self._advanced is None or floor > self._advanced):
+            self._advanced = floor
+            await self.dedup.advance_floor(floor)
+
+    async def __call__(
+        self,
+        handler: Callable[[Update, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any]
+    ) -> Any:
+        if self.finished_below is not None:
+            floor = await self._startup_floor()
+            if floor is not None and event.update_id <= floor:
+                logger.info(f"Skipping update {event.update_id} handled before restart")
+                return None
+
+        key = dedup_key(event)
+        if not await self.dedup.claim(key):
+            logger.info(f"Skipping duplicate update {event.update_id} ({key})")
+            return None
+
+        try:
+            result = await handler(event, data)
+        except Exception:
+            await self.dedup.release(key)
+            raise
+        else:
+            await self.dedup.commit(key)
+        finally:
+            if self.finished_below is not None:
+                await self._advance_floor()
+        return result
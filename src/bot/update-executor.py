@@ -0,0 +1,200 @@
+# src/bot/update-executor.py
+"""Per-chat ordered, cross-chat parallel update handling."""
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.methods import TelegramMethod
+from aiogram.types import Update
+from loguru import logger
+
+from src.core.config import settings
+
+
+def chat_key(update: Update) -> Hashable:
+    """Ordering key: the update's chat, else its user, else the update itself."""
+    context = UserContextMiddleware.resolve_event_context(update)
+    if context.chat_id is not None:
+        return context.chat_id
+    if context.user_id is not None:
+        return ("user", context.user_id)
+    return ("update", update.update_id)
+
+
+class ChatOrderedExecutor:
+    """Runs jobs one at a time per key and in parallel across keys.
+
+    Each key (chat) has its own FIFO; a chat with work waits in a shared
+    ready queue for one of `workers` workers, which runs one job and puts
+    the chat back at the end of the line if it has more. A busy chat
+    therefore gets at most one worker and takes turns with quiet ones.
+    At most `max_pending` jobs are queued or running; submit() waits for
+    room beyond that, which stalls intake rather than memory.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.UPDATE_WORKERS,
+        max_pending: int = settings.UPDATE_QUEUE_LIMIT,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._queues: dict[Hashable, deque[tuple[float, Callable[[], Awaitable]]]] = {}
+        self._ready: asyncio.Queue | None = None
+        self._capacity: asyncio.Semaphore | None = None
+        self._idle: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending = 0
+        self._running = 0
+        self._processed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._ready = asyncio.Queue()
+        self._capacity = asyncio.Semaphore(self.max_pending)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def submit(self, key: Hashable, job: Callable[[], Awaitable]) -> None:
+        """Queue job behind the key's earlier jobs; waits while the executor is full."""
+        self._ensure_started()
+        await self._capacity.acquire()
+        self._pending += 1
+        self._idle.clear()
+        queue = self._queues.get(key)
+        if queue is None:
+            # Chat had no queued or running job: it's ready right away
+            queue = self._queues[key] = deque()
+            self._ready.put_nowait(key)
+        queue.append((self._loop.time(), job))
+
+    async def _worker(self) -> None:
+        while True:
+            key = await self._ready.get()
+            queue = self._queues[key]
+            queued_at, job = queue.popleft()
+            wait = self._loop.time() - queued_at
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._running += 1
+            try:
+                await job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Update job for chat {key} failed: {e}")
+            finally:
+                self._running -= 1
+                self._pending -= 1
+                self._processed += 1
+                self._capacity.release()
+                if queue:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._queues[key]
+                if not self._pending:
+                    self._idle.set()
+
+    def stats(self, top: int = 5) -> dict[str, Any]:
+        """Totals, wait times and the `top` deepest chat queues."""
+        now = self._loop.time() if self._loop else 0.0
+        busiest = sorted(self._queues.items(), key=lambda item: len(item[1]), reverse=True)
+        return {
+            "pending": self._pending,
+            "running": self._running,
+            "chats": len(self._queues),
+            "processed": self._processed,
+            "wait_avg_ms": round(self._wait_total / self._processed * 1000, 1)
+            if self._processed else 0.0,
+            "wait_max_ms": round(self._wait_max * 1000, 1),
+            "busiest": [
+                {
+                    "chat": str(key),
+                    "depth": len(queue),
+                    "oldest_wait_ms": round((now - queue[0][0]) * 1000, 1) if queue else 0.0,
+                }
+                for key, queue in busiest[:top]
+            ],
+        }
+
+    async def close(self, timeout: float = 10) -> None:
+        """Let queued jobs finish (up to timeout), then stop the workers."""
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except TimeoutError:
+            logger.warning(f"Dropping {self._pending} queued updates on shutdown")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+
+
+_instance: ChatOrderedExecutor | None = None
+
+
+def get_update_executor() -> ChatOrderedExecutor:
+    """Get process-wide update executor."""
+    global _instance
+    if _instance is None:
+        _instance = ChatOrderedExecutor()
+    return _instance
+
+
+class ChatOrderedDispatcher(Dispatcher):
+    """Dispatcher whose feed_update queues the update on the executor.
+
+    Polling and the webhook both feed updates through feed_update, which
+    returns as soon as the update is queued (or once there is room), so
+    the whole middleware chain - FSM state included - runs in chat order.
+    Answers returned by handlers are sent directly, not as a webhook reply.
+    """
+
+    def __init__(self, executor: ChatOrderedExecutor, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.executor = executor
+        # Fed update ids; the head is the oldest one not finished yet
+        self._fed: deque[int] = deque()
+        self._finished: set[int] = set()
+        self._finished_below: int | None = None
+
+    def finished_below(self) -> int | None:
+        """Highest update_id such that it and every update fed before it finished.
+
+        Matches "every update up to this id is done" only when updates are
+        fed in update_id order, as polling does.
+        """
+        return self._finished_below
+
+    def _finish(self, update_id: int) -> None:
+        self._finished.add(update_id)
+        while self._fed and self._fed[0] in self._finished:
+            self._finished_below = self._fed.popleft()
+            self._finished.discard(self._finished_below)
+
+    async def feed_update(self, bot: Bot, update: Update, **kwargs: Any) -> Any:
+        async def handle() -> None:
+            try:
+                result = await super(ChatOrderedDispatcher, self).feed_update(
+                    bot, update, **kwargs
+                )
+                if isinstance(result, TelegramMethod):
+                    await self.silent_call_request(bot=bot, result=result)
+            finally:
+                self._finish(update.update_id)
+
+        self._fed.append(update.update_id)
+        await self.executor.submit(chat_key(update), handle)
+        return None
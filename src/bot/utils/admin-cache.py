@@ -0,0 +1,75 @@
+# src/bot/utils/admin-cache.py
+"""Per-group admin roster cache backed by getChatAdministrators."""
+import asyncio
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from cachetools import TTLCache
+from loguru import logger
+
+from src.core.config import settings
+
+ADMIN_STATUSES = ("creator", "administrator")
+
+
+class ChatAdminCache:
+    """Caches admin user IDs per chat.
+
+    Filled with one getChatAdministrators call per chat per TTL and
+    invalidated early by chat_member/my_chat_member updates.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.ADMIN_CACHE_TTL,
+        maxsize: int = 5_000,
+    ):
+        self.cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    async def get_admins(self, bot: Bot, chat_id: int) -> frozenset[int]:
+        """Get admin user IDs for chat, fetching on cache miss."""
+        admins = self.cache.get(chat_id)
+        if admins is not None:
+            return admins
+
+        # One fetch per chat even when several admin actions arrive at once
+        lock = self._locks.setdefault(chat_id, asyncio.Lock())
+        async with lock:
+            admins = self.cache.get(chat_id)
+            if admins is None:
+                members = await bot.get_chat_administrators(chat_id)
+                admins = frozenset(
+                    m.user.id for m in members if m.status in ADMIN_STATUSES
+                )
+                self.cache[chat_id] = admins
+        self._locks.pop(chat_id, None)
+        return admins
+
+    async def is_admin(self, bot: Bot, chat_id: int, user_id: int) -> bool:
+        """Check admin status. Returns False if roster can't be fetched."""
+        try:
+            return user_id in await self.get_admins(bot, chat_id)
+        except TelegramAPIError as e:
+            logger.warning(f"Failed to fetch admins for chat {chat_id}: {e}")
+            return False
+
+    def invalidate(self, chat_id: int) -> None:
+        """Drop cached roster for chat."""
+        self.cache.pop(chat_id, None)
+
+
+_instance: ChatAdminCache | None = None
+
+
+def get_admin_cache() -> ChatAdminCache:
+    """Get process-wide admin roster cache."""
+    global _instance
+    if _instance is None:
+        _instance = ChatAdminCache()
+    return _instance
+
+
+async def is_chat_admin(bot: Bot, chat_id: int, user_id: int) -> bool:
+    """Check if user is creator/administrator of chat (cached)."""
+    return await get_admin_cache().is_admin(bot, chat_id, user_id)
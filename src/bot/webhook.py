@@ -0,0 +1,130 @@
+# src/bot/webhook.py
+"""Webhook ingestion: aiohttp server feeding updates to the dispatcher."""
+import asyncio
+import hashlib
+import importlib
+import signal
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from loguru import logger
+
+from src.core.config import settings
+
+get_update_executor = importlib.import_module("src.bot.update-executor").get_update_executor
+
+
+def webhook_secret() -> str:
+    """Secret Telegram echoes in X-Telegram-Bot-Api-Secret-Token.
+
+    Derived from the bot token when WEBHOOK_SECRET is unset, so every
+    replica agrees on it without extra configuration.
+    """
+    if settings.WEBHOOK_SECRET:
+        return settings.WEBHOOK_SECRET
+    return hashlib.sha256(settings.BOT_TOKEN.encode()).hexdigest()
+
+
+class WebhookHandler(SimpleRequestHandler):
+    """Checks the secret token and feeds updates to the dispatcher.
+
+    The dispatcher only queues the update on the update executor, so the
+    request is acknowledged right away; when the executor is full it
+    waits for room, which holds back Telegram (it keeps at most
+    WEBHOOK_MAX_CONNECTIONS requests open) instead of piling up work.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, **data: Any):
+        super().__init__(dispatcher, bot, handle_in_background=False,
+                         secret_token=webhook_secret(), **data)
+        self.received = 0
+        self.rejected = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        response = await super().handle(request)
+        if response.status == 401:
+            self.rejected += 1
+            logger.warning(f"Rejected webhook request from {request.remote}: bad secret token")
+        else:
+            self.received += 1
+        return response
+
+    def stats(self) -> dict[str, int]:
+        """Updates received and requests rejected."""
+        return {"received": self.received, "rejected": self.rejected}
+
+    async def close(self) -> None:
+        """Nothing to release; main() closes the bot session."""
+
+
+# Where create_webhook_app keeps the handler, for its stats
+WEBHOOK_HANDLER = web.AppKey("webhook_handler", WebhookHandler)
+
+
+def create_webhook_app(bot: Bot, dp: Dispatcher) -> web.Application:
+    """aiohttp app with the webhook route and a health route.
+
+    Startup/shutdown hooks of the dispatcher run with the app. Usable with
+    aiohttp's TestClient to post recorded updates locally.
+    """
+    from src.bot.middlewares import get_outbound_dispatcher
+
+    app = web.Application()
+    handler = WebhookHandler(dp, bot)
+    handler.register(app, path=settings.WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+
+    async def health(request: web.Request) -> web.Response:
+        return web.json_response({
+            "status": "ok",
+            "mode": "webhook",
+            "webhook": handler.stats(),
+            "updates": get_update_executor().stats(),
+            "outbound": get_outbound_dispatcher().stats(),
+        })
+
+    app.router.add_get(settings.WEBHOOK_HEALTH_PATH, health)
+    app[WEBHOOK_HANDLER] = handler
+    return app
+
+
+async def run_webhook(bot: Bot, dp: Dispatcher) -> None:
+    """Serve the webhook app until cancelled or sent SIGINT/SIGTERM.
+
+    Registers the webhook with Telegram when WEBHOOK_URL is set; leave it
+    unset on replicas behind a load balancer where another process (or a
+    deploy step) owns the registration.
+    """
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: KeyboardInterrupt still works
+            pass
+
+    app = create_webhook_app(bot, dp)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, settings.WEBHOOK_HOST, settings.WEBHOOK_PORT)
+    await site.start()
+    logger.info(
+        f"Webhook server listening on {settings.WEBHOOK_HOST}:{settings.WEBHOOK_PORT}"
+        f"{settings.WEBHOOK_PATH}"
+    )
+
+    try:
+        if settings.WEBHOOK_URL:
+            await bot.set_webhook(
+                url=settings.WEBHOOK_URL.rstrip("/") + settings.WEBHOOK_PATH,
+                secret_token=webhook_secret(),
+                allowed_updates=dp.resolve_used_update_types(),
+                max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+            )
+            logger.info(f"Webhook registered at {settings.WEBHOOK_URL}")
+        await stop.wait()
+        logger.info("Webhook server stopping...")
+    finally:
+        await runner.cleanup()
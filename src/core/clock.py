@@ -0,0 +1,42 @@
+# src/core/clock.py
+"""Current time, with a seam for simulations."""
+from datetime import datetime, timedelta, tzinfo
+from typing import Callable
+from zoneinfo import ZoneInfo
+
+from src.core.config import settings
+
+TIMEZONE = ZoneInfo(settings.TIMEZONE)
+
+# Replacement time source; None means the system clock
+_source: Callable[[], datetime] | None = None
+
+
+def now(tz: tzinfo = TIMEZONE) -> datetime:
+    """Current time in tz (TIMEZONE by default)."""
+    if _source is None:
+        return datetime.now(tz)
+    return _source().astimezone(tz)
+
+
+def set_clock(source: Callable[[], datetime] | None) -> None:
+    """Replace the time source (None restores the system clock)."""
+    global _source
+    _source = source
+
+
+class VirtualClock:
+    """Clock that only moves when told to; pass it to set_clock."""
+
+    def __init__(self, start: datetime):
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=TIMEZONE)
+        self.current = start
+
+    def __call__(self) -> datetime:
+        return self.current
+
+    def advance(self, delta: timedelta) -> datetime:
+        """Move forward by delta and return the new time."""
+        self.current += delta
+        return self.current
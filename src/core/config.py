@@ -1,5 +1,7 @@
 # src/core/config.py
 """Application configuration via pydantic-settings."""
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
@@ -17,11 +19,61 @@ class Settings(BaseSettings):
     BOT_TOKEN: str = Field(..., description="Telegram Bot API token")
     ADMIN_IDS: list[int] = Field(default_factory=list, description="Admin user IDs")
 
+    # Update ingestion
+    BOT_MODE: Literal["polling", "webhook"] = Field(
+        default="polling",
+        description="Receive updates by long polling or through the webhook server"
+    )
+    WEBHOOK_URL: str | None = Field(
+        default=None,
+        description="Public base URL to register with Telegram (unset = don't register)"
+    )
+    WEBHOOK_PATH: str = Field(default="/webhook", description="Route Telegram posts updates to")
+    WEBHOOK_SECRET: str | None = Field(
+        default=None,
+        description="Secret token Telegram sends back (unset = derived from BOT_TOKEN)"
+    )
+    WEBHOOK_HOST: str = Field(default="0.0.0.0", description="Webhook server bind address")
+    WEBHOOK_PORT: int = Field(default=8080, description="Webhook server port")
+    WEBHOOK_HEALTH_PATH: str = Field(default="/health", description="Health check route")
+    WEBHOOK_MAX_CONNECTIONS: int = Field(
+        default=40,
+        description="Concurrent connections Telegram may open to the webhook (1-100)"
+    )
+    SUPERVISOR_WORKERS: int = Field(
+        default=0,
+        description="Bot worker processes started by src.supervisor (0 = CPU count)"
+    )
+    SUPERVISOR_BASE_PORT: int = Field(
+        default=8100,
+        description="Worker i listens on 127.0.0.1 at this port + i"
+    )
+    SUPERVISOR_STOP_TIMEOUT: float = Field(
+        default=30,
+        description="Seconds a worker gets to finish its updates before it is killed"
+    )
+    UPDATE_WORKERS: int = Field(
+        default=32,
+        description="Updates handled at once; one chat's updates always run in order"
+    )
+    UPDATE_QUEUE_LIMIT: int = Field(
+        default=1000,
+        description="Queued updates before intake waits (polling pauses, webhook requests block)"
+    )
+
     # Database
     DATABASE_URL: str = Field(
         default="sqlite+aiosqlite:///./dev.db",
         description="Async database URL"
     )
+    DATABASE_POOL_SIZE: int = Field(
+        default=5,
+        description="Pooled connections per process (not used for SQLite)"
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=10,
+        description="Extra connections per process beyond the pool under load"
+    )
 
     # Redis
     REDIS_URL: str = Field(
@@ -30,6 +82,10 @@ class Settings(BaseSettings):
     )
 
     # Scheduler
+    SCHEDULER_ENABLED: bool = Field(
+        default=True,
+        description="Run the scheduler (jobs, timer engine, outbox relay) in this process"
+    )
     SCHEDULER_JOBSTORE_URL: str | None = Field(
         default=None,
         description="Job store DB URL (defaults to DATABASE_URL)"
@@ -42,6 +98,38 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = Field(default=5, description="Max requests per period")
     RATE_LIMIT_PERIOD: int = Field(default=60, description="Rate limit period in seconds")
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = Field(
+        default="memory",
+        description="Limiter backend: per-process memory or shared Redis"
+    )
+
+    # Redelivered update detection (UpdateDedupMiddleware)
+    UPDATE_DEDUP_BACKEND: Literal["memory", "redis"] = Field(
+        default="redis",
+        description="Seen-update store: per-process memory or Redis (shared, survives restarts)"
+    )
+    UPDATE_DEDUP_TTL_SECONDS: int = Field(
+        default=86400,
+        description="How long a handled update stays in the seen-set (Telegram keeps updates 24h)"
+    )
+    UPDATE_DEDUP_CLAIM_SECONDS: int = Field(
+        default=600,
+        description="How long an update being handled stays claimed if its process dies"
+    )
+
+    # User profile cache (AuthMiddleware)
+    USER_CACHE_MAXSIZE: int = Field(default=10_000, description="Max cached user profiles")
+    USER_CACHE_TTL: int = Field(default=3600, description="User profile cache TTL in seconds")
+    USER_FLUSH_INTERVAL: float = Field(
+        default=5.0,
+        description="Seconds between write-behind user profile flushes"
+    )
+
+    # Chat admin roster cache
+    ADMIN_CACHE_TTL: int = Field(
+        default=600,
+        description="Seconds to cache getChatAdministrators per group"
+    )
 
     # Working Hours (VN timezone with lunch break)
     TIMEZONE: str = Field(default="Asia/Ho_Chi_Minh", description="Timezone for working hours")
@@ -58,11 +146,143 @@ class Settings(BaseSettings):
         description="Minimum reminder interval in minutes"
     )
 
+    # Group reminder/deadline timers
+    TIMER_ENGINE_ENABLED: bool = Field(
+        default=True,
+        description="Fire reminders/deadlines from an in-process timer heap instead of polling sweeps"
+    )
+    TIMER_ENGINE_RESYNC_SECONDS: int = Field(
+        default=3600,
+        description="Seconds between full timer reloads (a safety net for lost change notices)"
+    )
+    TIMER_ENGINE_CHANNEL: str = Field(
+        default="scheduler:timers",
+        description="Redis channel other processes publish changed task ids on (empty: single process)"
+    )
+
+    # Outbound message pacing (Telegram: ~30 msg/s, 20 msg/min per group)
+    OUTBOUND_ENABLED: bool = Field(
+        default=True,
+        description="Queue outgoing messages through the paced dispatcher"
+    )
+    OUTBOUND_WORKERS: int = Field(
+        default=8,
+        description="Concurrent outgoing requests"
+    )
+    OUTBOUND_GLOBAL_PER_SECOND: int = Field(
+        default=30,
+        description="Messages per second across all chats"
+    )
+    OUTBOUND_GROUP_PER_MINUTE: int = Field(
+        default=20,
+        description="Messages per minute to one group"
+    )
+    OUTBOUND_PRIVATE_PER_SECOND: int = Field(
+        default=1,
+        description="Messages per second to one private chat"
+    )
+    OUTBOUND_LIMITER_BACKEND: Literal["memory", "redis"] = Field(
+        default="memory",
+        description="Send windows: per-process memory or Redis (shared by all processes)"
+    )
+
+    # Group reminder digests
+    REMINDER_DIGEST_DEFAULT: bool = Field(
+        default=False,
+        description="Digest mode for groups that haven't set it with /digest"
+    )
+    REMINDER_DIGEST_WINDOW_MINUTES: int = Field(
+        default=10,
+        description="Digest groups also get reminders due within this many minutes"
+    )
+
+    # Pinned group dashboards (/dashboard on|off)
+    DASHBOARD_DEBOUNCE_SECONDS: float = Field(
+        default=5,
+        description="Task changes within this window are folded into one dashboard edit"
+    )
+    DASHBOARD_TASKS_PER_STATUS: int = Field(
+        default=10,
+        description="Tasks listed per status on a dashboard (the rest are counted)"
+    )
+
+    # Notification outbox (written with the task update, sent by the relay)
+    OUTBOX_BATCH_SIZE: int = Field(
+        default=100,
+        description="Outbox messages claimed per relay batch"
+    )
+    OUTBOX_POLL_SECONDS: float = Field(
+        default=1.0,
+        description="Relay poll interval when the outbox is empty"
+    )
+    OUTBOX_MAX_ATTEMPTS: int = Field(
+        default=8,
+        description="Send attempts before an outbox message is marked failed"
+    )
+    OUTBOX_RETRY_BASE_SECONDS: float = Field(
+        default=5,
+        description="First retry delay; doubles on every further failure"
+    )
+    OUTBOX_RETRY_MAX_SECONDS: float = Field(
+        default=900,
+        description="Upper bound of the retry delay"
+    )
+    OUTBOX_LEASE_SECONDS: float = Field(
+        default=120,
+        description="How long a claimed batch stays hidden from other relays"
+    )
+    OUTBOX_PER_CHAT: int = Field(
+        default=5,
+        description="Messages per chat sent from one batch; the rest are put back for later"
+    )
+    OUTBOX_RETENTION_DAYS: int = Field(
+        default=7,
+        description="Days to keep sent/failed outbox rows (purged by the daily cleanup)"
+    )
+
+    # Scheduler leader election (multi-replica deployments)
+    LEADER_ELECTION_ENABLED: bool = Field(
+        default=False,
+        description="Run scheduler jobs only in the process holding the Redis lease"
+    )
+    LEADER_KEY: str = Field(
+        default="scheduler:leader",
+        description="Redis key of the scheduler leader lease"
+    )
+    LEADER_LEASE_SECONDS: float = Field(
+        default=15,
+        description="Leader lease length; a follower takes over within about this long"
+    )
+
+    # Overdue sweep
+    OVERDUE_BATCH_SIZE: int = Field(
+        default=500,
+        description="Tasks flipped to OVERDUE per UPDATE ... RETURNING batch"
+    )
+
+    # Personal reminder sweep
+    PERSONAL_REMINDER_BATCH_SIZE: int = Field(
+        default=500,
+        description="Due personal reminders claimed per UPDATE ... RETURNING batch"
+    )
+
     # Task cleanup
     COMPLETED_TASK_RETENTION_DAYS: int = Field(
         default=30,
         description="Days to keep completed tasks before cleanup"
     )
+    CLEANUP_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Tasks deleted per cleanup transaction"
+    )
+    CLEANUP_BATCH_PAUSE_SECONDS: float = Field(
+        default=0.5,
+        description="Pause between cleanup batches"
+    )
+    CLEANUP_ARCHIVE_DIR: str | None = Field(
+        default=None,
+        description="Directory for gzip JSONL archives of deleted tasks (unset = no archive)"
+    )
 
     @property
     def jobstore_url(self) -> str:
@@ -8,6 +8,7 @@ BOT_VERSION = "1.0.0"
 # Pagination
 DEFAULT_PAGE_SIZE = 10
 MAX_PAGE_SIZE = 50
+TASK_LIST_PAGE_SIZE = 5  # Tasks per inline-keyboard page
 
 # Timeouts (seconds)
 FSM_TIMEOUT = 300  # 5 minutes
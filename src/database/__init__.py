@@ -1,11 +1,16 @@
 # src/database/__init__.py
 """Database module exports."""
 from .engine import Base, engine, async_session_factory, get_session, init_db, close_db
-from .models import User, Task, TaskStatus, TaskPriority
-from .repositories import UserRepository, TaskRepository
+from .models import (
+    User, Task, TaskStatus, TaskPriority, OutboxMessage, OutboxStatus, GroupSettings
+)
+from .repositories import (
+    UserRepository, TaskRepository, OutboxRepository, GroupSettingsRepository
+)
 
 __all__ = [
     "Base", "engine", "async_session_factory", "get_session", "init_db", "close_db",
-    "User", "Task", "TaskStatus", "TaskPriority",
-    "UserRepository", "TaskRepository"
+    "User", "Task", "TaskStatus", "TaskPriority", "OutboxMessage", "OutboxStatus",
+    "GroupSettings",
+    "UserRepository", "TaskRepository", "OutboxRepository", "GroupSettingsRepository"
 ]
@@ -16,11 +16,21 @@ class Base(DeclarativeBase):
     pass
 
 
+# Pool sizing is per process, so bot and scheduler workers can differ
+# (SQLite doesn't use a sized pool)
+_pool_options = {}
+if not settings.DATABASE_URL.startswith("sqlite"):
+    _pool_options = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     pool_pre_ping=True,
+    **_pool_options,
 )
 
 # Session factory
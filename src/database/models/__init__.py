@@ -1,6 +1,16 @@
 # src/database/models/__init__.py
 """Model exports."""
 from .user import User
-from .task import Task, TaskStatus, TaskPriority
+from .outbox import OutboxMessage, OutboxStatus
+from .group import GroupSettings
+from .task import (
+    Task, TaskStatus, TaskPriority, OPEN_STATUSES, REMINDABLE_STATUSES,
+    next_reminder_time, status_in
+)
 
-__all__ = ["User", "Task", "TaskStatus", "TaskPriority"]
+__all__ = [
+    "User", "Task", "TaskStatus", "TaskPriority",
+    "OutboxMessage", "OutboxStatus", "GroupSettings",
+    "OPEN_STATUSES", "REMINDABLE_STATUSES",
+    "next_reminder_time", "status_in",
+]
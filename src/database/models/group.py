@@ -0,0 +1,25 @@
+# src/database/models/group.py
+"""Per-group settings model."""
+from datetime import datetime
+from sqlalchemy import BigInteger, Boolean, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.engine import Base
+
+
+class GroupSettings(Base):
+    """Settings for one Telegram group; a missing row means defaults."""
+
+    __tablename__ = "group_settings"
+
+    group_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    # One combined reminder message per cycle instead of one per task
+    reminder_digest: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Pinned dashboard the bot keeps up to date (None = dashboard off)
+    dashboard_message_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<GroupSettings group_id={self.group_id}>"
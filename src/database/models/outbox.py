@@ -0,0 +1,59 @@
+# src/database/models/outbox.py
+"""Outbox of notifications waiting to be sent."""
+from datetime import datetime
+from enum import Enum
+from sqlalchemy import (
+    BigInteger, DateTime, Enum as SQLEnum, Index, Integer, SmallInteger,
+    String, Text, func, text
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.engine import Base
+
+
+class OutboxStatus(str, Enum):
+    """Outbox message delivery status."""
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"  # Permanent error or out of attempts
+
+
+class OutboxMessage(Base):
+    """A message written in the same transaction as the change it reports.
+
+    The relay sends it later; idempotency_key keeps a job that runs twice
+    from queueing the same notification twice.
+    """
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        # OutboxRelay: pending messages by next attempt time
+        Index(
+            "ix_outbox_pending", "available_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    idempotency_key: Mapped[str] = mapped_column(String(128), unique=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger)
+    text: Mapped[str] = mapped_column(Text)
+    parse_mode: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    # SendPriority lane used by the outbound dispatcher
+    priority: Mapped[int] = mapped_column(SmallInteger, default=2)
+    status: Mapped[OutboxStatus] = mapped_column(
+        SQLEnum(OutboxStatus), default=OutboxStatus.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxMessage id={self.id} key={self.idempotency_key}>"
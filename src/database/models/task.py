@@ -1,10 +1,11 @@
 # src/database/models/task.py
 """Task database model."""
-from datetime import datetime
+import importlib
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from sqlalchemy import (
-    BigInteger, DateTime, Enum as SQLEnum, ForeignKey,
-    Integer, String, Text, func
+    BigInteger, DateTime, Enum as SQLEnum, ForeignKey, Index,
+    Integer, String, Text, bindparam, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -28,10 +29,86 @@ class TaskPriority(str, Enum):
     HIGH = "high"
 
 
+# Statuses that still get reminders / can go overdue
+REMINDABLE_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+# Statuses shown in an assignee's open task list
+OPEN_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.SUBMITTED)
+
+# Partial index predicates (SQLEnum stores member names)
+_REMINDABLE_SQL = "status IN ('PENDING', 'IN_PROGRESS')"
+_OPEN_SQL = "status IN ('PENDING', 'IN_PROGRESS', 'SUBMITTED')"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def next_reminder_time(
+    status: "TaskStatus | None",
+    group_id: int | None,
+    interval_minutes: int | None,
+    last_sent: datetime | None,
+    now: datetime,
+) -> datetime | None:
+    """When a group task's next recurring reminder is due.
+
+    None if the task gets no reminders (personal task, no interval, or not
+    in a remindable status). A task never reminded is due right away.
+    Times outside working hours are deferred to the next working period.
+    """
+    if group_id is None or interval_minutes is None:
+        return None
+    if status not in REMINDABLE_STATUSES:
+        return None
+    if last_sent is None:
+        due = now
+    else:
+        due = last_sent + timedelta(minutes=interval_minutes)
+    # Lazy import - the services package imports this module
+    working_hours = importlib.import_module("src.services.working-hours")
+    return working_hours.get_next_working_time(due)
+
+
+def _partial(predicate: str) -> dict:
+    """Index kwargs for a partial index on both Postgres and SQLite."""
+    return {"postgresql_where": text(predicate), "sqlite_where": text(predicate)}
+
+
 class Task(Base):
     """Task model for user todos."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # get_group_tasks: group listing filtered by status, newest first
+        Index("ix_tasks_group_status_created", "group_id", "status", "created_at"),
+        # get_all_by_user: personal task lists
+        Index("ix_tasks_user_status_created", "user_id", "status", "created_at"),
+        # get_user_tasks: an assignee's open tasks, optionally per group
+        Index(
+            "ix_tasks_assignee_open", "assignee_id", "group_id", "created_at",
+            **_partial(_OPEN_SQL),
+        ),
+        # process_group_reminders: range scan over reminders that are due
+        Index(
+            "ix_tasks_next_reminder", "next_reminder_at",
+            **_partial("next_reminder_at IS NOT NULL"),
+        ),
+        # check_overdue_tasks: active group tasks ordered by deadline
+        Index(
+            "ix_tasks_overdue_sweep", "due_date",
+            **_partial(f"{_REMINDABLE_SQL} AND group_id IS NOT NULL AND due_date IS NOT NULL"),
+        ),
+        # cleanup_old_tasks: completed tasks by verification time
+        Index(
+            "ix_tasks_completed_verified", "verified_at",
+            **_partial("status = 'COMPLETED'"),
+        ),
+        # claim_due_reminders: personal one-shot reminders
+        Index(
+            "ix_tasks_reminder_at", "reminder_at",
+            **_partial("reminder_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -66,6 +143,11 @@ class Task(Base):
     last_reminder_sent: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Materialized last_reminder_sent + interval; kept in sync through
+    # reschedule_reminder() so the sweep is an indexed range query
+    next_reminder_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # Completion workflow
     submitted_at: Mapped[datetime | None] = mapped_column(
@@ -78,8 +160,10 @@ class Task(Base):
         BigInteger, ForeignKey("users.id"), nullable=True
     )
 
+    # Python-side default keeps microsecond precision on every backend so
+    # (created_at, id) keyset cursors compare exactly (see keyset.py)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -90,5 +174,25 @@ class Task(Base):
         "User", back_populates="tasks", foreign_keys=[user_id]
     )
 
+    def reschedule_reminder(self, now: datetime) -> None:
+        """Recompute next_reminder_at after status/interval/send changes."""
+        self.next_reminder_at = next_reminder_time(
+            self.status, self.group_id, self.reminder_interval_minutes,
+            self.last_reminder_sent, now,
+        )
+
     def __repr__(self) -> str:
         return f"<Task id={self.id} title={self.title[:20]}>"
+
+
+def status_in(*statuses: TaskStatus):
+    """Filter Task.status with inline literals.
+
+    Bound parameters would hide the values from the Postgres planner under
+    prepared statements, so partial indexes on these statuses would never
+    be chosen.
+    """
+    return Task.status.in_([
+        bindparam(None, status, type_=Task.status.type, literal_execute=True)
+        for status in statuses
+    ])
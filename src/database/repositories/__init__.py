@@ -5,8 +5,17 @@ import importlib
 # Import kebab-case files using importlib
 _user_repo = importlib.import_module(".user-repo", package=__name__)
 _task_repo = importlib.import_module(".task-repo", package=__name__)
+_outbox_repo = importlib.import_module(".outbox-repo", package=__name__)
+_group_settings_repo = importlib.import_module(".group-settings-repo", package=__name__)
 
 UserRepository = _user_repo.UserRepository
 TaskRepository = _task_repo.TaskRepository
+OutboxRepository = _outbox_repo.OutboxRepository
+GroupSettingsRepository = _group_settings_repo.GroupSettingsRepository
 
-__all__ = ["UserRepository", "TaskRepository"]
+from .keyset import Cursor, Page, fetch_page, encode_cursor, decode_cursor
+
+__all__ = [
+    "UserRepository", "TaskRepository", "OutboxRepository", "GroupSettingsRepository",
+    "Cursor", "Page", "fetch_page", "encode_cursor", "decode_cursor",
+]
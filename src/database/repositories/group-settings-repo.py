@@ -0,0 +1,70 @@
+# src/database/repositories/group-settings-repo.py
+"""Group settings repository."""
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.database.models.group import GroupSettings
+
+
+class GroupSettingsRepository:
+    """Repository for per-group settings."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, group_id: int) -> GroupSettings | None:
+        """Get a group's settings row, None if it uses the defaults."""
+        return await self.session.get(GroupSettings, group_id)
+
+    async def get_digest_groups(self, group_ids: set[int]) -> set[int]:
+        """Which of the groups want reminder digests.
+
+        Groups without a settings row follow REMINDER_DIGEST_DEFAULT.
+        """
+        if not group_ids:
+            return set()
+        result = await self.session.execute(
+            select(GroupSettings.group_id, GroupSettings.reminder_digest).where(
+                GroupSettings.group_id.in_(group_ids)
+            )
+        )
+        configured = dict(result.all())
+        return {
+            group_id for group_id in group_ids
+            if configured.get(group_id, settings.REMINDER_DIGEST_DEFAULT)
+        }
+
+    async def get_dashboard_message_id(self, group_id: int) -> int | None:
+        """Message ID of the group's pinned dashboard, None if it has none."""
+        result = await self.session.execute(
+            select(GroupSettings.dashboard_message_id).where(
+                GroupSettings.group_id == group_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def set_reminder_digest(self, group_id: int, enabled: bool) -> None:
+        """Turn reminder digests on or off for a group."""
+        await self._upsert(group_id, reminder_digest=enabled)
+
+    async def set_dashboard_message(self, group_id: int, message_id: int | None) -> None:
+        """Store (or with None, clear) the group's dashboard message."""
+        await self._upsert(group_id, dashboard_message_id=message_id)
+
+    async def _upsert(self, group_id: int, **values) -> None:
+        """Set the given columns, creating the row with defaults if needed."""
+        dialect = self.session.get_bind().dialect.name
+        insert_fn = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert_fn(GroupSettings).values({
+            "group_id": group_id,
+            "reminder_digest": settings.REMINDER_DIGEST_DEFAULT,
+            **values,
+        })
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GroupSettings.group_id],
+            set_={**values, "updated_at": func.now()},
+        )
+        await self.session.execute(stmt)
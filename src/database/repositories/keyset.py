@@ -0,0 +1,78 @@
+# src/database/repositories/keyset.py
+"""Keyset pagination over tasks ordered by (created_at, id) descending."""
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.task import Task
+
+# (created_at, id) of a boundary row
+Cursor = tuple[datetime, int]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class Page(NamedTuple):
+    """One page of tasks, newest first."""
+    items: list[Task]
+    next_cursor: Cursor | None  # Fetch older tasks after this row
+    prev_cursor: Cursor | None  # Fetch newer tasks before this row
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select,
+    limit: int,
+    cursor: Cursor | None = None,
+    backward: bool = False,
+) -> Page:
+    """Run query as one indexed range scan of at most limit + 1 rows.
+
+    Args:
+        session: Async session
+        query: select(Task) with filters applied, no ordering
+        limit: Page size
+        cursor: Boundary row from a previous page
+        backward: True to page towards newer tasks (Prev button)
+    """
+    key = tuple_(Task.created_at, Task.id)
+    backward = backward and cursor is not None
+    if backward:
+        query = query.where(key > cursor).order_by(Task.created_at.asc(), Task.id.asc())
+    else:
+        if cursor is not None:
+            query = query.where(key < cursor)
+        query = query.order_by(Task.created_at.desc(), Task.id.desc())
+
+    result = await session.execute(query.limit(limit + 1))
+    rows = list(result.scalars().all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backward:
+        rows.reverse()
+    if not rows:
+        return Page([], None, None)
+
+    has_older = True if backward else has_more
+    has_newer = has_more if backward else cursor is not None
+    return Page(
+        items=rows,
+        next_cursor=(rows[-1].created_at, rows[-1].id) if has_older else None,
+        prev_cursor=(rows[0].created_at, rows[0].id) if has_newer else None,
+    )
+
+
+def encode_cursor(cursor: Cursor) -> tuple[int, int]:
+    """Pack cursor into (epoch microseconds, id) for callback data."""
+    created_at, task_id = cursor
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return (created_at - _EPOCH) // _MICROSECOND, task_id
+
+
+def decode_cursor(ts: int, task_id: int) -> Cursor:
+    """Unpack cursor from callback data."""
+    return _EPOCH + ts * _MICROSECOND, task_id
@@ -0,0 +1,133 @@
+# src/database/repositories/outbox-repo.py
+"""Outbox repository: queue notifications and claim them for sending."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import Row, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.outbox import OutboxMessage, OutboxStatus
+
+
+class OutboxRepository:
+    """Repository for the notification outbox."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue_many(self, messages: list[dict], now: datetime) -> None:
+        """Queue messages in the caller's transaction.
+
+        Each dict needs idempotency_key, chat_id and text; parse_mode and
+        priority are optional. A key that is already queued is skipped
+        (INSERT ... ON CONFLICT DO NOTHING), so re-running a job is safe.
+        """
+        if not messages:
+            return
+        rows = [
+            {
+                "parse_mode": None,
+                "priority": 2,
+                **message,
+                "status": OutboxStatus.PENDING,
+                "attempts": 0,
+                "available_at": now,
+            }
+            for message in messages
+        ]
+        dialect = self.session.get_bind().dialect.name
+        insert_fn = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert_fn(OutboxMessage).values(rows).on_conflict_do_nothing(
+            index_elements=[OutboxMessage.idempotency_key]
+        )
+        await self.session.execute(stmt)
+
+    async def claim_batch(self, now: datetime, limit: int, lease: timedelta) -> list[Row]:
+        """Lease up to limit due messages to this relay.
+
+        The claimed rows become invisible to other relays until the lease
+        runs out, so a relay that dies mid-batch just has its messages
+        retried later. attempts is bumped at claim time.
+
+        Returns:
+            Rows with id, chat_id, text, parse_mode, priority, attempts
+        """
+        due_ids = (
+            select(OutboxMessage.id)
+            .where(
+                OutboxMessage.status == OutboxStatus.PENDING,
+                OutboxMessage.available_at <= now,
+            )
+            .order_by(OutboxMessage.available_at, OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(due_ids))
+            .values(
+                available_at=now + lease,
+                attempts=OutboxMessage.attempts + 1,
+            )
+            .returning(
+                OutboxMessage.id, OutboxMessage.chat_id, OutboxMessage.text,
+                OutboxMessage.parse_mode, OutboxMessage.priority,
+                OutboxMessage.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def mark_sent(self, ids: list[int], now: datetime) -> None:
+        """Mark delivered messages."""
+        if not ids:
+            return
+        await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids))
+            .values(status=OutboxStatus.SENT, sent_at=now, last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_retry(self, message_id: int, error: str, available_at: datetime) -> None:
+        """Schedule another attempt."""
+        await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message_id)
+            .values(available_at=available_at, last_error=error[:1000])
+            .execution_options(synchronize_session=False)
+        )
+
+    async def defer(self, ids: list[int], available_at: datetime) -> None:
+        """Put claimed messages back unsent, without using up an attempt."""
+        if not ids:
+            return
+        await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(ids))
+            .values(available_at=available_at, attempts=OutboxMessage.attempts - 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_failed(self, message_id: int, error: str) -> None:
+        """Give up on a message."""
+        await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message_id)
+            .values(status=OutboxStatus.FAILED, last_error=error[:1000])
+            .execution_options(synchronize_session=False)
+        )
+
+    async def purge(self, before: datetime) -> int:
+        """Delete sent and failed messages created before the cutoff."""
+        result = await self.session.execute(
+            delete(OutboxMessage)
+            .where(
+                OutboxMessage.status != OutboxStatus.PENDING,
+                OutboxMessage.created_at < before,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,10 +1,11 @@
 # src/database/repositories/task-repo.py
 """Task repository for database operations."""
-from datetime import datetime
-from sqlalchemy import select, delete
+from datetime import datetime, timezone
+from sqlalchemy import Row, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.task import Task, TaskStatus, TaskPriority
+from src.database.repositories.keyset import Cursor, Page, fetch_page
 
 
 class TaskRepository:
@@ -26,15 +27,14 @@ class TaskRepository:
         user_id: int,
         status: TaskStatus | None = None,
         limit: int = 10,
-        offset: int = 0
-    ) -> list[Task]:
-        """Get all tasks for user with optional filters."""
+        cursor: Cursor | None = None,
+        backward: bool = False
+    ) -> Page:
+        """Get one page of user's tasks, newest first (keyset pagination)."""
         query = select(Task).where(Task.user_id == user_id)
         if status:
             query = query.where(Task.status == status)
-        query = query.order_by(Task.created_at.desc()).limit(limit).offset(offset)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await fetch_page(self.session, query, limit, cursor, backward)
 
     async def create(
         self,
@@ -63,6 +63,7 @@ class TaskRepository:
         task = await self.get_by_id(task_id)
         if task:
             task.status = status
+            task.reschedule_reminder(datetime.now(timezone.utc))
             await self.session.flush()
         return task
 
@@ -73,12 +74,33 @@ class TaskRepository:
         )
         return result.rowcount > 0
 
-    async def get_due_reminders(self, before: datetime) -> list[Task]:
-        """Get tasks with reminders due before given time."""
-        query = select(Task).where(
-            Task.reminder_at <= before,
-            Task.reminder_at.isnot(None),
-            Task.status != TaskStatus.COMPLETED
+    async def claim_due_reminders(self, now: datetime, limit: int = 500) -> list[Row]:
+        """Clear up to limit due one-shot reminders and return them.
+
+        One UPDATE ... WHERE id IN (SELECT ... LIMIT) RETURNING over the
+        ix_tasks_reminder_at partial index. The caller queues the
+        notifications in the same transaction, so a reminder is either
+        still due or already queued - never lost, never doubled.
+
+        Returns:
+            Rows with id, user_id, title, description
+        """
+        due_ids = (
+            select(Task.id)
+            .where(
+                Task.reminder_at.isnot(None),
+                Task.reminder_at <= now,
+                Task.status.notin_((TaskStatus.COMPLETED, TaskStatus.CANCELLED)),
+            )
+            .order_by(Task.reminder_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        result = await self.session.execute(
+            update(Task)
+            .where(Task.id.in_(due_ids))
+            .values(reminder_at=None)
+            .returning(Task.id, Task.user_id, Task.title, Task.description)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.all())
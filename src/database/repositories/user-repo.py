@@ -1,6 +1,8 @@
 # src/database/repositories/user-repo.py
 """User repository for database operations."""
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.user import User
@@ -19,6 +21,20 @@ class UserRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_ids_by_usernames(self, usernames: list[str]) -> dict[str, int]:
+        """Resolve @usernames (case-insensitive) to user IDs.
+
+        Returns mapping of lowercased username -> user ID for known users.
+        """
+        if not usernames:
+            return {}
+        result = await self.session.execute(
+            select(User.id, User.username).where(
+                func.lower(User.username).in_([u.lower() for u in usernames])
+            )
+        )
+        return {username.lower(): user_id for user_id, username in result.all()}
+
     async def get_or_create(
         self,
         user_id: int,
@@ -47,6 +63,30 @@ class UserRepository:
         await self.session.flush()
         return user, True
 
+    async def upsert_many(self, profiles: list[dict], chunk_size: int = 500) -> None:
+        """Insert or refresh many users with multi-row INSERT ... ON CONFLICT.
+
+        Each profile dict needs id, username, first_name, last_name and
+        language_code. Existing rows only get their name fields refreshed,
+        matching get_or_create.
+        """
+        if not profiles:
+            return
+        dialect = self.session.get_bind().dialect.name
+        insert_fn = pg_insert if dialect == "postgresql" else sqlite_insert
+        for start in range(0, len(profiles), chunk_size):
+            stmt = insert_fn(User).values(profiles[start:start + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[User.id],
+                set_={
+                    "username": stmt.excluded.username,
+                    "first_name": stmt.excluded.first_name,
+                    "last_name": stmt.excluded.last_name,
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+
     async def update(self, user: User) -> User:
         """Update user."""
         await self.session.flush()
@@ -5,8 +5,8 @@ from loguru import logger
 
 from src.core.config import settings
 from src.database import init_db, close_db, async_session_factory
-from src.bot import create_bot, create_dispatcher, on_startup, on_shutdown
-from src.scheduler import get_scheduler, set_bot_instance
+from src.bot import create_bot, create_dispatcher, on_startup, on_shutdown, run_webhook
+from src.scheduler import SchedulerRuntime
 
 
 async def main():
@@ -27,25 +27,35 @@ async def main():
     bot = create_bot()
     dp = create_dispatcher()
 
-    # Setup scheduler
-    scheduler = get_scheduler()
-    scheduler.setup()
-    set_bot_instance(bot, async_session_factory)
-    scheduler.start()
+    # Setup scheduler (jobs run only in the leader replica)
+    scheduler = None
+    if settings.SCHEDULER_ENABLED:
+        scheduler = SchedulerRuntime(bot, async_session_factory)
+        await scheduler.start()
 
     # Register lifecycle hooks
     dp.startup.register(on_startup)
     dp.shutdown.register(on_shutdown)
 
     try:
-        logger.info("Starting bot polling...")
-        await dp.start_polling(
-            bot,
-            allowed_updates=dp.resolve_used_update_types()
-        )
+        if settings.BOT_MODE == "webhook":
+            logger.info("Starting webhook server...")
+            await run_webhook(bot, dp)
+        else:
+            # getUpdates fails while a webhook is registered
+            await bot.delete_webhook()
+            logger.info("Starting bot polling...")
+            # feed_update only queues on the update executor, which bounds
+            # concurrency itself; handling inline makes polling wait when full
+            await dp.start_polling(
+                bot,
+                allowed_updates=dp.resolve_used_update_types(),
+                handle_as_tasks=False,
+            )
     finally:
         logger.info("Shutting down...")
-        scheduler.shutdown()
+        if scheduler:
+            await scheduler.stop()
         await close_db()
         await bot.session.close()
 
@@ -1,9 +1,25 @@
 # src/scheduler/__init__.py
 """Scheduler module exports."""
+import importlib
+
 from .manager import SchedulerManager, get_scheduler
-from .jobs import send_reminder_job, check_due_tasks_job, set_bot_instance
+from .jobs import process_personal_reminders, set_bot_instance
+
+WorkingHoursTrigger = importlib.import_module(
+    "src.scheduler.working-hours-trigger"
+).WorkingHoursTrigger
+_timer_engine = importlib.import_module("src.scheduler.timer-engine")
+TimerEngine = _timer_engine.TimerEngine
+get_timer_engine = _timer_engine.get_timer_engine
+TimerNotifier = _timer_engine.TimerNotifier
+get_timer_notifier = _timer_engine.get_timer_notifier
+LeaderElection = importlib.import_module("src.scheduler.leader-election").LeaderElection
+
+from .runtime import SchedulerRuntime
 
 __all__ = [
-    "SchedulerManager", "get_scheduler",
-    "send_reminder_job", "check_due_tasks_job", "set_bot_instance"
+    "SchedulerManager", "get_scheduler", "WorkingHoursTrigger",
+    "TimerEngine", "get_timer_engine", "TimerNotifier", "get_timer_notifier",
+    "LeaderElection", "SchedulerRuntime",
+    "process_personal_reminders", "set_bot_instance"
 ]
@@ -0,0 +1,89 @@
+# src/scheduler/async-scheduler.py
+"""AsyncIOScheduler that keeps job store I/O off the event loop."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from apscheduler.executors.asyncio import AsyncIOExecutor
+from apscheduler.schedulers.asyncio import AsyncIOScheduler, run_in_event_loop
+from apscheduler.schedulers.base import STATE_STOPPED
+from loguru import logger
+
+
+class ThreadSafeAsyncIOExecutor(AsyncIOExecutor):
+    """AsyncIOExecutor that accepts jobs submitted from any thread.
+
+    Coroutine jobs still run as tasks on the event loop; the hand-off just
+    goes through call_soon_threadsafe because the scheduler submits from
+    its job store thread.
+    """
+
+    def _do_submit_job(self, job, run_times):
+        self._eventloop.call_soon_threadsafe(
+            partial(AsyncIOExecutor._do_submit_job, self, job, run_times)
+        )
+
+
+class OffloadedAsyncIOScheduler(AsyncIOScheduler):
+    """AsyncIOScheduler whose wakeups don't block the event loop.
+
+    Every wakeup runs _process_jobs - due-job lookup, next run time
+    updates, removals, all synchronous job store queries - on one
+    dedicated thread, so handlers keep running meanwhile. A single thread
+    also serializes job store access (SQLite friendly).
+
+    max_wait_seconds caps the sleep between passes, so jobs that other
+    processes add to a shared store are picked up without a local wakeup.
+    """
+
+    def __init__(self, *args, max_wait_seconds: float | None = None, **kwargs):
+        self.max_wait_seconds = max_wait_seconds
+        super().__init__(*args, **kwargs)
+        self._store_thread = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="apscheduler-jobstore"
+        )
+        self._processing: asyncio.Future | None = None
+        self._rerun = False
+
+    @run_in_event_loop
+    def wakeup(self):
+        if self.state == STATE_STOPPED or self._eventloop is None:
+            return
+        self._stop_timer()
+        if self._processing is not None:
+            # A pass is in flight; run another once it finishes
+            self._rerun = True
+            return
+        self._processing = self._eventloop.run_in_executor(
+            self._store_thread, self._process_jobs
+        )
+        self._processing.add_done_callback(self._processed)
+
+    def _processed(self, future: asyncio.Future) -> None:
+        self._processing = None
+        if self.state == STATE_STOPPED or self._eventloop is None:
+            return
+        try:
+            wait_seconds = future.result()
+        except Exception as e:
+            logger.error(f"Scheduler wakeup failed: {e}")
+            wait_seconds = self.jobstore_retry_interval
+        if self.max_wait_seconds is not None:
+            if wait_seconds is None or wait_seconds > self.max_wait_seconds:
+                wait_seconds = self.max_wait_seconds
+        if self._rerun:
+            self._rerun = False
+            self.wakeup()
+        else:
+            self._start_timer(wait_seconds)
+
+    async def run_in_store_thread(self, func, *args, **kwargs):
+        """Await a blocking scheduler call (add_job, remove_job...) off the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._store_thread, partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self, wait=True):
+        super().shutdown(wait)
+        self._store_thread.shutdown(wait=wait)
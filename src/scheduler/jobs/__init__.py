@@ -1,5 +1,5 @@
 # src/scheduler/jobs/__init__.py
 """Job exports."""
-from .notify import send_reminder_job, check_due_tasks_job, set_bot_instance
+from .notify import process_personal_reminders, set_bot_instance
 
-__all__ = ["send_reminder_job", "check_due_tasks_job", "set_bot_instance"]
+__all__ = ["process_personal_reminders", "set_bot_instance"]
@@ -1,19 +1,27 @@
 # src/scheduler/jobs/group-task-reminder.py
 """Scheduler jobs for group task reminders."""
+import asyncio
+import hashlib
+import html
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from loguru import logger
-from sqlalchemy import select, and_
+from sqlalchemy import delete, select, and_
 
+from src.core import clock
 from src.core.config import settings
-from src.database.models.task import Task, TaskStatus
+from src.database.models.task import Task, TaskStatus, status_in
+from src.database.repositories import GroupSettingsRepository, OutboxRepository
 
 # Import working hours from services
 import importlib
 
 TIMEZONE = ZoneInfo(settings.TIMEZONE)
 
+# Telegram's message length limit
+MESSAGE_LIMIT = 4096
+
 # Bot and session factory injected at startup
 _bot = None
 _session_factory = None
@@ -26,67 +34,118 @@ def set_bot_instance(bot, session_factory):
     _session_factory = session_factory
 
 
+def _local(dt: datetime) -> datetime:
+    """SQLite drops the offset; task times are stored in TIMEZONE."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=TIMEZONE)
+    return dt
+
+
+def _reminder_priority() -> int:
+    """Outbound dispatcher lane for reminders (lazy import)."""
+    outbound = importlib.import_module("src.bot.middlewares.outbound-dispatcher")
+    return int(outbound.SendPriority.REMINDER)
+
+
+def _get_timer_engine():
+    """Lazy import timer engine module."""
+    return importlib.import_module("src.scheduler.timer-engine")
+
+
+def _get_outbox_relay():
+    """Lazy import outbox relay singleton."""
+    return importlib.import_module("src.services.outbox-relay").get_outbox_relay()
+
+
 def _get_working_hours():
     """Lazy import working hours module."""
     return importlib.import_module("src.services.working-hours")
 
 
-async def process_group_reminders():
+def _get_task_archive():
+    """Lazy import task archive module."""
+    return importlib.import_module("src.services.task-archive")
+
+
+def _get_group_task_service():
+    """Lazy import GroupTaskService class."""
+    return importlib.import_module("src.services.group-task-service").GroupTaskService
+
+
+async def process_group_reminders(task_ids: list[int] | None = None):
     """
-    Runs every 5 minutes.
-    Send recurring reminders for active group tasks during working hours.
+    Runs every 5 minutes (or per task from the timer engine).
+    Queue recurring reminders for active group tasks during working hours.
+
+    Reminders go into the outbox in the same transaction that advances
+    last_reminder_sent, so a crash either loses both or keeps both; the
+    outbox relay does the actual sending.
+
+    Groups in digest mode get one message per cycle listing all their due
+    reminders, including those due within REMINDER_DIGEST_WINDOW_MINUTES,
+    so the group's reminders line up on the same cycle.
     """
     wh = _get_working_hours()
     if not wh.is_working_time():
         return  # Skip outside working hours
 
-    if not _bot or not _session_factory:
-        logger.error("Bot or session not configured for group reminder jobs")
+    if not _session_factory:
+        logger.error("Session not configured for group reminder jobs")
         return
 
-    now = datetime.now(TIMEZONE)
+    now = clock.now()
 
     async with _session_factory() as session:
-        # Find tasks that need reminder
-        query = select(Task).where(
-            and_(
-                Task.group_id.isnot(None),
-                Task.reminder_interval_minutes.isnot(None),
-                Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
-            )
-        )
-        # Only tasks not past deadline
-        query = query.where(
-            (Task.due_date.is_(None)) | (Task.due_date > now)
+        # Indexed range scan: only tasks whose next_reminder_at has passed
+        service = _get_group_task_service()(session)
+        tasks = await service.get_tasks_needing_reminder(now, task_ids)
+
+        digest_groups = await GroupSettingsRepository(session).get_digest_groups(
+            {task.group_id for task in tasks}
         )
-        result = await session.execute(query)
-        tasks = list(result.scalars().all())
+        if digest_groups:
+            window = timedelta(minutes=settings.REMINDER_DIGEST_WINDOW_MINUTES)
+            tasks += await service.get_upcoming_group_reminders(
+                digest_groups, now, now + window
+            )
 
-        sent_count = 0
+        messages = []
+        digests: dict[int, list[tuple[Task, datetime]]] = {}
         for task in tasks:
-            if _should_send_reminder(task, now):
-                await _send_task_reminder(task)
-                task.last_reminder_sent = now
-                sent_count += 1
-
+            # Keys use the slot being delivered, not the one rescheduled to
+            slot = _local(task.next_reminder_at or now)
+            if task.group_id in digest_groups:
+                digests.setdefault(task.group_id, []).append((task, slot))
+            else:
+                messages.append(_reminder_message(task, now, slot))
+            task.last_reminder_sent = now
+            task.reschedule_reminder(now)
+
+        for group_id, group_slots in digests.items():
+            if len(group_slots) == 1:
+                task, slot = group_slots[0]
+                messages.append(_reminder_message(task, now, slot))
+            else:
+                messages.extend(_digest_messages(group_id, group_slots, now))
+
+        await OutboxRepository(session).enqueue_many(messages, now)
+        # Digests may pull in tasks the timer engine hasn't fired yet
+        _get_timer_engine().track(session, *tasks)
         await session.commit()
 
-        if sent_count > 0:
-            logger.info(f"Sent {sent_count} group task reminders")
-
+    if tasks:
+        _get_outbox_relay().wake()
+        logger.info(f"Queued {len(tasks)} group task reminders in {len(messages)} messages")
 
-def _should_send_reminder(task: Task, now: datetime) -> bool:
-    """Check if enough time elapsed since last reminder."""
-    if task.last_reminder_sent is None:
-        return True
-    elapsed = now - task.last_reminder_sent
-    return elapsed >= timedelta(minutes=task.reminder_interval_minutes)
 
+def _reminder_message(task: Task, now: datetime, slot: datetime) -> dict:
+    """Outbox message reminding a group about a task.
 
-async def _send_task_reminder(task: Task):
-    """Send reminder message to group."""
+    Keyed by the reminder slot (the task's next_reminder_at before it is
+    rescheduled), so a re-run for the same slot is a no-op.
+    """
     if task.due_date:
-        time_left = task.due_date - datetime.now(TIMEZONE)
+        time_left = _local(task.due_date) - now
         time_str = f"⏱️ Time left: {format_timedelta(time_left)}"
         deadline_str = f"📅 Deadline: {task.due_date.strftime('%d/%m %H:%M')}"
     else:
@@ -103,59 +162,131 @@ async def _send_task_reminder(task: Task):
 
 Reply /done {task.id} when complete."""
 
-    try:
-        await _bot.send_message(
-            chat_id=task.group_id,
-            text=message,
-            parse_mode="HTML"
-        )
-    except Exception as e:
-        logger.error(f"Failed to send reminder for task {task.id}: {e}")
+    return {
+        "idempotency_key": f"reminder:{task.id}:{int(slot.timestamp())}",
+        "chat_id": task.group_id,
+        "text": message,
+        "parse_mode": "HTML",
+        "priority": _reminder_priority(),
+    }
 
 
-async def check_overdue_tasks():
+async def check_overdue_tasks(task_ids: list[int] | None = None):
     """
-    Runs every 15 minutes during working hours.
+    Runs every 15 minutes during working hours (or per task from the
+    timer engine).
     Mark overdue tasks and send ONE notification (then stop reminding).
     Per validation: OVERDUE reminder gửi 1 lần rồi dừng.
+
+    Transitions run as set-based UPDATE ... RETURNING batches; each batch
+    queues its notices in the outbox and commits together with them, so
+    the write transaction never spans Telegram round trips.
     """
     wh = _get_working_hours()
     if not wh.is_working_time():
         return
 
-    if not _bot or not _session_factory:
+    if not _session_factory:
         return
 
-    now = datetime.now(TIMEZONE)
+    now = clock.now()
+    batch_size = settings.OVERDUE_BATCH_SIZE
+    total = 0
 
-    async with _session_factory() as session:
-        # Find tasks past deadline that aren't already OVERDUE
-        query = select(Task).where(
-            and_(
-                Task.group_id.isnot(None),
-                Task.due_date < now,
-                Task.due_date.isnot(None),
-                Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]),
+    while True:
+        async with _session_factory() as session:
+            rows = await _get_group_task_service()(session).mark_overdue_batch(
+                now, batch_size, task_ids
             )
-        )
-        result = await session.execute(query)
-        tasks = list(result.scalars().all())
+            await OutboxRepository(session).enqueue_many(
+                [_overdue_message(row, now) for row in rows], now
+            )
+            await session.commit()
 
-        for task in tasks:
-            task.status = TaskStatus.OVERDUE
-            # Clear reminders - no more notifications after this one
-            task.reminder_interval_minutes = None
-            await _send_overdue_notification(task, now)
+        if rows:
+            _get_outbox_relay().wake()
+        total += len(rows)
 
-        await session.commit()
+        if len(rows) < batch_size:
+            break
 
-        if tasks:
-            logger.info(f"Marked {len(tasks)} tasks as overdue")
+    if total:
+        logger.info(f"Marked {total} tasks as overdue")
 
 
-async def _send_overdue_notification(task: Task, now: datetime):
-    """Send overdue notification to group (once only)."""
-    overdue_duration = now - task.due_date
+def _digest_line(task: Task, now: datetime) -> str:
+    """One task in a reminder digest."""
+    if task.due_date:
+        time_left = format_timedelta(_local(task.due_date) - now)
+        deadline = f"📅 {task.due_date.strftime('%d/%m %H:%M')} (⏱️ {time_left})"
+    else:
+        deadline = "📅 No deadline"
+    return f"• #{task.id} {html.escape(task.title)} — {deadline}"
+
+
+def _digest_messages(
+    group_id: int, task_slots: list[tuple[Task, datetime]], now: datetime
+) -> list[dict]:
+    """Outbox messages with all of a group's due reminders.
+
+    Tasks are listed under one mention per assignee; the text is split
+    into as many messages as needed to stay within MESSAGE_LIMIT, repeating
+    the assignee mention when a list continues in the next message.
+    Keyed by the tasks and the slots being delivered, so an overlapping
+    run for the same slots is a no-op.
+    """
+    task_slots = sorted(task_slots, key=lambda pair: pair[0].id)
+    tasks = [task for task, _ in task_slots]
+    by_assignee: dict[int | None, list[Task]] = {}
+    for task in tasks:
+        by_assignee.setdefault(task.assignee_id, []).append(task)
+
+    header = f"⏰ Task Reminders ({len(tasks)})"
+    footer = "\nReply /done &lt;task id&gt; when complete."
+    budget = MESSAGE_LIMIT - len(footer)
+
+    parts: list[list[str]] = []
+    lines = [header]
+    size = len(header) + 1
+
+    def add(line: str, mention: str | None = None) -> None:
+        nonlocal lines, size
+        if size + len(line) + 1 > budget:
+            parts.append(lines)
+            lines = [f"{header} (cont.)"]
+            if mention:
+                lines.append(mention)
+            size = sum(len(text) + 1 for text in lines)
+        lines.append(line)
+        size += len(line) + 1
+
+    for assignee_id, assignee_tasks in by_assignee.items():
+        mention = f'\n👤 <a href="tg://user?id={assignee_id}">Assignee</a>'
+        add(mention)
+        for task in assignee_tasks:
+            add(_digest_line(task, now), mention)
+    parts.append(lines)
+
+    slots = ",".join(f"{task.id}:{int(slot.timestamp())}" for task, slot in task_slots)
+    digest_id = hashlib.sha256(slots.encode()).hexdigest()[:16]
+    return [
+        {
+            "idempotency_key": f"digest:{group_id}:{digest_id}:{index}",
+            "chat_id": group_id,
+            "text": "\n".join(part) + "\n" + footer,
+            "parse_mode": "HTML",
+            "priority": _reminder_priority(),
+        }
+        for index, part in enumerate(parts)
+    ]
+
+
+def _overdue_message(task, now: datetime) -> dict:
+    """Outbox message telling a group a task is overdue (once per deadline).
+
+    Accepts a Task or a RETURNING row with the same attribute names.
+    """
+    overdue_duration = now - _local(task.due_date)
 
     message = f"""🚨 OVERDUE TASK
 
@@ -166,46 +297,87 @@ async def _send_overdue_notification(task: Task, now: datetime):
 
 <a href="tg://user?id={task.assigned_by_id}">Admin</a> please review."""
 
-    try:
-        await _bot.send_message(
-            chat_id=task.group_id,
-            text=message,
-            parse_mode="HTML"
-        )
-    except Exception as e:
-        logger.error(f"Failed to send overdue notification for task {task.id}: {e}")
+    deadline = int(_local(task.due_date).timestamp())
+    return {
+        "idempotency_key": f"overdue:{task.id}:{deadline}",
+        "chat_id": task.group_id,
+        "text": message,
+        "parse_mode": "HTML",
+        "priority": _reminder_priority(),
+    }
 
 
 async def cleanup_old_tasks():
     """
     Runs daily at 00:00.
-    Delete tasks completed > 30 days ago.
+    Delete tasks completed > COMPLETED_TASK_RETENTION_DAYS ago.
+
+    Works in chunks of CLEANUP_BATCH_SIZE: each chunk is (optionally)
+    archived, deleted with one set-based DELETE and committed on its own,
+    with CLEANUP_BATCH_PAUSE_SECONDS between chunks so a large backlog
+    doesn't hold one huge transaction or starve other queries. Sent and
+    failed outbox rows older than OUTBOX_RETENTION_DAYS are purged too.
     """
     if not _session_factory:
         return
 
-    cutoff = datetime.now(TIMEZONE) - timedelta(
-        days=settings.COMPLETED_TASK_RETENTION_DAYS
-    )
-
-    async with _session_factory() as session:
-        query = select(Task).where(
+    now = clock.now()
+    cutoff = now - timedelta(days=settings.COMPLETED_TASK_RETENTION_DAYS)
+    batch_size = settings.CLEANUP_BATCH_SIZE
+    archive_dir = settings.CLEANUP_ARCHIVE_DIR
+    task_archive = _get_task_archive()
+
+    # Whole rows are only needed when archiving
+    columns = Task.__table__ if archive_dir else Task.id
+    query = (
+        select(columns)
+        .where(
             and_(
-                Task.status == TaskStatus.COMPLETED,
+                status_in(TaskStatus.COMPLETED),
                 Task.verified_at.isnot(None),
                 Task.verified_at < cutoff,
             )
         )
-        result = await session.execute(query)
-        old_tasks = list(result.scalars().all())
+        .order_by(Task.verified_at, Task.id)
+        .limit(batch_size)
+    )
 
-        for task in old_tasks:
-            await session.delete(task)
+    total = 0
+    while True:
+        async with _session_factory() as session:
+            rows = (await session.execute(query)).all()
+            if not rows:
+                break
+
+            if archive_dir:
+                # Archive first: a failed delete re-archives the chunk next
+                # run, which is preferable to losing rows
+                await task_archive.archive_rows(
+                    (row._mapping for row in rows), archive_dir, now.date()
+                )
+
+            ids = [row.id for row in rows]
+            await session.execute(
+                delete(Task)
+                .where(Task.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
 
-        await session.commit()
+        total += len(rows)
+        if len(rows) < batch_size:
+            break
+        await asyncio.sleep(settings.CLEANUP_BATCH_PAUSE_SECONDS)
 
-        if old_tasks:
-            logger.info(f"Cleaned up {len(old_tasks)} old completed tasks")
+    if total:
+        logger.info(f"Cleaned up {total} old completed tasks")
+
+    outbox_cutoff = now - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+    async with _session_factory() as session:
+        purged = await OutboxRepository(session).purge(outbox_cutoff)
+        await session.commit()
+    if purged:
+        logger.info(f"Purged {purged} old outbox messages")
 
 
 def format_timedelta(td: timedelta) -> str:
@@ -1,12 +1,29 @@
 # src/scheduler/jobs/notify.py
-"""Notification job definitions."""
+"""Personal task reminder job."""
+import importlib
+
 from loguru import logger
 
+from src.core import clock
+from src.core.config import settings
+from src.database.repositories import OutboxRepository, TaskRepository
+
 # Note: Bot instance injected at runtime via app state
 _bot = None
 _session_factory = None
 
 
+def _reminder_priority() -> int:
+    """Outbound dispatcher lane for reminders (lazy import)."""
+    outbound = importlib.import_module("src.bot.middlewares.outbound-dispatcher")
+    return int(outbound.SendPriority.REMINDER)
+
+
+def _get_outbox_relay():
+    """Lazy import outbox relay singleton."""
+    return importlib.import_module("src.services.outbox-relay").get_outbox_relay()
+
+
 def set_bot_instance(bot, session_factory):
     """Set bot instance for jobs (called during app startup)."""
     global _bot, _session_factory
@@ -14,55 +31,48 @@ def set_bot_instance(bot, session_factory):
     _session_factory = session_factory
 
 
-async def send_reminder_job(user_id: int, task_id: int):
-    """Job: Send reminder for a specific task."""
-    if not _bot or not _session_factory:
-        logger.error("Bot or session not configured for jobs")
-        return
-
-    from src.database.repositories.task_repo import TaskRepository
-    from src.services.notification import NotificationService
-
-    async with _session_factory() as session:
-        repo = TaskRepository(session)
-        task = await repo.get_by_id(task_id)
+async def process_personal_reminders():
+    """
+    Runs every minute.
+    Queue personal one-shot reminders whose reminder_at has passed.
 
-        if not task:
-            logger.warning(f"Task {task_id} not found for reminder")
-            return
-
-        # Clear reminder after sending
-        task.reminder_at = None
-        await session.commit()
-
-        notification = NotificationService(_bot)
-        success = await notification.send_reminder(user_id, task)
-
-        if success:
-            logger.info(f"Sent reminder for task {task_id} to user {user_id}")
-        else:
-            logger.error(f"Failed to send reminder for task {task_id}")
-
-
-async def check_due_tasks_job():
-    """Job: Check for tasks with passed due dates (interval job)."""
-    if not _bot or not _session_factory:
+    Due reminders are claimed in batches (UPDATE ... RETURNING on the
+    reminder_at index) and queued in the outbox in the same transaction;
+    the outbox relay sends them.
+    """
+    if not _session_factory:
+        logger.error("Session not configured for reminder jobs")
         return
 
-    from datetime import datetime, timezone
-    from src.database.repositories.task_repo import TaskRepository
-    from src.services.notification import NotificationService
-
-    async with _session_factory() as session:
-        repo = TaskRepository(session)
-        tasks = await repo.get_due_reminders(before=datetime.now(timezone.utc))
-
-        notification = NotificationService(_bot)
-        for task in tasks:
-            await notification.send_reminder(task.user_id, task)
-            task.reminder_at = None
-
-        await session.commit()
-
-        if tasks:
-            logger.info(f"Processed {len(tasks)} due reminders")
+    from src.services.notification import format_reminder
+
+    now = clock.now()
+    batch_size = settings.PERSONAL_REMINDER_BATCH_SIZE
+    stamp = int(now.timestamp())
+    total = 0
+
+    while True:
+        async with _session_factory() as session:
+            rows = await TaskRepository(session).claim_due_reminders(now, batch_size)
+            await OutboxRepository(session).enqueue_many(
+                [
+                    {
+                        "idempotency_key": f"personal:{row.id}:{stamp}",
+                        "chat_id": row.user_id,
+                        "text": format_reminder(row.title, row.description),
+                        "parse_mode": "Markdown",
+                        "priority": _reminder_priority(),
+                    }
+                    for row in rows
+                ],
+                now,
+            )
+            await session.commit()
+
+        total += len(rows)
+        if len(rows) < batch_size:
+            break
+
+    if total:
+        _get_outbox_relay().wake()
+        logger.info(f"Queued {total} personal reminders")
@@ -0,0 +1,137 @@
+# src/scheduler/leader-election.py
+"""Redis lease-based leader election for the scheduler."""
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+
+# Extend the lease only if we still hold it
+RENEW_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Delete the lease only if we still hold it
+RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+Callback = Callable[[], Awaitable[None]]
+
+
+class LeaderElection:
+    """Holds a Redis lease (SET NX PX) while this process is the leader.
+
+    Every process polls every lease/3: the leader renews its lease, the
+    others try to take it. A leader that can't renew steps down before
+    its lease could expire, so two leaders never overlap; a dead leader's
+    lease lapses and a follower takes over within about one lease period.
+
+    Each Redis call is cut off after half a poll interval, so a hung
+    connection counts as a failed renewal instead of stalling the loop
+    past the lease. Give the client socket timeouts below that too (see
+    redis_for_election).
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        on_elected: Callback,
+        on_demoted: Callback,
+        key: str = settings.LEADER_KEY,
+        lease_seconds: float = settings.LEADER_LEASE_SECONDS,
+    ):
+        self.redis = redis
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.key = key
+        self.lease_ms = int(lease_seconds * 1000)
+        self.renew_interval = lease_seconds / 3
+        self.call_timeout = self.renew_interval / 2
+        self.token = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._renewed_at = 0.0
+        self._renew = redis.register_script(RENEW_LUA)
+        self._release = redis.register_script(RELEASE_LUA)
+        self._task: asyncio.Task | None = None
+
+    async def _acquire_or_renew(self) -> bool:
+        if self.is_leader:
+            return bool(await self._renew(keys=[self.key], args=[self.token, self.lease_ms]))
+        return bool(await self.redis.set(self.key, self.token, nx=True, px=self.lease_ms))
+
+    async def _tick(self) -> None:
+        started = time.monotonic()
+        try:
+            held = await asyncio.wait_for(self._acquire_or_renew(), self.call_timeout)
+        except (RedisError, TimeoutError) as e:
+            logger.warning(f"Leader election: Redis unavailable: {e!r}")
+            # Keep leading only if the last renewal still covers the time
+            # until the next tick has given up as well
+            held = self.is_leader and (
+                time.monotonic() - self._renewed_at
+                < self.lease_ms / 1000 - self.renew_interval - self.call_timeout
+            )
+        else:
+            if held:
+                self._renewed_at = started
+
+        if held and not self.is_leader:
+            self.is_leader = True
+            logger.info(f"Elected scheduler leader ({self.token})")
+            await self.on_elected()
+        elif not held and self.is_leader:
+            self.is_leader = False
+            logger.warning(f"Lost scheduler leadership ({self.token})")
+            await self.on_demoted()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self._tick()
+            except Exception as e:
+                logger.exception(f"Leader election callback failed: {e}")
+            await asyncio.sleep(self.renew_interval)
+
+    def start(self) -> None:
+        """Start campaigning in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop campaigning and hand the lease over right away."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            self.is_leader = False
+            await self.on_demoted()
+            try:
+                await asyncio.wait_for(
+                    self._release(keys=[self.key], args=[self.token]), self.call_timeout
+                )
+            except (RedisError, TimeoutError) as e:
+                logger.warning(f"Failed to release scheduler lease: {e}")
+
+
+def redis_for_election(url: str = settings.REDIS_URL) -> Redis:
+    """Redis client whose socket timeouts stay below the renewal cut-off."""
+    timeout = settings.LEADER_LEASE_SECONDS / 8
+    return Redis.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
@@ -1,18 +1,21 @@
 # src/scheduler/manager.py
 """APScheduler configuration and management."""
 import importlib
-from datetime import datetime
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
-from apscheduler.executors.pool import ThreadPoolExecutor
-from apscheduler.triggers.date import DateTrigger
-from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
 
 from src.core.config import settings
 
+_async_scheduler = importlib.import_module("src.scheduler.async-scheduler")
+OffloadedAsyncIOScheduler = _async_scheduler.OffloadedAsyncIOScheduler
+ThreadSafeAsyncIOExecutor = _async_scheduler.ThreadSafeAsyncIOExecutor
+WorkingHoursTrigger = importlib.import_module(
+    "src.scheduler.working-hours-trigger"
+).WorkingHoursTrigger
+timer_engine = importlib.import_module("src.scheduler.timer-engine")
+
 
 class SchedulerManager:
     """Manages APScheduler lifecycle and job operations."""
@@ -20,7 +23,8 @@ class SchedulerManager:
     _instance: "SchedulerManager | None" = None
 
     def __init__(self):
-        self.scheduler: AsyncIOScheduler | None = None
+        self.scheduler: OffloadedAsyncIOScheduler | None = None
+        self.jobstore: SQLAlchemyJobStore | None = None
 
     @classmethod
     def get_instance(cls) -> "SchedulerManager":
@@ -29,13 +33,19 @@ class SchedulerManager:
             cls._instance = cls()
         return cls._instance
 
-    def setup(self) -> AsyncIOScheduler:
-        """Initialize scheduler with job store."""
+    def setup(self) -> OffloadedAsyncIOScheduler:
+        """Initialize scheduler with job store.
+
+        All jobs are coroutines, so they run as tasks on the event loop;
+        the synchronous job store is only touched from the scheduler's own
+        thread (see async-scheduler.py).
+        """
+        self.jobstore = SQLAlchemyJobStore(url=settings.jobstore_url)
         jobstores = {
-            "default": SQLAlchemyJobStore(url=settings.jobstore_url)
+            "default": self.jobstore
         }
         executors = {
-            "default": ThreadPoolExecutor(10)
+            "default": ThreadSafeAsyncIOExecutor()
         }
         job_defaults = {
             "coalesce": True,  # Combine missed runs
@@ -43,17 +53,22 @@ class SchedulerManager:
             "misfire_grace_time": 300  # 5 min grace
         }
 
-        self.scheduler = AsyncIOScheduler(
+        self.scheduler = OffloadedAsyncIOScheduler(
             jobstores=jobstores,
             executors=executors,
-            job_defaults=job_defaults
+            job_defaults=job_defaults,
+            # Replicas share the job store; poll for jobs they add
+            max_wait_seconds=(
+                settings.LEADER_LEASE_SECONDS
+                if settings.LEADER_ELECTION_ENABLED else None
+            ),
         )
         return self.scheduler
 
-    def start(self):
-        """Start scheduler."""
+    def start(self, paused: bool = False):
+        """Start scheduler (paused: persist jobs but don't run them)."""
         if self.scheduler:
-            self.scheduler.start()
+            self.scheduler.start(paused=paused)
             logger.info("Scheduler started")
 
     def shutdown(self, wait: bool = True):
@@ -62,27 +77,46 @@ class SchedulerManager:
             self.scheduler.shutdown(wait=wait)
             logger.info("Scheduler shutdown")
 
-    def add_reminder(
-        self,
-        job_id: str,
-        run_at: datetime,
-        user_id: int,
-        task_id: int
-    ):
-        """Schedule a one-time reminder."""
+    def register_personal_reminder_job(self, bot, session_factory):
+        """Register the sweeper that queues personal reminders (reminder_at)."""
         if not self.scheduler:
             raise RuntimeError("Scheduler not initialized")
 
-        from src.scheduler.jobs.notify import send_reminder_job
+        from src.scheduler.jobs import notify
 
+        notify.set_bot_instance(bot, session_factory)
+        # Top of every minute - reminders are entered with minute precision
         self.scheduler.add_job(
-            send_reminder_job,
-            trigger=DateTrigger(run_date=run_at),
-            id=job_id,
+            notify.process_personal_reminders,
+            trigger=CronTrigger(second=0),
+            id="personal_reminders",
             replace_existing=True,
-            kwargs={"user_id": user_id, "task_id": task_id}
+            misfire_grace_time=60,
         )
-        logger.info(f"Added reminder job {job_id} for {run_at}")
+        logger.info("Registered personal_reminders job (every minute)")
+
+    async def purge_reminder_jobs(self) -> int:
+        """Delete per-task remind_<id> jobs left by older versions.
+
+        Their reminders are still in tasks.reminder_at, so the sweeper
+        sends them. Deleted with one statement on the job store thread,
+        without unpickling each job.
+        """
+        store = self.jobstore
+
+        def purge() -> int:
+            with store.engine.begin() as conn:
+                result = conn.execute(
+                    store.jobs_t.delete().where(
+                        store.jobs_t.c.id.startswith("remind_", autoescape=True)
+                    )
+                )
+            return result.rowcount
+
+        purged = await self.scheduler.run_in_store_thread(purge)
+        if purged:
+            logger.info(f"Removed {purged} legacy per-task reminder jobs")
+        return purged
 
     def remove_job(self, job_id: str):
         """Remove scheduled job."""
@@ -109,25 +143,36 @@ class SchedulerManager:
         # Set bot instance for jobs
         gtr.set_bot_instance(bot, session_factory)
 
-        # Process group reminders every 5 minutes
-        self.scheduler.add_job(
-            gtr.process_group_reminders,
-            trigger=IntervalTrigger(minutes=5),
-            id="group_task_reminder",
-            replace_existing=True,
-            misfire_grace_time=60,
-        )
-        logger.info("Registered group_task_reminder job (every 5 min)")
-
-        # Check overdue tasks every 15 minutes
-        self.scheduler.add_job(
-            gtr.check_overdue_tasks,
-            trigger=IntervalTrigger(minutes=15),
-            id="check_overdue_tasks",
-            replace_existing=True,
-            misfire_grace_time=60,
-        )
-        logger.info("Registered check_overdue_tasks job (every 15 min)")
+        if settings.TIMER_ENGINE_ENABLED:
+            # Reminders and deadlines fire from the timer heap; drop the
+            # polling sweeps a previous run may have persisted
+            self.remove_job("group_task_reminder")
+            self.remove_job("check_overdue_tasks")
+            timer_engine.get_timer_engine().start(session_factory)
+            logger.info("Started timer engine for group reminders and deadlines")
+        else:
+            # Both sweeps are no-ops outside working hours, so their triggers
+            # skip lunch, nights and weekends instead of waking up for nothing
+
+            # Process group reminders every 5 minutes
+            self.scheduler.add_job(
+                gtr.process_group_reminders,
+                trigger=WorkingHoursTrigger(minutes=5),
+                id="group_task_reminder",
+                replace_existing=True,
+                misfire_grace_time=60,
+            )
+            logger.info("Registered group_task_reminder job (every 5 min, working hours)")
+
+            # Check overdue tasks every 15 minutes
+            self.scheduler.add_job(
+                gtr.check_overdue_tasks,
+                trigger=WorkingHoursTrigger(minutes=15),
+                id="check_overdue_tasks",
+                replace_existing=True,
+                misfire_grace_time=60,
+            )
+            logger.info("Registered check_overdue_tasks job (every 15 min, working hours)")
 
         # Cleanup old tasks daily at midnight
         self.scheduler.add_job(
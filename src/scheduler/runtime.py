@@ -0,0 +1,72 @@
+# src/scheduler/runtime.py
+"""Scheduler lifecycle for one process, leader-aware."""
+import importlib
+
+from loguru import logger
+from redis.asyncio import Redis
+
+from src.core.config import settings
+from src.scheduler.jobs import set_bot_instance
+from src.scheduler.manager import get_scheduler
+
+_leader_election = importlib.import_module("src.scheduler.leader-election")
+LeaderElection = _leader_election.LeaderElection
+timer_engine = importlib.import_module("src.scheduler.timer-engine")
+outbox_relay = importlib.import_module("src.services.outbox-relay")
+
+
+class SchedulerRuntime:
+    """Starts the scheduler; only the elected leader fires jobs.
+
+    With LEADER_ELECTION_ENABLED every process starts the scheduler
+    paused and only the leader resumes it, registers the jobs and runs
+    the timer engine and outbox relay. Without it this process is always
+    the leader.
+    """
+
+    def __init__(self, bot, session_factory, redis: Redis | None = None):
+        self.bot = bot
+        self.session_factory = session_factory
+        self.redis = redis
+        self.manager = get_scheduler()
+        self.election: LeaderElection | None = None
+
+    async def start(self) -> None:
+        """Set up the scheduler and start leading or campaigning."""
+        self.manager.setup()
+        set_bot_instance(self.bot, self.session_factory)
+
+        if not settings.LEADER_ELECTION_ENABLED:
+            self.manager.start()
+            await self._lead()
+            return
+
+        self.manager.start(paused=True)
+        self.election = LeaderElection(
+            self.redis or _leader_election.redis_for_election(),
+            on_elected=self._lead,
+            on_demoted=self._follow,
+        )
+        self.election.start()
+
+    async def _lead(self) -> None:
+        self.manager.register_group_task_jobs(self.bot, self.session_factory)
+        self.manager.register_personal_reminder_job(self.bot, self.session_factory)
+        await self.manager.purge_reminder_jobs()
+        self.manager.scheduler.resume()
+        outbox_relay.get_outbox_relay().start(self.bot, self.session_factory)
+        logger.info("Scheduler jobs active in this process")
+
+    async def _follow(self) -> None:
+        self.manager.scheduler.pause()
+        await timer_engine.get_timer_engine().stop()
+        await outbox_relay.get_outbox_relay().stop()
+        logger.info("Scheduler jobs paused in this process")
+
+    async def stop(self) -> None:
+        """Step down (releasing the lease) and shut the scheduler down."""
+        if self.election:
+            await self.election.stop()
+        await timer_engine.get_timer_engine().stop()
+        await outbox_relay.get_outbox_relay().stop()
+        self.manager.shutdown()
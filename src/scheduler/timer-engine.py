@@ -0,0 +1,435 @@
+# src/scheduler/timer-engine.py
+"""In-process timer heap for group task reminders and deadlines."""
+import asyncio
+import heapq
+import importlib
+import json
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.database.models.task import REMINDABLE_STATUSES, Task, TaskStatus, status_in
+
+TIMEZONE = ZoneInfo(settings.TIMEZONE)
+
+# A timer that fired but whose task is still due (e.g. the job skipped it)
+# is re-armed this far in the future instead of spinning
+_RETRY_DELAY = timedelta(seconds=60)
+_PENDING_KEY = "timer_engine_pending"
+# Pause before resubscribing to the change channel after a Redis error
+_RESUBSCRIBE_DELAY = 5.0
+# Rows applied between event loop yields during a full reload
+_LOAD_CHUNK = 1000
+
+
+class TimerKind(str, Enum):
+    """What happens when a timer fires."""
+    REMINDER = "reminder"  # Recurring group reminder (next_reminder_at)
+    DEADLINE = "deadline"  # Overdue transition (due_date)
+
+
+class TimerState(NamedTuple):
+    """Task columns that decide its timers."""
+    task_id: int
+    status: TaskStatus | None
+    group_id: int | None
+    next_reminder_at: datetime | None
+    due_date: datetime | None
+
+    @classmethod
+    def of(cls, task: Task) -> "TimerState":
+        return cls(task.id, task.status, task.group_id, task.next_reminder_at, task.due_date)
+
+
+_STATE_COLUMNS = (Task.id, Task.status, Task.group_id, Task.next_reminder_at, Task.due_date)
+
+
+def _get_jobs():
+    """Lazy import group task jobs."""
+    return importlib.import_module("src.scheduler.jobs.group-task-reminder")
+
+
+def _get_working_hours():
+    """Lazy import working hours module."""
+    return importlib.import_module("src.services.working-hours")
+
+
+def _aware(dt: datetime | None) -> datetime | None:
+    """SQLite drops offsets; stored times are TIMEZONE wall clock."""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=TIMEZONE)
+    return dt
+
+
+class TimerEngine:
+    """Sleeps until the next reminder or deadline is due, then fires it.
+
+    Timers live in a heap of (fire_at, task_id, kind). Re-arming or
+    cancelling only updates the armed map; stale heap entries are skipped
+    when they surface. Fire times are deferred to working hours, so
+    nothing wakes at night. Every fired task is re-read from the database
+    afterwards.
+
+    Changes committed in this process are applied right away (see track);
+    other processes publish the changed task ids on TIMER_ENGINE_CHANNEL
+    and the engine re-reads just those tasks. The full reload runs at
+    start, after the subscription to the channel was lost, and every
+    TIMER_ENGINE_RESYNC_SECONDS as a safety net.
+    """
+
+    def __init__(
+        self,
+        resync_seconds: int = settings.TIMER_ENGINE_RESYNC_SECONDS,
+        channel: str = settings.TIMER_ENGINE_CHANNEL,
+    ):
+        self.resync_interval = timedelta(seconds=resync_seconds)
+        self.channel = channel
+        self._heap: list[tuple[datetime, int, TimerKind]] = []
+        self._armed: dict[tuple[int, TimerKind], datetime] = {}
+        self._changed: set[int] = set()
+        self._reload = False
+        self._loading = False
+        self._subscribed = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._session_factory = None
+        self._redis: Redis | None = None
+        self._task: asyncio.Task | None = None
+        self._listener: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def __len__(self) -> int:
+        return len(self._armed)
+
+    def arm(self, task_id: int, kind: TimerKind, fire_at: datetime | None) -> None:
+        """Set (or with None, cancel) one timer."""
+        key = (task_id, kind)
+        if fire_at is None:
+            self._armed.pop(key, None)
+            return
+        fire_at = _get_working_hours().get_next_working_time(_aware(fire_at))
+        if self._armed.get(key) == fire_at:
+            return
+        self._armed[key] = fire_at
+        heapq.heappush(self._heap, (fire_at, task_id, kind))
+        if self._heap[0][0] == fire_at:
+            self._wakeup.set()  # New earliest timer
+        if len(self._heap) > 2 * len(self._armed) + 1024:
+            self._compact()
+
+    def apply(self, state: TimerState, now: datetime | None = None) -> None:
+        """Arm or cancel both timers of a task from its current state."""
+        now = now or datetime.now(TIMEZONE)
+        active = state.group_id is not None and state.status in REMINDABLE_STATUSES
+        due_date = _aware(state.due_date) if active else None
+        reminder = _aware(state.next_reminder_at) if active else None
+        if due_date is not None and due_date <= now:
+            reminder = None  # The overdue notice replaces reminders
+        self.arm(state.task_id, TimerKind.REMINDER, reminder)
+        self.arm(state.task_id, TimerKind.DEADLINE, due_date)
+
+    def cancel(self, task_id: int) -> None:
+        """Drop all timers of a task."""
+        for kind in TimerKind:
+            self._armed.pop((task_id, kind), None)
+
+    def changed(self, task_ids) -> None:
+        """Re-read these tasks from the database before firing anything else."""
+        self._changed.update(task_ids)
+        self._wakeup.set()
+
+    def committed(self, states) -> None:
+        """Apply task states just committed in this process."""
+        if self._loading:
+            # A row the reload reads later may predate this commit
+            self.changed(state.task_id for state in states)
+            return
+        now = datetime.now(TIMEZONE)
+        for state in states:
+            self.apply(state, now)
+
+    def _compact(self) -> None:
+        self._heap = [
+            (fire_at, task_id, kind)
+            for (task_id, kind), fire_at in self._armed.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _pop_due(self, now: datetime) -> dict[TimerKind, list[int]]:
+        due: dict[TimerKind, list[int]] = {}
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, task_id, kind = heapq.heappop(self._heap)
+            if self._armed.get((task_id, kind)) != fire_at:
+                continue  # Re-armed or cancelled since
+            del self._armed[(task_id, kind)]
+            due.setdefault(kind, []).append(task_id)
+        return due
+
+    async def load(self) -> None:
+        """Rebuild all timers from the database."""
+        query = select(*_STATE_COLUMNS).where(
+            Task.group_id.isnot(None),
+            status_in(*REMINDABLE_STATUSES),
+            or_(Task.next_reminder_at.isnot(None), Task.due_date.isnot(None)),
+        )
+        self._heap, self._armed = [], {}
+        self._changed.clear()  # The reload reads them anyway
+        now = datetime.now(TIMEZONE)
+        self._loading = True
+        try:
+            async with self._session_factory() as session:
+                result = await session.stream(query)
+                async for rows in result.partitions(_LOAD_CHUNK):
+                    for row in rows:
+                        self.apply(TimerState(*row), now)
+                    await asyncio.sleep(0)  # Let updates run between chunks
+        finally:
+            self._loading = False
+        self._wakeup.set()
+        logger.info(f"Timer engine loaded {len(self)} timers")
+
+    async def _refresh(self, task_ids: set[int]) -> set[int]:
+        """Re-read tasks and arm them from their current state.
+
+        Returns the ids that still exist; timers of the others are dropped.
+        """
+        now = datetime.now(TIMEZONE)
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(*_STATE_COLUMNS).where(Task.id.in_(task_ids))
+            )
+            found = set()
+            for row in result:
+                state = TimerState(*row)
+                found.add(state.task_id)
+                self.apply(state, now)
+        for task_id in task_ids - found:
+            self.cancel(task_id)
+        return found
+
+    async def _rearm(self, task_ids: set[int]) -> None:
+        """Re-read fired tasks and arm whatever they need next."""
+        found = await self._refresh(task_ids)
+        now = datetime.now(TIMEZONE)
+        for task_id in found:
+            for kind in TimerKind:
+                fire_at = self._armed.get((task_id, kind))
+                if fire_at is not None and fire_at <= now:
+                    self.arm(task_id, kind, now + _RETRY_DELAY)
+
+    async def _fire(self, due: dict[TimerKind, list[int]]) -> None:
+        jobs = _get_jobs()
+        try:
+            # Deadlines first: an overdue task must not get a last reminder
+            if TimerKind.DEADLINE in due:
+                await jobs.check_overdue_tasks(task_ids=due[TimerKind.DEADLINE])
+            if TimerKind.REMINDER in due:
+                await jobs.process_group_reminders(task_ids=due[TimerKind.REMINDER])
+        except Exception as e:
+            logger.exception(f"Timer engine job failed: {e}")
+        await self._rearm({task_id for ids in due.values() for task_id in ids})
+
+    async def _listen(self) -> None:
+        """Feed task ids published by other processes into changed()."""
+        resubscribe = False
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                if resubscribe:
+                    # Changes published while unsubscribed are lost
+                    self._reload = True
+                    self._wakeup.set()
+                self._subscribed.set()
+                while True:
+                    # The timeout lets health checks notice a dead connection
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=30
+                    )
+                    if message:
+                        self.changed(json.loads(message["data"]))
+            except (RedisError, OSError, ValueError) as e:
+                logger.warning(f"Timer engine change channel failed: {e}")
+            finally:
+                await pubsub.aclose()
+            resubscribe = True
+            await asyncio.sleep(_RESUBSCRIBE_DELAY)
+
+    async def _run(self) -> None:
+        if self._listener is not None:
+            # Subscribe before the first load so no change falls in between
+            try:
+                await asyncio.wait_for(self._subscribed.wait(), _RESUBSCRIBE_DELAY)
+            except TimeoutError:
+                logger.warning("Timer engine starting before its change channel is up")
+        next_resync = datetime.now(TIMEZONE)
+        while True:
+            try:
+                now = datetime.now(TIMEZONE)
+                if self._reload or now >= next_resync:
+                    self._reload = False
+                    await self.load()
+                    next_resync = now + self.resync_interval
+                    continue
+                if self._changed:
+                    task_ids, self._changed = self._changed, set()
+                    await self._refresh(task_ids)
+                    continue
+                due = self._pop_due(now)
+                if due:
+                    await self._fire(due)
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Timer engine error: {e}")
+                await asyncio.sleep(_RETRY_DELAY.total_seconds())
+                continue
+
+            wake_at = next_resync
+            if self._heap:
+                wake_at = min(wake_at, self._heap[0][0])
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), (wake_at - now).total_seconds()
+                )
+            except TimeoutError:
+                pass
+
+    def start(self, session_factory, redis: Redis | None = None) -> None:
+        """Load timers and start firing them in the background.
+
+        Subscribes to TIMER_ENGINE_CHANNEL (on redis, or a connection to
+        REDIS_URL) unless the channel is empty.
+        """
+        self._session_factory = session_factory
+        if self._task is not None:
+            return
+        if self.channel:
+            self._redis = redis or self._redis or Redis.from_url(
+                settings.REDIS_URL, socket_connect_timeout=5, health_check_interval=30
+            )
+            self._subscribed.clear()
+            self._listener = asyncio.create_task(self._listen())
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the engine."""
+        for task in (self._listener, self._task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = self._listener = None
+
+
+_instance: TimerEngine | None = None
+
+
+def get_timer_engine() -> TimerEngine:
+    """Get process-wide timer engine."""
+    global _instance
+    if _instance is None:
+        _instance = TimerEngine()
+    return _instance
+
+
+class TimerNotifier:
+    """Publishes ids of changed tasks to the engine in another process.
+
+    Publishing happens in the background, coalescing everything committed
+    while a publish is in flight into the next message. A lost message
+    only delays the change until the engine's next full reload.
+    """
+
+    def __init__(self, redis: Redis | None = None, channel: str = settings.TIMER_ENGINE_CHANNEL):
+        self._redis = redis
+        self.channel = channel
+        self._pending: set[int] = set()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def redis(self) -> Redis:
+        if self._redis is None:
+            self._redis = Redis.from_url(
+                settings.REDIS_URL, socket_timeout=5, socket_connect_timeout=5
+            )
+        return self._redis
+
+    def notify(self, task_ids) -> None:
+        """Publish these task ids soon."""
+        self._pending.update(task_ids)
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._publish())
+
+    async def _publish(self) -> None:
+        while self._pending:
+            batch, self._pending = sorted(self._pending), set()
+            try:
+                await self.redis.publish(self.channel, json.dumps(batch))
+            except RedisError as e:
+                logger.warning(f"Failed to publish timer changes of {len(batch)} tasks: {e}")
+
+    async def close(self) -> None:
+        """Publish what is pending."""
+        if self._task:
+            await self._task
+            self._task = None
+
+
+_notifier: TimerNotifier | None = None
+
+
+def get_timer_notifier() -> TimerNotifier:
+    """Get process-wide timer change publisher."""
+    global _notifier
+    if _notifier is None:
+        _notifier = TimerNotifier()
+    return _notifier
+
+
+def track(session: AsyncSession, *tasks: Task | TimerState) -> None:
+    """Re-arm the tasks' timers once session commits.
+
+    Arming before commit could fire a timer whose job can't see the
+    change yet; after a rollback nothing is armed. When the engine runs
+    in another process the ids are published to it instead.
+    """
+    if not settings.TIMER_ENGINE_ENABLED:
+        return
+    if not (_instance is not None and _instance.running) and not settings.TIMER_ENGINE_CHANNEL:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for task in tasks:
+        state = task if isinstance(task, TimerState) else TimerState.of(task)
+        pending[state.task_id] = state
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    if _instance is not None and _instance.running:
+        _instance.committed(pending.values())
+    elif settings.TIMER_ENGINE_CHANNEL:
+        get_timer_notifier().notify(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
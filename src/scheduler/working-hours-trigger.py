@@ -0,0 +1,54 @@
+# src/scheduler/working-hours-trigger.py
+"""APScheduler trigger that only fires inside working hours."""
+import importlib
+from datetime import datetime, timedelta
+
+from apscheduler.triggers.base import BaseTrigger
+
+
+def _get_working_hours():
+    """Lazy import working hours module."""
+    return importlib.import_module("src.services.working-hours")
+
+
+class WorkingHoursTrigger(BaseTrigger):
+    """Fires every interval, but only during working periods.
+
+    A fire time that lands in the lunch break, after hours or on a
+    non-working day is pushed to the start of the next working period
+    when it is computed, so the scheduler doesn't wake up at all
+    overnight or on weekends.
+    """
+
+    __slots__ = ("interval",)
+
+    def __init__(self, minutes: int = 0, seconds: int = 0):
+        self.interval = timedelta(minutes=minutes, seconds=seconds)
+        if self.interval <= timedelta(0):
+            raise ValueError("interval must be positive")
+
+    def get_next_fire_time(
+        self, previous_fire_time: datetime | None, now: datetime
+    ) -> datetime:
+        if previous_fire_time is None:
+            candidate = now
+        else:
+            candidate = previous_fire_time + self.interval
+        return _get_working_hours().get_next_working_time(candidate)
+
+    def __getstate__(self):
+        return {"version": 1, "interval": self.interval}
+
+    def __setstate__(self, state):
+        if state.get("version", 1) > 1:
+            raise ValueError(
+                f"Got serialized data for version {state['version']} of "
+                f"{self.__class__.__name__}, but only version 1 can be handled"
+            )
+        self.interval = state["interval"]
+
+    def __str__(self):
+        return f"working_hours[{self.interval!s}]"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} (interval={self.interval!r})>"
@@ -5,9 +5,29 @@ import importlib
 # Import using importlib for kebab-case files
 _task_service = importlib.import_module("src.services.task-service")
 _api_client = importlib.import_module("src.services.api-client")
+_user_cache = importlib.import_module("src.services.user-cache")
+_rate_limiter = importlib.import_module("src.services.rate-limiter")
+_group_dashboard = importlib.import_module("src.services.group-dashboard")
+_update_dedup = importlib.import_module("src.services.update-dedup")
 from .notification import NotificationService
 
 TaskService = _task_service.TaskService
 APIClient = _api_client.APIClient
+UserProfileCache = _user_cache.UserProfileCache
+get_user_cache = _user_cache.get_user_cache
+MemoryRateLimiter = _rate_limiter.MemoryRateLimiter
+RedisRateLimiter = _rate_limiter.RedisRateLimiter
+create_rate_limiter = _rate_limiter.create_rate_limiter
+GroupDashboard = _group_dashboard.GroupDashboard
+get_group_dashboard = _group_dashboard.get_group_dashboard
+MemoryUpdateDedup = _update_dedup.MemoryUpdateDedup
+RedisUpdateDedup = _update_dedup.RedisUpdateDedup
+create_update_dedup = _update_dedup.create_update_dedup
 
-__all__ = ["TaskService", "APIClient", "NotificationService"]
+__all__ = [
+    "TaskService", "APIClient", "NotificationService",
+    "UserProfileCache", "get_user_cache",
+    "MemoryRateLimiter", "RedisRateLimiter", "create_rate_limiter",
+    "GroupDashboard", "get_group_dashboard",
+    "MemoryUpdateDedup", "RedisUpdateDedup", "create_update_dedup",
+]
@@ -0,0 +1,200 @@
+# src/services/group-dashboard.py
+"""Pinned per-group task dashboard, edited in place."""
+import asyncio
+import html
+import importlib
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
+from cachetools import LRUCache
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core import clock
+from src.core.config import settings
+from src.database.models.task import TaskStatus
+from src.database.repositories import GroupSettingsRepository
+
+MESSAGE_LIMIT = 4096
+_PENDING_KEY = "group_dashboard_pending"
+
+# Section order and headings
+_SECTIONS = (
+    (TaskStatus.OVERDUE, "🚨 Overdue"),
+    (TaskStatus.SUBMITTED, "📝 Waiting for review"),
+    (TaskStatus.IN_PROGRESS, "🔵 In progress"),
+    (TaskStatus.PENDING, "⏳ Pending"),
+)
+
+
+def _get_group_task_service():
+    """Lazy import GroupTaskService class."""
+    return importlib.import_module("src.services.group-task-service").GroupTaskService
+
+
+def _outbound():
+    """Lazy import outbound dispatcher module."""
+    return importlib.import_module("src.bot.middlewares.outbound-dispatcher")
+
+
+def render_dashboard(counts: dict[TaskStatus, int], rows) -> str:
+    """Dashboard body (without the update time) for a group's active tasks."""
+    lines = ["📌 <b>Task Dashboard</b>"]
+    if not counts:
+        lines.append("\nNo active tasks.")
+    for status, heading in _SECTIONS:
+        total = counts.get(status, 0)
+        if not total:
+            continue
+        lines.append(f"\n<b>{heading} ({total})</b>")
+        shown = [row for row in rows if row.status == status]
+        for row in shown:
+            title = html.escape(row.title[:60])
+            line = f'• #{row.id} {title} <a href="tg://user?id={row.assignee_id}">👤</a>'
+            if row.due_date:
+                line += f" 📅 {row.due_date.strftime('%d/%m %H:%M')}"
+            lines.append(line)
+        if total > len(shown):
+            lines.append(f"… +{total - len(shown)} more")
+
+    text = "\n".join(lines)
+    if len(text) > MESSAGE_LIMIT - 64:
+        text = text[:MESSAGE_LIMIT - 64].rsplit("\n", 1)[0] + "\n…"
+    return text
+
+
+def dashboard_text(body: str) -> str:
+    """Full dashboard message: body plus the time it was rendered."""
+    updated = clock.now().strftime("%d/%m %H:%M")
+    return f"{body}\n\n<i>Updated {updated}</i>"
+
+
+class GroupDashboard:
+    """Keeps each opted-in group's pinned dashboard message current.
+
+    Task changes only mark a group dirty. The first mark schedules one
+    refresh DASHBOARD_DEBOUNCE_SECONDS later and further marks in that
+    window are absorbed, so a burst of changes costs one query and one
+    edit_message_text. Edits whose content didn't change are skipped.
+    """
+
+    def __init__(self, debounce_seconds: float = settings.DASHBOARD_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self._bot: Bot | None = None
+        self._session_factory = None
+        self._scheduled: dict[int, asyncio.TimerHandle] = {}
+        self._refreshing: set[asyncio.Task] = set()
+        # Last rendered body per group, to skip no-op edits
+        self._rendered: LRUCache = LRUCache(maxsize=10_000)
+
+    @property
+    def configured(self) -> bool:
+        return self._bot is not None
+
+    def configure(self, bot: Bot, session_factory) -> None:
+        """Set bot and session factory (called during app startup)."""
+        self._bot = bot
+        self._session_factory = session_factory
+
+    def mark_dirty(self, group_id: int) -> None:
+        """Refresh the group's dashboard after the debounce delay."""
+        if not self.configured or group_id in self._scheduled:
+            return
+        loop = asyncio.get_running_loop()
+        self._scheduled[group_id] = loop.call_later(
+            self.debounce_seconds, self._start_refresh, group_id
+        )
+
+    def _start_refresh(self, group_id: int) -> None:
+        self._scheduled.pop(group_id, None)
+        task = asyncio.get_running_loop().create_task(self.refresh(group_id))
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def refresh(self, group_id: int, force: bool = False) -> None:
+        """Re-render the group's dashboard and edit it if anything changed."""
+        async with self._session_factory() as session:
+            message_id = await GroupSettingsRepository(session).get_dashboard_message_id(group_id)
+            if message_id is None:
+                return
+            counts, rows = await _get_group_task_service()(session).get_dashboard_tasks(
+                group_id, settings.DASHBOARD_TASKS_PER_STATUS
+            )
+
+        body = render_dashboard(counts, rows)
+        if not force and self._rendered.get((group_id, message_id)) == body:
+            return
+        outbound = _outbound()
+        try:
+            with outbound.send_priority(outbound.SendPriority.NOTICE):
+                await self._bot.edit_message_text(
+                    text=dashboard_text(body),
+                    chat_id=group_id,
+                    message_id=message_id,
+                    parse_mode="HTML",
+                )
+        except TelegramBadRequest as e:
+            if "message is not modified" in e.message:
+                self._rendered[(group_id, message_id)] = body
+                return
+            # Dashboard deleted or no longer editable: stop maintaining it
+            logger.warning(f"Dashboard for group {group_id} disabled: {e.message}")
+            await self._disable(group_id)
+        except TelegramForbiddenError as e:
+            logger.warning(f"Dashboard for group {group_id} disabled: {e.message}")
+            await self._disable(group_id)
+        except Exception as e:
+            logger.error(f"Failed to refresh dashboard for group {group_id}: {e}")
+        else:
+            self._rendered[(group_id, message_id)] = body
+
+    def remember(self, group_id: int, message_id: int, body: str) -> None:
+        """Record a freshly posted dashboard so an identical refresh is skipped."""
+        self._rendered[(group_id, message_id)] = body
+
+    async def _disable(self, group_id: int) -> None:
+        async with self._session_factory() as session:
+            await GroupSettingsRepository(session).set_dashboard_message(group_id, None)
+            await session.commit()
+
+    async def close(self) -> None:
+        """Drop scheduled refreshes and wait for running ones."""
+        for handle in self._scheduled.values():
+            handle.cancel()
+        self._scheduled.clear()
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing, return_exceptions=True)
+
+
+_instance: GroupDashboard | None = None
+
+
+def get_group_dashboard() -> GroupDashboard:
+    """Get process-wide group dashboard."""
+    global _instance
+    if _instance is None:
+        _instance = GroupDashboard()
+    return _instance
+
+
+def touch(session: AsyncSession, *group_ids: int | None) -> None:
+    """Mark groups' dashboards dirty once session commits."""
+    if _instance is None or not _instance.configured:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    pending.update(group_id for group_id in group_ids if group_id is not None)
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending and _instance is not None:
+        for group_id in pending:
+            _instance.mark_dirty(group_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
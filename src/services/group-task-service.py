@@ -1,18 +1,50 @@
 # src/services/group-task-service.py
 """Business logic for group task management."""
-from datetime import datetime, timedelta
+import importlib
+from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, and_
+from sqlalchemy import Row, func, insert, select, update, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import clock
 from src.core.config import settings
+from src.core.constants import TASK_LIST_PAGE_SIZE
 from src.core.exceptions import TaskNotFoundError, ValidationError
-from src.database.models.task import Task, TaskStatus, TaskPriority
+from src.database.models.task import (
+    OPEN_STATUSES, REMINDABLE_STATUSES, Task, TaskStatus, TaskPriority,
+    next_reminder_time, status_in
+)
+from src.database.repositories.keyset import Cursor, Page, fetch_page
+
+timer_engine = importlib.import_module("src.scheduler.timer-engine")
+group_dashboard = importlib.import_module("src.services.group-dashboard")
 
 TIMEZONE = ZoneInfo(settings.TIMEZONE)
 
 
+def _validate_title(title: str) -> str:
+    """Strip and validate task title."""
+    title = title.strip()
+    if not title:
+        raise ValidationError("title", "Title cannot be empty")
+    if len(title) > 255:
+        raise ValidationError("title", "Title too long (max 255 chars)")
+    return title
+
+
+def _validate_interval(
+    reminder_interval_minutes: int | None, field: str = "reminder_interval_minutes"
+) -> None:
+    """Enforce minimum recurring reminder interval."""
+    if reminder_interval_minutes is not None:
+        if reminder_interval_minutes < settings.MIN_REMINDER_INTERVAL:
+            raise ValidationError(
+                field,
+                f"Minimum interval is {settings.MIN_REMINDER_INTERVAL} minutes"
+            )
+
+
 class GroupTaskService:
     """Business logic for group task operations."""
 
@@ -40,20 +72,8 @@ class GroupTaskService:
             due_date: Optional deadline
             reminder_interval_minutes: Recurring reminder interval
         """
-        # Validate title
-        title = title.strip()
-        if not title:
-            raise ValidationError("title", "Title cannot be empty")
-        if len(title) > 255:
-            raise ValidationError("title", "Title too long (max 255 chars)")
-
-        # Validate reminder interval
-        if reminder_interval_minutes is not None:
-            if reminder_interval_minutes < settings.MIN_REMINDER_INTERVAL:
-                raise ValidationError(
-                    "reminder_interval_minutes",
-                    f"Minimum interval is {settings.MIN_REMINDER_INTERVAL} minutes"
-                )
+        title = _validate_title(title)
+        _validate_interval(reminder_interval_minutes)
 
         task = Task(
             user_id=assignee_id,  # Owner is assignee
@@ -67,38 +87,159 @@ class GroupTaskService:
             status=TaskStatus.PENDING,
             priority=TaskPriority.MEDIUM,
         )
+        task.reschedule_reminder(clock.now())
         self.session.add(task)
         await self.session.flush()
+        timer_engine.track(self.session, task)
+        group_dashboard.touch(self.session, task.group_id)
         return task
 
+    async def create_group_tasks_bulk(
+        self,
+        group_id: int,
+        items: list[tuple[str, int]],
+        assigned_by_id: int,
+        due_date: datetime | None = None,
+        reminder_interval_minutes: int | None = None,
+    ) -> list[int]:
+        """Create many group tasks with one multi-row INSERT ... RETURNING.
+
+        All rows are validated before anything is written, so a bad line
+        rejects the whole batch.
+
+        Args:
+            group_id: Telegram group/chat ID
+            items: (title, assignee_id) pairs, one per task
+            assigned_by_id: Admin user ID who created the tasks
+            due_date: Optional deadline applied to every task
+            reminder_interval_minutes: Optional interval applied to every task
+
+        Returns:
+            IDs of the created tasks
+        """
+        if not items:
+            raise ValidationError("items", "No tasks to create")
+        _validate_interval(reminder_interval_minutes)
+        next_reminder_at = next_reminder_time(
+            TaskStatus.PENDING, group_id, reminder_interval_minutes, None,
+            clock.now(),
+        )
+
+        rows = []
+        for line_no, (title, assignee_id) in enumerate(items, 1):
+            try:
+                title = _validate_title(title)
+            except ValidationError as e:
+                raise ValidationError("title", f"line {line_no}: {e.reason}") from e
+            rows.append({
+                "user_id": assignee_id,  # Owner is assignee
+                "group_id": group_id,
+                "assignee_id": assignee_id,
+                "assigned_by_id": assigned_by_id,
+                "title": title,
+                "due_date": due_date,
+                "reminder_interval_minutes": reminder_interval_minutes,
+                "next_reminder_at": next_reminder_at,
+                "status": TaskStatus.PENDING,
+                "priority": TaskPriority.MEDIUM,
+            })
+
+        result = await self.session.execute(
+            insert(Task).values(rows).returning(Task.id)
+        )
+        task_ids = list(result.scalars().all())
+        timer_engine.track(self.session, *(
+            timer_engine.TimerState(
+                task_id, TaskStatus.PENDING, group_id, next_reminder_at, due_date
+            )
+            for task_id in task_ids
+        ))
+        group_dashboard.touch(self.session, group_id)
+        return task_ids
+
     async def get_group_tasks(
-        self, group_id: int, status: TaskStatus | None = None
-    ) -> list[Task]:
-        """Get all tasks for a group, optionally filtered by status."""
+        self,
+        group_id: int,
+        status: TaskStatus | None = None,
+        limit: int = TASK_LIST_PAGE_SIZE,
+        cursor: Cursor | None = None,
+        backward: bool = False,
+    ) -> Page:
+        """Get one page of group tasks, optionally filtered by status.
+
+        Args:
+            group_id: Telegram group/chat ID
+            status: Optional status filter
+            limit: Page size
+            cursor: (created_at, id) boundary from a previous page
+            backward: True to page towards newer tasks
+        """
         query = select(Task).where(Task.group_id == group_id)
         if status:
             query = query.where(Task.status == status)
-        query = query.order_by(Task.created_at.desc())
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return await fetch_page(self.session, query, limit, cursor, backward)
 
-    async def get_user_tasks(self, user_id: int, group_id: int | None = None) -> list[Task]:
-        """Get tasks assigned to a user.
+    async def get_user_tasks(
+        self,
+        user_id: int,
+        group_id: int | None = None,
+        limit: int = TASK_LIST_PAGE_SIZE,
+        cursor: Cursor | None = None,
+        backward: bool = False,
+    ) -> Page:
+        """Get one page of open tasks assigned to a user.
 
         Args:
             user_id: User ID
             group_id: Optional - filter by specific group
+            limit: Page size
+            cursor: (created_at, id) boundary from a previous page
+            backward: True to page towards newer tasks
         """
         query = select(Task).where(Task.assignee_id == user_id)
         if group_id:
             query = query.where(Task.group_id == group_id)
         # Only active tasks (not completed/cancelled)
-        query = query.where(
-            Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.SUBMITTED])
+        query = query.where(status_in(*OPEN_STATUSES))
+        return await fetch_page(self.session, query, limit, cursor, backward)
+
+    async def get_dashboard_tasks(
+        self, group_id: int, per_status: int = 15
+    ) -> tuple[dict[TaskStatus, int], list[Row]]:
+        """Active task counts per status plus the oldest rows of each status.
+
+        Both queries run on ix_tasks_group_status_created and only read the
+        columns the dashboard shows.
+
+        Returns:
+            (counts by status, rows with id, title, status, assignee_id, due_date)
+        """
+        active = (
+            Task.group_id == group_id,
+            status_in(*OPEN_STATUSES, TaskStatus.OVERDUE),
         )
-        query = query.order_by(Task.created_at.desc())
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        counts = await self.session.execute(
+            select(Task.status, func.count()).where(*active).group_by(Task.status)
+        )
+        ranked = (
+            select(
+                Task.id, Task.title, Task.status, Task.assignee_id, Task.due_date,
+                func.row_number().over(
+                    partition_by=Task.status, order_by=(Task.created_at, Task.id)
+                ).label("rank"),
+            )
+            .where(*active)
+            .subquery()
+        )
+        rows = await self.session.execute(
+            select(
+                ranked.c.id, ranked.c.title, ranked.c.status,
+                ranked.c.assignee_id, ranked.c.due_date,
+            )
+            .where(ranked.c.rank <= per_status)
+            .order_by(ranked.c.rank)
+        )
+        return dict(counts.all()), list(rows.all())
 
     async def get_task_by_id(self, task_id: int, group_id: int | None = None) -> Task | None:
         """Get task by ID, optionally verify group ownership."""
@@ -129,8 +270,11 @@ class GroupTaskService:
             )
 
         task.status = TaskStatus.SUBMITTED
-        task.submitted_at = datetime.now(TIMEZONE)
+        task.submitted_at = clock.now()
+        task.reschedule_reminder(task.submitted_at)
         await self.session.flush()
+        timer_engine.track(self.session, task)
+        group_dashboard.touch(self.session, task.group_id)
         return task
 
     async def verify_task(self, task_id: int, admin_id: int) -> Task:
@@ -151,12 +295,15 @@ class GroupTaskService:
             )
 
         task.status = TaskStatus.COMPLETED
-        task.verified_at = datetime.now(TIMEZONE)
+        task.verified_at = clock.now()
         task.verified_by_id = admin_id
         # Clear reminders
         task.reminder_interval_minutes = None
         task.last_reminder_sent = None
+        task.next_reminder_at = None
         await self.session.flush()
+        timer_engine.track(self.session, task)
+        group_dashboard.touch(self.session, task.group_id)
         return task
 
     async def reject_task(self, task_id: int, admin_id: int) -> Task:
@@ -178,7 +325,10 @@ class GroupTaskService:
 
         task.status = TaskStatus.IN_PROGRESS
         task.submitted_at = None
+        task.reschedule_reminder(clock.now())
         await self.session.flush()
+        timer_engine.track(self.session, task)
+        group_dashboard.touch(self.session, task.group_id)
         return task
 
     async def reassign_task(
@@ -205,7 +355,10 @@ class GroupTaskService:
         task.user_id = new_assignee_id  # Update owner too
         task.status = TaskStatus.PENDING  # Reset status
         task.submitted_at = None
+        task.reschedule_reminder(clock.now())
         await self.session.flush()
+        timer_engine.track(self.session, task)
+        group_dashboard.touch(self.session, task.group_id)
         return task
 
     async def update_reminder_interval(
@@ -216,14 +369,12 @@ class GroupTaskService:
         if not task:
             raise TaskNotFoundError(task_id)
 
-        if interval_minutes < settings.MIN_REMINDER_INTERVAL:
-            raise ValidationError(
-                "interval_minutes",
-                f"Minimum interval is {settings.MIN_REMINDER_INTERVAL} minutes"
-            )
+        _validate_interval(interval_minutes, "interval_minutes")
 
         task.reminder_interval_minutes = interval_minutes
+        task.reschedule_reminder(clock.now())
         await self.session.flush()
+        timer_engine.track(self.session, task)
         return task
 
     async def update_task(
@@ -241,54 +392,125 @@ class GroupTaskService:
             raise TaskNotFoundError(task_id)
 
         if title is not None:
-            title = title.strip()
-            if not title:
-                raise ValidationError("title", "Title cannot be empty")
-            if len(title) > 255:
-                raise ValidationError("title", "Title too long (max 255 chars)")
-            task.title = title
+            task.title = _validate_title(title)
 
         if due_date is not None:
             task.due_date = due_date
 
         await self.session.flush()
+        timer_engine.track(self.session, task)
+        group_dashboard.touch(self.session, task.group_id)
         return task
 
-    async def get_tasks_needing_reminder(self) -> list[Task]:
+    async def get_tasks_needing_reminder(
+        self, now: datetime | None = None, task_ids: list[int] | None = None
+    ) -> list[Task]:
         """Get group tasks that need reminder sent.
 
-        Criteria:
-        - Has group_id (is group task)
-        - Has reminder_interval_minutes set
-        - Status is PENDING or IN_PROGRESS
-        - Either never reminded, or last_reminder_sent + interval has passed
+        One range scan on next_reminder_at, which is only set for active
+        group tasks with an interval. Tasks past their deadline are left
+        to the overdue sweep.
+
+        Args:
+            now: Reference time (defaults to now)
+            task_ids: Only consider these tasks (timer engine)
         """
-        now = datetime.now(TIMEZONE)
-        query = select(Task).where(
-            Task.group_id.isnot(None),
-            Task.reminder_interval_minutes.isnot(None),
-            Task.status.in_([TaskStatus.PENDING, TaskStatus.IN_PROGRESS])
+        now = now or clock.now()
+        query = (
+            select(Task)
+            .where(
+                Task.next_reminder_at <= now,
+                status_in(*REMINDABLE_STATUSES),
+                (Task.due_date.is_(None)) | (Task.due_date > now),
+            )
+            .order_by(Task.next_reminder_at)
         )
+        if task_ids is not None:
+            query = query.where(Task.id.in_(task_ids))
         result = await self.session.execute(query)
-        tasks = list(result.scalars().all())
-
-        # Filter by interval
-        due_tasks = []
-        for task in tasks:
-            if task.last_reminder_sent is None:
-                due_tasks.append(task)
-            else:
-                next_reminder = task.last_reminder_sent + timedelta(
-                    minutes=task.reminder_interval_minutes
-                )
-                if now >= next_reminder:
-                    due_tasks.append(task)
-
-        return due_tasks
+        return list(result.scalars().all())
+
+    async def get_upcoming_group_reminders(
+        self, group_ids: set[int], now: datetime, until: datetime
+    ) -> list[Task]:
+        """Get group tasks whose reminder falls due between now and until.
+
+        Lets a digest pick up reminders due shortly after the current
+        cycle, so a group's reminders converge on one message per cycle.
+        """
+        if not group_ids:
+            return []
+        result = await self.session.execute(
+            select(Task)
+            .where(
+                Task.group_id.in_(group_ids),
+                Task.next_reminder_at > now,
+                Task.next_reminder_at <= until,
+                status_in(*REMINDABLE_STATUSES),
+                (Task.due_date.is_(None)) | (Task.due_date > now),
+            )
+            .order_by(Task.next_reminder_at)
+        )
+        return list(result.scalars().all())
+
+    async def mark_overdue_batch(
+        self, now: datetime, limit: int = 500, task_ids: list[int] | None = None
+    ) -> list[Row]:
+        """Flip up to limit past-deadline active group tasks to OVERDUE.
+
+        Runs as one UPDATE ... WHERE id IN (SELECT ... LIMIT) RETURNING, so
+        no ORM objects are loaded and the row locks are held only for the
+        statement. Reminders are cleared - the overdue notice is the last one.
+
+        Args:
+            now: Reference time
+            limit: Max rows per statement
+            task_ids: Only consider these tasks (timer engine)
+
+        Returns:
+            Rows with id, title, group_id, assignee_id, assigned_by_id, due_date
+        """
+        due_ids = (
+            select(Task.id)
+            .where(
+                Task.group_id.isnot(None),
+                Task.due_date.isnot(None),
+                Task.due_date < now,
+                status_in(*REMINDABLE_STATUSES),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if task_ids is not None:
+            due_ids = due_ids.where(Task.id.in_(task_ids))
+        stmt = (
+            update(Task)
+            .where(Task.id.in_(due_ids))
+            .values(
+                status=TaskStatus.OVERDUE,
+                reminder_interval_minutes=None,
+                next_reminder_at=None,
+            )
+            .returning(
+                Task.id, Task.title, Task.group_id, Task.assignee_id,
+                Task.assigned_by_id, Task.due_date,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        rows = list(result.all())
+        timer_engine.track(self.session, *(
+            timer_engine.TimerState(row.id, TaskStatus.OVERDUE, row.group_id, None, row.due_date)
+            for row in rows
+        ))
+        group_dashboard.touch(self.session, *{row.group_id for row in rows})
+        return rows
 
     async def mark_reminder_sent(self, task_id: int) -> None:
         """Update last_reminder_sent timestamp."""
         task = await self.get_task_by_id(task_id)
         if task:
-            task.last_reminder_sent = datetime.now(TIMEZONE)
+            task.last_reminder_sent = clock.now()
+            task.reschedule_reminder(task.last_reminder_sent)
             await self.session.flush()
+            timer_engine.track(self.session, task)
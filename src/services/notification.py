@@ -8,6 +8,14 @@ from src.database.models.task import Task
 from src.core.constants import MSG_TASK_CREATED
 
 
+def format_reminder(title: str, description: str | None = None) -> str:
+    """Markdown text of a personal task reminder."""
+    message = f"Reminder: *{title}*"
+    if description:
+        message += f"\n\n{description}"
+    return message
+
+
 class NotificationService:
     """Service for sending Telegram notifications."""
 
@@ -16,10 +24,7 @@ class NotificationService:
 
     async def send_reminder(self, user_id: int, task: Task) -> bool:
         """Send task reminder to user."""
-        message = f"Reminder: *{task.title}*"
-        if task.description:
-            message += f"\n\n{task.description}"
-        return await self._send(user_id, message)
+        return await self._send(user_id, format_reminder(task.title, task.description))
 
     async def send_task_created(self, user_id: int, task: Task) -> bool:
         """Send task creation confirmation."""
@@ -0,0 +1,220 @@
+# src/services/outbox-relay.py
+"""Relay that delivers queued outbox messages to Telegram."""
+import asyncio
+import importlib
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramBadRequest, TelegramForbiddenError, TelegramMigrateToChat,
+    TelegramNotFound, TelegramRetryAfter
+)
+from loguru import logger
+
+from src.core import clock
+from src.core.config import settings
+from src.database.repositories import OutboxRepository
+
+# Retrying these can't succeed (bot blocked/kicked, chat gone, bad markup)
+_PERMANENT_ERRORS = (
+    TelegramBadRequest, TelegramForbiddenError, TelegramMigrateToChat, TelegramNotFound
+)
+
+
+def _outbound():
+    """Lazy import outbound dispatcher module."""
+    return importlib.import_module("src.bot.middlewares.outbound-dispatcher")
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after the given number of failed attempts."""
+    seconds = settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.OUTBOX_RETRY_MAX_SECONDS))
+
+
+class OutboxRelay:
+    """Drains the outbox in batches, independent of the jobs that fill it.
+
+    Each batch is claimed with a short UPDATE ... RETURNING (SKIP LOCKED,
+    plus a lease so other relays leave it alone) and committed before any
+    message is sent. Only OUTBOX_PER_CHAT messages per chat are kept from
+    a batch; the rest go back for as long as the chat's rate limit needs
+    to send those, so one busy group can't hold up everyone else's
+    messages. Each send is cut off at half the lease and its outcome is
+    written back as soon as it finishes, so nothing is still in flight
+    when another relay could claim it again. A send that timed out waiting
+    for its chat's rate limit goes back without using up an attempt.
+
+    Delivery is at least once: a crash between send and write-back sends
+    that message again after the lease expires. Failed sends back off
+    exponentially up to OUTBOX_MAX_ATTEMPTS.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_seconds: float = settings.OUTBOX_POLL_SECONDS,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        lease_seconds: float = settings.OUTBOX_LEASE_SECONDS,
+        per_chat: int = settings.OUTBOX_PER_CHAT,
+    ):
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self.max_attempts = max_attempts
+        self.lease = timedelta(seconds=lease_seconds)
+        self.send_timeout = lease_seconds / 2
+        self.per_chat = per_chat
+        self._bot: Bot | None = None
+        self._session_factory = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def wake(self) -> None:
+        """Drain now instead of at the next poll."""
+        self._wakeup.set()
+
+    async def _send(self, row, limit: asyncio.Semaphore) -> Exception | None:
+        outbound = _outbound()
+        try:
+            async with limit:
+                with outbound.send_priority(outbound.SendPriority(row.priority)):
+                    await self._bot.send_message(
+                        chat_id=row.chat_id, text=row.text, parse_mode=row.parse_mode
+                    )
+        except Exception as e:
+            return e
+        return None
+
+    async def _deliver(self, row, limit: asyncio.Semaphore) -> bool:
+        """Send one message and write its outcome back. True if sent."""
+        try:
+            error = await asyncio.wait_for(self._send(row, limit), self.send_timeout)
+        except TimeoutError as e:
+            error = e
+
+        now = clock.now()
+        async with self._session_factory() as session:
+            repo = OutboxRepository(session)
+            if error is None:
+                await repo.mark_sent([row.id], now)
+            elif isinstance(error, TimeoutError):
+                # Still waiting for the chat's rate limit, not a failure
+                await repo.defer([row.id], now)
+            elif isinstance(error, _PERMANENT_ERRORS) or row.attempts >= self.max_attempts:
+                logger.error(f"Outbox message {row.id} to {row.chat_id} failed: {error}")
+                await repo.mark_failed(row.id, str(error))
+            else:
+                if isinstance(error, TelegramRetryAfter):
+                    delay = timedelta(seconds=error.retry_after)
+                else:
+                    delay = retry_delay(row.attempts)
+                logger.warning(
+                    f"Outbox message {row.id} to {row.chat_id} failed "
+                    f"(attempt {row.attempts}), retrying in {delay}: {error}"
+                )
+                await repo.mark_retry(row.id, str(error), now + delay)
+            await session.commit()
+        return error is None
+
+    def _spread(self, rows: list, now: datetime) -> tuple[list, dict[datetime, list[int]]]:
+        """Split a batch into rows to send now and rows to put back.
+
+        Returns the rows to send and the ids to put back by the time they
+        are due again: after what the chat's rate limit needs to send the
+        kept ones.
+        """
+        keep, deferred = [], defaultdict(list)
+        per_chat: defaultdict[int, int] = defaultdict(int)
+        for row in rows:
+            per_chat[row.chat_id] += 1
+            if per_chat[row.chat_id] <= self.per_chat:
+                keep.append(row)
+                continue
+            if row.chat_id > 0:
+                pace = self.per_chat / settings.OUTBOUND_PRIVATE_PER_SECOND
+            else:
+                pace = self.per_chat * 60 / settings.OUTBOUND_GROUP_PER_MINUTE
+            deferred[now + timedelta(seconds=pace)].append(row.id)
+        return keep, deferred
+
+    async def drain_once(self) -> int:
+        """Claim and deliver one batch. Returns the number of messages claimed."""
+        now = clock.now()
+        async with self._session_factory() as session:
+            repo = OutboxRepository(session)
+            rows = await repo.claim_batch(now, self.batch_size, self.lease)
+            keep, deferred = self._spread(rows, now)
+            for available_at, ids in deferred.items():
+                await repo.defer(ids, available_at)
+            await session.commit()
+        if not rows:
+            return 0
+
+        # The outbound dispatcher paces these; the semaphore only matters
+        # when it is disabled
+        limit = asyncio.Semaphore(settings.OUTBOUND_WORKERS)
+        results = await asyncio.gather(
+            *(self._deliver(row, limit) for row in keep), return_exceptions=True
+        )
+        for row, result in zip(keep, results):
+            if isinstance(result, Exception):
+                logger.error(f"Outbox message {row.id}: failed to record outcome: {result}")
+
+        sent = sum(result is True for result in results)
+        if sent:
+            logger.info(f"Outbox delivered {sent}/{len(keep)} messages")
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.drain_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Outbox relay error: {e}")
+                claimed = 0
+            if claimed >= self.batch_size:
+                continue  # Backlog: keep draining
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except TimeoutError:
+                pass
+
+    def configure(self, bot: Bot, session_factory) -> None:
+        """Set bot and session factory; enough for drain_once()."""
+        self._bot = bot
+        self._session_factory = session_factory
+
+    def start(self, bot: Bot, session_factory) -> None:
+        """Start draining in the background."""
+        self.configure(bot, session_factory)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the relay; claimed but unsent messages retry after their lease."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_instance: OutboxRelay | None = None
+
+
+def get_outbox_relay() -> OutboxRelay:
+    """Get process-wide outbox relay."""
+    global _instance
+    if _instance is None:
+        _instance = OutboxRelay()
+    return _instance
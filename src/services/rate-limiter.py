@@ -0,0 +1,86 @@
+# src/services/rate-limiter.py
+"""Sliding-window rate limiter backends (in-memory and Redis)."""
+import time
+import uuid
+from collections import deque
+
+from cachetools import TTLCache
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+
+# Sliding window log: drop hits older than the window, then admit the hit
+# only if the window still has room. Uses server TIME so replicas with
+# skewed clocks agree. Returns 0 when admitted, else ms until a slot frees.
+SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return math.max(1, tonumber(oldest[2]) + window - now)
+"""
+
+
+class MemoryRateLimiter:
+    """Per-process sliding-window limiter for single-node deployments."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: int = 3600):
+        self.windows: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def hit(self, key: str, limit: int, period: float) -> float:
+        """Record a hit. Returns 0 if allowed, else seconds to wait."""
+        now = time.monotonic()
+        window = self.windows.get(key)
+        if window is None:
+            window = deque()
+        while window and window[0] <= now - period:
+            window.popleft()
+        if len(window) >= limit:
+            self.windows[key] = window
+            return window[0] + period - now
+        window.append(now)
+        self.windows[key] = window
+        return 0.0
+
+
+class RedisRateLimiter:
+    """Distributed sliding-window limiter using an atomic Lua script."""
+
+    def __init__(self, redis: Redis, prefix: str = "ratelimit"):
+        self.redis = redis
+        self.prefix = prefix
+        self.script = redis.register_script(SLIDING_WINDOW_LUA)
+
+    async def hit(self, key: str, limit: int, period: float) -> float:
+        """Record a hit. Returns 0 if allowed, else seconds to wait.
+
+        Fails open if Redis is unreachable - losing rate limiting is
+        better than dropping every update.
+        """
+        try:
+            wait_ms = await self.script(
+                keys=[f"{self.prefix}:{key}"],
+                args=[int(period * 1000), limit, uuid.uuid4().hex],
+            )
+        except RedisError as e:
+            logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+            return 0.0
+        return int(wait_ms) / 1000
+
+
+def create_rate_limiter(
+    redis: Redis | None = None,
+) -> MemoryRateLimiter | RedisRateLimiter:
+    """Build limiter for RATE_LIMIT_BACKEND ("memory" or "redis")."""
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimiter(redis or Redis.from_url(settings.REDIS_URL))
+    return MemoryRateLimiter()
@@ -0,0 +1,52 @@
+# src/services/task-archive.py
+"""Append task rows to per-day gzip JSONL archives before cleanup."""
+import asyncio
+import enum
+import gzip
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes as ISO strings and plain enums by name."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.name
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def archive_path(directory: str | Path, day: date) -> Path:
+    """Archive file for day, e.g. tasks-2024-05-01.jsonl.gz."""
+    return Path(directory) / f"tasks-{day.isoformat()}.jsonl.gz"
+
+
+def _write_rows(path: Path, rows: list[Mapping[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Append mode adds a new gzip member; readers see one concatenated stream
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(dict(row), default=_json_default, ensure_ascii=False))
+            f.write("\n")
+
+
+async def archive_rows(
+    rows: Iterable[Mapping[str, Any]],
+    directory: str | Path,
+    day: date,
+) -> Path:
+    """Append rows to the day's archive without blocking the event loop.
+
+    Args:
+        rows: Column mappings (e.g. Row._mapping)
+        directory: Archive directory, created if missing
+        day: Day the archive file is named after
+
+    Returns:
+        Path of the archive file
+    """
+    path = archive_path(directory, day)
+    await asyncio.to_thread(_write_rows, path, list(rows))
+    return path
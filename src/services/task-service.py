@@ -56,17 +56,18 @@ class TaskService:
         self,
         user_id: int,
         status: str | None = None,
-        page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: tuple[datetime, int] | None = None,
+        backward: bool = False
     ):
-        """Get paginated tasks for user."""
+        """Get one page of tasks for user (keyset pagination)."""
         status_enum = TaskStatus(status) if status else None
-        offset = (page - 1) * page_size
         return await self.repo.get_all_by_user(
             user_id=user_id,
             status=status_enum,
             limit=page_size,
-            offset=offset
+            cursor=cursor,
+            backward=backward
         )
 
     async def get_task(self, task_id: int, user_id: int):
@@ -81,6 +82,7 @@ class TaskService:
         task = await self.get_task(task_id, user_id)
         task.status = TaskStatus.COMPLETED
         task.reminder_at = None  # Clear reminder
+        task.next_reminder_at = None  # Group tasks completed from /tasks
         return task
 
     async def delete_task(self, task_id: int, user_id: int) -> bool:
@@ -90,6 +92,6 @@ class TaskService:
             raise TaskNotFoundError(task_id)
         return True
 
-    async def get_pending_reminders(self, before: datetime):
-        """Get tasks with reminders due."""
-        return await self.repo.get_due_reminders(before)
+    async def claim_due_reminders(self, now: datetime, limit: int = 500):
+        """Clear and return reminders that are due (see TaskRepository)."""
+        return await self.repo.claim_due_reminders(now, limit)
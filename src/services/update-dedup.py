@@ -0,0 +1,142 @@
+# src/services/update-dedup.py
+"""Seen-update stores for skipping redelivered updates (in-memory and Redis)."""
+from cachetools import TTLCache
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+
+# Raise the floor (never lower it) and refresh its TTL
+ADVANCE_LUA = """
+local floor = redis.call('GET', KEYS[1])
+if not floor or tonumber(floor) < tonumber(ARGV[1]) then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+end
+return 1
+"""
+
+# Seconds before a Redis call counts as failed (and the update is handled)
+_REDIS_TIMEOUT = 1.0
+
+
+class MemoryUpdateDedup:
+    """Per-process store; survives webhook retries but not restarts."""
+
+    def __init__(
+        self,
+        ttl: int = settings.UPDATE_DEDUP_TTL_SECONDS,
+        claim_ttl: int = settings.UPDATE_DEDUP_CLAIM_SECONDS,
+        maxsize: int = 100_000,
+    ):
+        self.seen: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.claims: TTLCache = TTLCache(maxsize=maxsize, ttl=claim_ttl)
+        self._floor: int | None = None
+
+    async def claim(self, key: str) -> bool:
+        """Claim an update. False if it was already handled or is being handled."""
+        if key in self.seen or key in self.claims:
+            return False
+        self.claims[key] = True
+        return True
+
+    async def release(self, key: str) -> None:
+        """Drop a claim so a redelivery of the update is handled again."""
+        self.claims.pop(key, None)
+
+    async def commit(self, key: str) -> None:
+        """Keep a handled update in the seen-set for the full TTL."""
+        self.claims.pop(key, None)
+        self.seen[key] = True
+
+    async def floor(self) -> int | None:
+        """Highest update_id below which every update was handled."""
+        return self._floor
+
+    async def advance_floor(self, update_id: int) -> None:
+        """Raise the floor (it never goes down)."""
+        if self._floor is None or self._floor < update_id:
+            self._floor = update_id
+
+
+class RedisUpdateDedup:
+    """Store shared by all processes and kept across restarts.
+
+    Every call fails open: if Redis is unreachable or slow the update is
+    handled - a rare duplicate is better than stalling or dropping updates.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "dedup",
+        ttl: int = settings.UPDATE_DEDUP_TTL_SECONDS,
+        claim_ttl: int = settings.UPDATE_DEDUP_CLAIM_SECONDS,
+    ):
+        self.redis = redis
+        self.prefix = prefix
+        self.ttl_ms = ttl * 1000
+        self.claim_ttl_ms = claim_ttl * 1000
+        self.advance_script = redis.register_script(ADVANCE_LUA)
+
+    def _seen_key(self, key: str) -> str:
+        return f"{self.prefix}:seen:{key}"
+
+    async def claim(self, key: str) -> bool:
+        """Claim an update. False if it was already handled or is being handled."""
+        try:
+            return bool(await self.redis.set(
+                self._seen_key(key), "claimed", nx=True, px=self.claim_ttl_ms
+            ))
+        except RedisError as e:
+            logger.warning(f"Update dedup unavailable, handling {key}: {e}")
+            return True
+
+    async def release(self, key: str) -> None:
+        """Drop a claim so a redelivery of the update is handled again."""
+        try:
+            await self.redis.delete(self._seen_key(key))
+        except RedisError as e:
+            logger.warning(f"Failed to release update claim {key}: {e}")
+
+    async def commit(self, key: str) -> None:
+        """Keep a handled update in the seen-set for the full TTL."""
+        try:
+            await self.redis.set(self._seen_key(key), "done", px=self.ttl_ms)
+        except RedisError as e:
+            logger.warning(f"Failed to record handled update {key}: {e}")
+
+    async def floor(self) -> int | None:
+        """Highest update_id below which every update was handled."""
+        try:
+            value = await self.redis.get(f"{self.prefix}:floor")
+        except RedisError as e:
+            logger.warning(f"Failed to read update floor: {e}")
+            return None
+        return int(value) if value is not None else None
+
+    async def advance_floor(self, update_id: int) -> None:
+        """Raise the floor (it never goes down)."""
+        try:
+            await self.advance_script(
+                keys=[f"{self.prefix}:floor"], args=[update_id, self.ttl_ms]
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to advance update floor: {e}")
+
+
+def create_update_dedup(
+    redis: Redis | None = None,
+) -> MemoryUpdateDedup | RedisUpdateDedup:
+    """Build store for UPDATE_DEDUP_BACKEND ("memory" or "redis").
+
+    Without a client, the Redis store gets its own with short socket
+    timeouts, so a stalled server delays an update by at most a second.
+    """
+    if settings.UPDATE_DEDUP_BACKEND == "redis":
+        return RedisUpdateDedup(redis or Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=_REDIS_TIMEOUT,
+            socket_connect_timeout=_REDIS_TIMEOUT,
+        ))
+    return MemoryUpdateDedup()
@@ -0,0 +1,132 @@
+# src/services/user-cache.py
+"""In-process user profile cache with write-behind upserts."""
+import asyncio
+
+from aiogram.types import User as TelegramUser
+from cachetools import TTLCache
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.database import UserRepository, async_session_factory
+
+_PENDING_KEY = "user_cache_pending"
+
+
+def _profile(user: TelegramUser) -> dict:
+    """Build users-table row from a Telegram user."""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "language_code": user.language_code or "en",
+    }
+
+
+def _fingerprint(profile: dict) -> tuple:
+    """Fields that get_or_create would refresh on an existing user."""
+    return profile["username"], profile["first_name"], profile["last_name"]
+
+
+class UserProfileCache:
+    """LRU/TTL cache of known user profiles keyed by Telegram ID.
+
+    - Fingerprint unchanged: no DB work at all
+    - Unknown in this process: upserted right away in the update's session,
+      so tasks created in the same update never miss the users row; cached
+      only once that session commits, so a rollback leaves it unknown
+    - Known but changed: buffered and flushed periodically as one
+      multi-row INSERT ... ON CONFLICT DO UPDATE
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        maxsize: int = settings.USER_CACHE_MAXSIZE,
+        ttl: int = settings.USER_CACHE_TTL,
+        flush_interval: float = settings.USER_FLUSH_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.pending: dict[int, dict] = {}
+        self.flush_interval = flush_interval
+        self._task: asyncio.Task | None = None
+
+    async def register(self, session: AsyncSession, user: TelegramUser) -> None:
+        """Record a user seen in an update, touching the DB only if needed."""
+        profile = _profile(user)
+        fingerprint = _fingerprint(profile)
+        cached = self.cache.get(user.id)
+        if cached == fingerprint:
+            return
+
+        if cached is None and user.id not in self.pending:
+            await UserRepository(session).upsert_many([profile])
+            session.info.setdefault(_PENDING_KEY, []).append((self.cache, user.id, fingerprint))
+            return
+        self.pending[user.id] = profile
+        self.cache[user.id] = fingerprint
+
+    async def flush(self) -> int:
+        """Write buffered profile changes. Returns number of rows flushed."""
+        if not self.pending:
+            return 0
+        batch, self.pending = self.pending, {}
+        try:
+            async with self.session_factory() as session:
+                await UserRepository(session).upsert_many(list(batch.values()))
+                await session.commit()
+        except Exception as e:
+            logger.error(f"User profile flush failed: {e}")
+            # Keep newer profiles buffered since the failed batch was taken
+            self.pending = {**batch, **self.pending}
+            return 0
+        return len(batch)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """Start periodic background flushing."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop background flushing and write what is left."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        flushed = await self.flush()
+        if flushed:
+            logger.info(f"Flushed {flushed} user profiles on shutdown")
+
+
+_instance: UserProfileCache | None = None
+
+
+def get_user_cache() -> UserProfileCache:
+    """Get process-wide user profile cache."""
+    global _instance
+    if _instance is None:
+        _instance = UserProfileCache(async_session_factory)
+    return _instance
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed(session: Session) -> None:
+    for cache, user_id, fingerprint in session.info.pop(_PENDING_KEY, ()):
+        cache[user_id] = fingerprint
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
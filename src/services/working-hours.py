@@ -4,6 +4,7 @@ import re
 from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
+from src.core import clock
 from src.core.config import settings
 
 TIMEZONE = ZoneInfo(settings.TIMEZONE)
@@ -18,7 +19,7 @@ def is_working_time(dt: datetime | None = None) -> bool:
     - Weekends (Saturday, Sunday)
     """
     if dt is None:
-        dt = datetime.now(TIMEZONE)
+        dt = clock.now()
 
     # Convert to local timezone if needed
     if dt.tzinfo is None:
@@ -49,7 +50,7 @@ def get_next_working_time(dt: datetime | None = None) -> datetime:
     - Before 8:30 -> 8:30 same day
     """
     if dt is None:
-        dt = datetime.now(TIMEZONE)
+        dt = clock.now()
 
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=TIMEZONE)
@@ -0,0 +1,388 @@
+# src/simulate.py
+"""Scheduler load simulation.
+
+Seeds a database with a synthetic task population, then replays a work
+week of scheduler jobs against it under a virtual clock. Messages go
+through the real outbox and relay to a fake bot that only counts them.
+
+    python -m src.simulate --tasks 100000 --db-url sqlite+aiosqlite:///./sim.db
+
+Reports per-job latency, SQL statements, rows read or written, Python
+memory peak and messages emitted. Use a scratch database: existing tables
+are dropped unless --keep is given.
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import resource
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from statistics import quantiles
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db-url", default="sqlite+aiosqlite:///./simulation.db",
+                        help="Database to seed and run against (dropped first)")
+    parser.add_argument("--tasks", type=int, default=10_000, help="Tasks to seed")
+    parser.add_argument("--groups", type=int, default=200, help="Groups to spread tasks over")
+    parser.add_argument("--users", type=int, default=None,
+                        help="Users to assign tasks to (default: tasks / 20)")
+    parser.add_argument("--personal-share", type=float, default=0.2,
+                        help="Fraction of tasks that are personal (reminder_at) tasks")
+    parser.add_argument("--digest-share", type=float, default=0.1,
+                        help="Fraction of groups with reminder digests on")
+    parser.add_argument("--days", type=int, default=7, help="Simulated days")
+    parser.add_argument("--start", default=None,
+                        help="Simulation start, ISO date (default: last Monday)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--keep", action="store_true",
+                        help="Reuse the existing database instead of reseeding")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="Skip tracemalloc (it slows every sweep down)")
+    return parser.parse_args(argv)
+
+
+# Settings are read at import time, so configure them before importing src
+_args = parse_args() if __name__ == "__main__" else None
+if _args is not None:
+    os.environ["DATABASE_URL"] = _args.db_url
+    os.environ.setdefault("BOT_TOKEN", "0:simulation")
+    # Chunk pauses would show up as sweep latency
+    os.environ.setdefault("CLEANUP_BATCH_PAUSE_SECONDS", "0")
+    # No timer engine to notify about task changes
+    os.environ.setdefault("TIMER_ENGINE_CHANNEL", "")
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import SendMessage, TelegramMethod
+from loguru import logger
+from sqlalchemy import event, insert
+
+from src.core import clock
+from src.core.config import settings
+from src.database import (
+    Base, GroupSettings, Task, TaskPriority, TaskStatus, User,
+    async_session_factory, engine,
+)
+from src.database.models import REMINDABLE_STATUSES, next_reminder_time
+
+TIMEZONE = clock.TIMEZONE
+SEED_CHUNK = 5_000
+
+# Seeded mix: status weights, reminder intervals (minutes) and share of
+# group tasks without a deadline
+_STATUS_WEIGHTS = {
+    TaskStatus.PENDING: 50,
+    TaskStatus.IN_PROGRESS: 25,
+    TaskStatus.SUBMITTED: 8,
+    TaskStatus.COMPLETED: 10,
+    TaskStatus.CANCELLED: 3,
+    TaskStatus.OVERDUE: 4,
+}
+_INTERVALS = (None, 15, 30, 60, 120, 240, 480)
+_NO_DEADLINE_SHARE = 0.2
+
+
+class RecordingSession(BaseSession):
+    """Bot session that records sends instead of calling Telegram."""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = 0
+        self.chats: set[int] = set()
+
+    async def close(self) -> None:
+        pass
+
+    async def stream_content(self, *args, **kwargs):
+        yield b""
+
+    async def make_request(self, bot: Bot, method: TelegramMethod, timeout: int | None = None):
+        # Callers here ignore the result, so skip building a Message
+        if isinstance(method, SendMessage):
+            self.sent += 1
+            self.chats.add(method.chat_id)
+        return True
+
+
+class QueryMeter:
+    """Counts statements and rows returned or affected on the engine."""
+
+    def __init__(self):
+        self.statements = 0
+        self.rows = 0
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_execute)
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+        # The async adapters buffer result rows on the cursor
+        buffered = getattr(cursor, "_rows", None)
+        self.rows += len(buffered) if buffered else max(cursor.rowcount, 0)
+
+
+@dataclass
+class JobStats:
+    """Measurements for one job over the simulation."""
+    name: str
+    skipped: int = 0
+    latencies: list[float] = field(default_factory=list)
+    statements: int = 0
+    rows: int = 0
+    max_rows: int = 0
+    peak_memory: int | None = None
+    messages: int = 0
+
+    def row(self) -> list[str]:
+        runs = len(self.latencies)
+        if runs:
+            ms = sorted(latency * 1000 for latency in self.latencies)
+            p95 = quantiles(ms, n=20, method="inclusive")[-1] if runs > 1 else ms[0]
+            timing = [f"{sum(ms) / runs:.1f}", f"{p95:.1f}", f"{ms[-1]:.1f}"]
+        else:
+            timing = ["-", "-", "-"]
+        return [
+            self.name, str(runs), str(self.skipped), *timing,
+            str(self.statements), str(self.rows), str(self.max_rows),
+            "-" if self.peak_memory is None else f"{self.peak_memory / 1024:.0f}",
+            str(self.messages),
+        ]
+
+
+class Simulation:
+    """Runs the scheduler jobs on their production cadence under a virtual clock."""
+
+    def __init__(self, start: datetime, days: int, trace_memory: bool):
+        self.clock = clock.VirtualClock(start)
+        self.end = start + timedelta(days=days)
+        self.trace_memory = trace_memory
+        self.bot_session = RecordingSession()
+        self.bot = Bot(token=settings.BOT_TOKEN, session=self.bot_session)
+        self.meter = QueryMeter()
+        self.stats: dict[str, JobStats] = {}
+
+        jobs = importlib.import_module("src.scheduler.jobs.group-task-reminder")
+        notify = importlib.import_module("src.scheduler.jobs.notify")
+        trigger = importlib.import_module("src.scheduler.working-hours-trigger")
+        self.relay = importlib.import_module("src.services.outbox-relay").OutboxRelay()
+        jobs.set_bot_instance(self.bot, async_session_factory)
+        notify.set_bot_instance(self.bot, async_session_factory)
+        self.relay.configure(self.bot, async_session_factory)
+
+        # (name, job, next fire time after the previous one or from the
+        # start) - the same cadence SchedulerManager registers them with
+        reminders = trigger.WorkingHoursTrigger(minutes=5)
+        overdue = trigger.WorkingHoursTrigger(minutes=15)
+        self.jobs = [
+            ("personal_reminders", notify.process_personal_reminders,
+             lambda prev, now: now if prev is None else prev + timedelta(minutes=1)),
+            ("group_task_reminder", jobs.process_group_reminders,
+             reminders.get_next_fire_time),
+            ("check_overdue_tasks", jobs.check_overdue_tasks,
+             overdue.get_next_fire_time),
+            ("cleanup_old_tasks", jobs.cleanup_old_tasks,
+             lambda prev, now: (now + timedelta(days=1)).replace(hour=0, minute=0)),
+        ]
+
+    async def _measure(self, name: str, run) -> None:
+        stats = self.stats.setdefault(name, JobStats(name))
+        statements, rows = self.meter.statements, self.meter.rows
+        sent = self.bot_session.sent
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+
+        started = time.perf_counter()
+        await run()
+        elapsed = time.perf_counter() - started
+
+        run_statements = self.meter.statements - statements
+        if not run_statements:
+            stats.skipped += 1  # Outside working hours: nothing to measure
+            return
+        run_rows = self.meter.rows - rows
+        stats.latencies.append(elapsed)
+        stats.statements += run_statements
+        stats.rows += run_rows
+        stats.max_rows = max(stats.max_rows, run_rows)
+        stats.messages += self.bot_session.sent - sent
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            stats.peak_memory = max(stats.peak_memory or 0, peak)
+
+    async def _drain(self) -> None:
+        while await self.relay.drain_once():
+            pass
+
+    async def run(self) -> None:
+        clock.set_clock(self.clock)
+        start = self.clock.current
+        schedule = [
+            (next_fire(None, start), name, job, next_fire)
+            for name, job, next_fire in self.jobs
+        ]
+        try:
+            while True:
+                schedule.sort(key=lambda entry: entry[0])
+                fire_at, name, job, next_fire = schedule[0]
+                if fire_at >= self.end:
+                    break
+                self.clock.current = fire_at
+                await self._measure(name, job)
+                await self._measure("outbox_relay", self._drain)
+                schedule[0] = (next_fire(fire_at, fire_at), name, job, next_fire)
+        finally:
+            clock.set_clock(None)
+
+    def report(self, seed_seconds: float, wall_seconds: float) -> str:
+        headers = [
+            "job", "runs", "skipped", "mean ms", "p95 ms", "max ms",
+            "stmts", "rows", "max rows", "peak KiB", "messages",
+        ]
+        order = [name for name, *_ in self.jobs] + ["outbox_relay"]
+        table = [headers] + [self.stats[name].row() for name in order if name in self.stats]
+        widths = [max(len(line[i]) for line in table) for i in range(len(headers))]
+        lines = [
+            "  ".join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                      for i, (cell, width) in enumerate(zip(line, widths)))
+            for line in table
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        lines += [
+            "",
+            (
+                f"Simulated until {self.end:%Y-%m-%d %H:%M}; "
+                f"seeding {seed_seconds:.1f}s, simulation {wall_seconds:.1f}s"
+            ),
+            (
+                f"Messages sent: {self.bot_session.sent} to {len(self.bot_session.chats)} chats; "
+                f"process max RSS {maxrss / 1024:.0f} MiB"
+            ),
+        ]
+        return "\n".join(lines)
+
+
+async def seed(args: argparse.Namespace, start: datetime) -> None:
+    """Create tables and insert users, group settings and tasks."""
+    rng = random.Random(args.seed)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    user_count = args.users or max(args.tasks // 20, 10)
+    user_ids = list(range(1, user_count + 1))
+    group_ids = [-1_000_000_000_000 - i for i in range(args.groups)]
+    statuses = list(_STATUS_WEIGHTS)
+    weights = list(_STATUS_WEIGHTS.values())
+
+    def group_task() -> dict:
+        status = rng.choices(statuses, weights)[0]
+        group_id = rng.choice(group_ids)
+        interval = rng.choice(_INTERVALS)
+        due = None
+        if rng.random() >= _NO_DEADLINE_SHARE:
+            due = start + timedelta(minutes=rng.randint(-24 * 60, args.days * 24 * 60))
+        row = {
+            "user_id": rng.choice(user_ids),
+            "title": f"Task {rng.randrange(1_000_000)}",
+            "status": status,
+            "priority": rng.choice(list(TaskPriority)),
+            "due_date": due,
+            "group_id": group_id,
+            "assignee_id": rng.choice(user_ids),
+            "assigned_by_id": user_ids[0],
+            "reminder_interval_minutes": interval,
+            "last_reminder_sent": None,
+            "verified_at": None,
+        }
+        if interval and status in REMINDABLE_STATUSES:
+            # Spread the first reminders over one interval instead of
+            # having every task due on the first sweep
+            row["last_reminder_sent"] = start - timedelta(minutes=rng.uniform(0, interval))
+        if status == TaskStatus.COMPLETED:
+            row["verified_at"] = start - timedelta(days=rng.uniform(0, 60))
+        row["next_reminder_at"] = next_reminder_time(
+            status, group_id, interval, row["last_reminder_sent"], start
+        )
+        return row
+
+    def personal_task() -> dict:
+        reminder_at = None
+        if rng.random() < 0.5:
+            reminder_at = start + timedelta(minutes=rng.randint(0, args.days * 24 * 60))
+        return {
+            "user_id": rng.choice(user_ids),
+            "title": f"Note {rng.randrange(1_000_000)}",
+            "description": None,
+            "status": rng.choice(REMINDABLE_STATUSES),
+            "priority": TaskPriority.MEDIUM,
+            "reminder_at": reminder_at,
+        }
+
+    async with async_session_factory() as session:
+        for offset in range(0, user_count, SEED_CHUNK):
+            await session.execute(insert(User), [
+                {"id": user_id, "first_name": f"User {user_id}"}
+                for user_id in user_ids[offset:offset + SEED_CHUNK]
+            ])
+        digest_groups = rng.sample(group_ids, round(len(group_ids) * args.digest_share))
+        if digest_groups:
+            await session.execute(insert(GroupSettings), [
+                {"group_id": group_id, "reminder_digest": True} for group_id in digest_groups
+            ])
+        await session.commit()
+
+        # Personal and group rows have different keys, so insert them apart
+        for offset in range(0, args.tasks, SEED_CHUNK):
+            size = min(SEED_CHUNK, args.tasks - offset)
+            personal = [personal_task() for _ in range(round(size * args.personal_share))]
+            group = [group_task() for _ in range(size - len(personal))]
+            for rows in (personal, group):
+                if rows:
+                    await session.execute(insert(Task), rows)
+            await session.commit()
+
+
+def default_start() -> datetime:
+    """Monday 00:00 of the current week."""
+    today = datetime.now(TIMEZONE).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=today.weekday())
+
+
+async def main(args: argparse.Namespace) -> None:
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if args.start:
+        start = datetime.fromisoformat(args.start)
+        start = start if start.tzinfo else start.replace(tzinfo=TIMEZONE)
+    else:
+        start = default_start()
+
+    seed_seconds = 0.0
+    if not args.keep:
+        started = time.perf_counter()
+        await seed(args, start)
+        seed_seconds = time.perf_counter() - started
+        print(f"Seeded {args.tasks} tasks in {seed_seconds:.1f}s", file=sys.stderr)
+
+    trace_memory = not args.no_memory
+    if trace_memory:
+        tracemalloc.start()
+    simulation = Simulation(start, args.days, trace_memory)
+    started = time.perf_counter()
+    try:
+        await simulation.run()
+    finally:
+        await engine.dispose()
+    print(simulation.report(seed_seconds, time.perf_counter() - started))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(_args))
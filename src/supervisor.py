@@ -0,0 +1,369 @@
+# src/supervisor.py
+"""Multi-process entry point: one update router, N bot worker processes.
+
+    python -m src.supervisor
+
+The supervisor receives updates (long polling or the public webhook, per
+BOT_MODE) and forwards each one to a worker process chosen by consistent
+hash of its chat id. Workers are `src.main` in webhook mode on a local
+port, so a chat's updates always reach the same process in order and its
+FSM state, user and admin caches stay local. Only worker 0 runs the
+scheduler. SIGHUP restarts the workers one at a time; updates for a
+restarting worker wait in its queue.
+"""
+import asyncio
+import bisect
+import hashlib
+import os
+import secrets
+import signal
+import sys
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from loguru import logger
+
+from src.core.config import settings
+
+TELEGRAM_API = "https://api.telegram.org"
+# Virtual nodes per worker on the hash ring
+RING_REPLICAS = 256
+# getUpdates long-poll seconds
+POLL_TIMEOUT = 30
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring over worker indexes.
+
+    Changing the worker count only moves about 1/N of the chats.
+    """
+
+    def __init__(self, nodes: int, replicas: int = RING_REPLICAS):
+        points = sorted(
+            (_hash(f"worker-{node}-{replica}"), node)
+            for node in range(nodes) for replica in range(replicas)
+        )
+        self._keys = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def node_for(self, key: Any) -> int:
+        index = bisect.bisect(self._keys, _hash(str(key))) % len(self._keys)
+        return self._nodes[index]
+
+
+def update_chat_id(update: dict) -> int | None:
+    """Chat id of a raw update (the user's id for chatless updates)."""
+    for key, event in update.items():
+        if key == "update_id" or not isinstance(event, dict):
+            continue
+        # Callback queries carry the chat on their message
+        chat = event.get("chat") or (event.get("message") or {}).get("chat")
+        if chat:
+            return chat["id"]
+        user = event.get("from") or event.get("user")
+        if user:
+            return user["id"]
+    return None
+
+
+class WorkerProcess:
+    """One `src.main` process, restarted when it exits, plus its update queue."""
+
+    def __init__(self, index: int, port: int, env: dict[str, str], http: aiohttp.ClientSession):
+        self.index = index
+        self.port = port
+        self.env = env
+        self.http = http
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=settings.UPDATE_QUEUE_LIMIT)
+        self.ready = asyncio.Event()
+        self.process: asyncio.subprocess.Process | None = None
+        self.restarts = 0
+        self._stopping = False
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._supervise()),
+            asyncio.create_task(self._forward()),
+        ]
+
+    async def _spawn(self) -> None:
+        # Own session: a terminal Ctrl-C reaches only the supervisor, which
+        # then stops the workers in order
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.main", env=self.env, start_new_session=True
+        )
+        logger.info(f"Worker {self.index} started (pid {self.process.pid}, port {self.port})")
+        while self.process.returncode is None:
+            try:
+                async with self.http.get(self.url + settings.WEBHOOK_HEALTH_PATH) as response:
+                    if response.status == 200:
+                        self.ready.set()
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.5)
+
+    async def _supervise(self) -> None:
+        backoff = 1.0
+        while not self._stopping:
+            started = asyncio.get_running_loop().time()
+            await self._spawn()
+            code = await self.process.wait()
+            self.ready.clear()
+            if self._stopping:
+                break
+            self.restarts += 1
+            if asyncio.get_running_loop().time() - started > 60:
+                backoff = 1.0
+            if code != 0:
+                logger.error(f"Worker {self.index} exited with {code}, restarting in {backoff:.0f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+    async def _forward(self) -> None:
+        """Post queued updates to the worker one at a time, in order."""
+        headers = {"X-Telegram-Bot-Api-Secret-Token": self.env["WEBHOOK_SECRET"]}
+        while True:
+            update = await self.queue.get()
+            while True:
+                await self.ready.wait()
+                try:
+                    async with self.http.post(
+                        self.url + settings.WEBHOOK_PATH, json=update, headers=headers
+                    ) as response:
+                        if response.status < 500:
+                            if response.status != 200:
+                                logger.error(
+                                    f"Worker {self.index} refused update "
+                                    f"{update.get('update_id')}: HTTP {response.status}"
+                                )
+                            break
+                except aiohttp.ClientError:
+                    pass
+                # Worker restarting or overloaded: keep the update and retry
+                await asyncio.sleep(0.5)
+            self.queue.task_done()
+
+    async def _terminate(self, timeout: float) -> None:
+        if not self.process or self.process.returncode is not None:
+            return
+        self.process.terminate()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except TimeoutError:
+            logger.warning(f"Worker {self.index} did not stop in {timeout:.0f}s, killing it")
+            self.process.kill()
+            await self.process.wait()
+
+    async def restart(self) -> None:
+        """Stop the process gracefully and wait until its replacement is ready."""
+        self.ready.clear()
+        await self._terminate(settings.SUPERVISOR_STOP_TIMEOUT)
+        # _supervise respawns it (a clean exit restarts without backoff)
+        await self.ready.wait()
+
+    async def stop(self) -> None:
+        """Forward what is queued (up to the stop timeout), then stop the process."""
+        try:
+            await asyncio.wait_for(self.queue.join(), settings.SUPERVISOR_STOP_TIMEOUT)
+        except TimeoutError:
+            logger.warning(f"Worker {self.index}: dropping {self.queue.qsize()} queued updates")
+        self._stopping = True
+        self.ready.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._terminate(settings.SUPERVISOR_STOP_TIMEOUT)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pid": self.process.pid if self.process else None,
+            "ready": self.ready.is_set(),
+            "queued": self.queue.qsize(),
+            "restarts": self.restarts,
+        }
+
+
+class Supervisor:
+    """Routes updates to worker processes and keeps them running."""
+
+    def __init__(self, workers: int):
+        self.workers_count = workers
+        self.ring = HashRing(workers)
+        self.workers: list[WorkerProcess] = []
+        self.http: aiohttp.ClientSession | None = None
+        self._stop = asyncio.Event()
+        self._restarting: asyncio.Task | None = None
+
+    def _worker_env(self, index: int) -> dict[str, str]:
+        from src.bot.webhook import webhook_secret
+
+        env = dict(os.environ)
+        env.update({
+            "BOT_MODE": "webhook",
+            "WEBHOOK_HOST": "127.0.0.1",
+            "WEBHOOK_PORT": str(settings.SUPERVISOR_BASE_PORT + index),
+            "WEBHOOK_URL": "",  # The supervisor owns the registration
+            "WEBHOOK_SECRET": webhook_secret(),
+            "SCHEDULER_ENABLED": str(settings.SCHEDULER_ENABLED and index == 0).lower(),
+            # Worker 0's scheduler and every worker's dashboard edits send
+            # to any chat, so all send windows are shared through Redis
+            "OUTBOUND_LIMITER_BACKEND": "redis",
+        })
+        return env
+
+    async def route(self, update: dict) -> None:
+        """Queue an update on the worker that owns its chat."""
+        key = update_chat_id(update)
+        if key is None:
+            key = f"update-{update.get('update_id')}"
+        await self.workers[self.ring.node_for(key)].queue.put(update)
+
+    async def _api(self, method: str, request_timeout: float = 10, **params: Any) -> Any:
+        url = f"{TELEGRAM_API}/bot{settings.BOT_TOKEN}/{method}"
+        async with self.http.post(
+            url, json=params, timeout=aiohttp.ClientTimeout(total=request_timeout)
+        ) as response:
+            body = await response.json()
+        if not body.get("ok"):
+            raise RuntimeError(f"{method} failed: {body.get('description')}")
+        return body["result"]
+
+    async def _poll(self, allowed_updates: list[str]) -> None:
+        """Long-poll getUpdates and route the raw updates."""
+        await self._api("deleteWebhook")
+        offset = None
+        backoff = 1.0
+        while True:
+            try:
+                updates = await self._api(
+                    "getUpdates", request_timeout=POLL_TIMEOUT + 10,
+                    offset=offset, timeout=POLL_TIMEOUT, allowed_updates=allowed_updates,
+                )
+            except (aiohttp.ClientError, TimeoutError, RuntimeError) as e:
+                logger.error(f"Failed to fetch updates: {e}; retrying in {backoff:.0f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+            backoff = 1.0
+            for update in updates:
+                await self.route(update)
+                offset = update["update_id"] + 1
+
+    async def _serve_webhook(self, allowed_updates: list[str]) -> web.AppRunner:
+        """Public webhook that routes updates instead of handling them."""
+        from src.bot.webhook import webhook_secret
+
+        secret = webhook_secret()
+
+        async def receive(request: web.Request) -> web.Response:
+            token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+            if not secrets.compare_digest(token, secret):
+                return web.Response(body="Unauthorized", status=401)
+            await self.route(await request.json())
+            return web.json_response({})
+
+        async def health(request: web.Request) -> web.Response:
+            return web.json_response({
+                "status": "ok",
+                "mode": "supervisor",
+                "workers": [worker.stats() for worker in self.workers],
+            })
+
+        app = web.Application()
+        app.router.add_post(settings.WEBHOOK_PATH, receive)
+        app.router.add_get(settings.WEBHOOK_HEALTH_PATH, health)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, settings.WEBHOOK_HOST, settings.WEBHOOK_PORT).start()
+        if settings.WEBHOOK_URL:
+            await self._api(
+                "setWebhook",
+                url=settings.WEBHOOK_URL.rstrip("/") + settings.WEBHOOK_PATH,
+                secret_token=secret,
+                allowed_updates=allowed_updates,
+                max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+            )
+        return runner
+
+    async def rolling_restart(self) -> None:
+        """Restart workers one at a time; the others keep handling updates."""
+        logger.info("Rolling restart of workers...")
+        for worker in self.workers:
+            await worker.restart()
+        logger.info("Rolling restart done")
+
+    def _on_sighup(self) -> None:
+        if self._restarting and not self._restarting.done():
+            logger.warning("Rolling restart already in progress")
+            return
+        self._restarting = asyncio.create_task(self.rolling_restart())
+
+    async def run(self) -> None:
+        from src.bot import create_dispatcher
+
+        # Same update types the workers' handlers use
+        allowed_updates = create_dispatcher().resolve_used_update_types()
+
+        loop = asyncio.get_running_loop()
+        loop.add_signal_handler(signal.SIGINT, self._stop.set)
+        loop.add_signal_handler(signal.SIGTERM, self._stop.set)
+        loop.add_signal_handler(signal.SIGHUP, self._on_sighup)
+
+        self.http = aiohttp.ClientSession()
+        self.workers = [
+            WorkerProcess(index, settings.SUPERVISOR_BASE_PORT + index,
+                          self._worker_env(index), self.http)
+            for index in range(self.workers_count)
+        ]
+        for worker in self.workers:
+            worker.start()
+        await asyncio.gather(*(worker.ready.wait() for worker in self.workers))
+        logger.info(f"{self.workers_count} workers ready")
+
+        runner = None
+        intake = None
+        try:
+            if settings.BOT_MODE == "webhook":
+                runner = await self._serve_webhook(allowed_updates)
+                logger.info(f"Routing webhook updates on port {settings.WEBHOOK_PORT}")
+            else:
+                intake = asyncio.create_task(self._poll(allowed_updates))
+                logger.info("Routing polled updates")
+            await self._stop.wait()
+        finally:
+            logger.info("Supervisor shutting down...")
+            if intake:
+                intake.cancel()
+                await asyncio.gather(intake, return_exceptions=True)
+            if runner:
+                await runner.cleanup()
+            if self._restarting:
+                self._restarting.cancel()
+            await asyncio.gather(*(worker.stop() for worker in self.workers))
+            await self.http.close()
+
+
+async def main() -> None:
+    logger.add(
+        "logs/supervisor_{time}.log",
+        rotation="1 day",
+        retention="7 days",
+        level="INFO"
+    )
+    workers = settings.SUPERVISOR_WORKERS or os.cpu_count() or 1
+    await Supervisor(workers).run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+# src/worker.py
+"""Scheduler-only entry point.
+
+    python -m src.worker
+
+Runs the scheduler (group reminders, overdue checks, cleanup, personal
+reminders, timer engine and outbox relay) against the database with a
+Bot client but no dispatcher, so slow sweeps never share an event loop
+with update handling. Run the bot processes with SCHEDULER_ENABLED=false;
+this process ignores that setting. Their task changes reach the timer
+engine here over TIMER_ENGINE_CHANNEL, and OUTBOUND_LIMITER_BACKEND=redis
+keeps one set of send limits across the processes. Leader election still
+applies when several workers run.
+"""
+import asyncio
+import signal
+
+from loguru import logger
+
+from src.bot import create_bot
+from src.bot.middlewares import get_outbound_dispatcher
+from src.database import async_session_factory, close_db, init_db
+from src.scheduler import SchedulerRuntime, get_timer_notifier
+from src.services import get_group_dashboard
+
+
+async def main():
+    """Scheduler worker entry."""
+    logger.add(
+        "logs/worker_{time}.log",
+        rotation="1 day",
+        retention="7 days",
+        level="INFO"
+    )
+
+    logger.info("Initializing database...")
+    await init_db()
+
+    bot = create_bot()
+    # Sweeps change task state, so this process refreshes dashboards too
+    get_group_dashboard().configure(bot, async_session_factory)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows: KeyboardInterrupt still works
+            pass
+
+    scheduler = SchedulerRuntime(bot, async_session_factory)
+    try:
+        await scheduler.start()
+        logger.info("Scheduler worker running")
+        await stop.wait()
+    finally:
+        logger.info("Scheduler worker shutting down...")
+        await scheduler.stop()
+        await get_timer_notifier().close()
+        await get_group_dashboard().close()
+        await get_outbound_dispatcher().close()
+        await close_db()
+        await bot.session.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.info("Scheduler worker stopped by user")
@@ -0,0 +1,36 @@
+# tests/conftest.py
+"""Shared test setup.
+
+Settings are read when src is first imported, so the test environment is
+set here before any test module imports it.
+"""
+import asyncio
+import os
+
+import pytest
+import pytest_asyncio
+
+os.environ.setdefault("BOT_TOKEN", "123456:TEST")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+os.environ.setdefault("TIMER_ENGINE_CHANNEL", "")
+os.environ.setdefault("UPDATE_DEDUP_BACKEND", "memory")
+os.environ.setdefault("OUTBOUND_ENABLED", "false")
+
+from redis.asyncio import Redis  # noqa: E402
+from redis.exceptions import RedisError  # noqa: E402
+
+# Tests that need Redis use this server and skip when it isn't running
+TEST_REDIS_URL = os.environ.get("TEST_REDIS_URL", "redis://localhost:6379/15")
+
+
+@pytest_asyncio.fixture
+async def redis():
+    """Client for a local redis-server (database 15 by default)."""
+    client = Redis.from_url(TEST_REDIS_URL, socket_timeout=1, socket_connect_timeout=1)
+    try:
+        await asyncio.wait_for(client.ping(), 2)
+    except (RedisError, OSError, TimeoutError):
+        await client.aclose()
+        pytest.skip(f"No Redis at {TEST_REDIS_URL}")
+    yield client
+    await client.aclose()
@@ -0,0 +1,165 @@
+# tests/test_group_reminders.py
+"""Group reminder job: per-task reminders, digests and their outbox keys."""
+import importlib
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core import clock
+from src.database import Base, Task, User
+from src.database.models.outbox import OutboxMessage
+from src.database.repositories import GroupSettingsRepository
+
+reminders = importlib.import_module("src.scheduler.jobs.group-task-reminder")
+TIMEZONE = reminders.TIMEZONE
+
+pytestmark = pytest.mark.asyncio
+
+GROUP = -100
+# A Monday, inside working hours
+MONDAY_9AM = datetime(2026, 10, 19, 9, 0, tzinfo=TIMEZONE)
+
+
+@pytest.fixture
+def virtual_clock():
+    time_source = clock.VirtualClock(MONDAY_9AM)
+    clock.set_clock(time_source)
+    yield time_source
+    clock.set_clock(None)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'reminders.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(User(id=1, first_name="Test"))
+        await session.commit()
+    monkeypatch.setattr(reminders, "_session_factory", factory)
+    yield factory
+    await engine.dispose()
+
+
+async def add_tasks(session_factory, *titles: str, next_reminder_at=MONDAY_9AM) -> list[Task]:
+    async with session_factory() as session:
+        tasks = [
+            Task(user_id=1, assignee_id=1, assigned_by_id=1, group_id=GROUP, title=title,
+                 reminder_interval_minutes=60, next_reminder_at=next_reminder_at)
+            for title in titles
+        ]
+        session.add_all(tasks)
+        await session.commit()
+        return tasks
+
+
+async def set_digest(session_factory, enabled: bool) -> None:
+    async with session_factory() as session:
+        await GroupSettingsRepository(session).set_reminder_digest(GROUP, enabled)
+        await session.commit()
+
+
+async def outbox(session_factory) -> list[OutboxMessage]:
+    async with session_factory() as session:
+        result = await session.execute(select(OutboxMessage).order_by(OutboxMessage.id))
+        return list(result.scalars())
+
+
+def slot_key(task: Task, slot: datetime) -> str:
+    return f"reminder:{task.id}:{int(slot.timestamp())}"
+
+
+async def test_reminder_is_keyed_by_delivered_slot(session_factory, virtual_clock):
+    [task] = await add_tasks(session_factory, "Write report")
+    await reminders.process_group_reminders()
+    virtual_clock.advance(timedelta(hours=1))
+    await reminders.process_group_reminders()
+
+    keys = [message.idempotency_key for message in await outbox(session_factory)]
+    assert keys == [
+        slot_key(task, MONDAY_9AM), slot_key(task, MONDAY_9AM + timedelta(hours=1))
+    ]
+
+
+async def test_single_task_digest_then_digest_off_loses_nothing(session_factory, virtual_clock):
+    [task] = await add_tasks(session_factory, "Write report")
+    await set_digest(session_factory, True)
+    await reminders.process_group_reminders()
+    await set_digest(session_factory, False)
+    virtual_clock.advance(timedelta(hours=1))
+    await reminders.process_group_reminders()
+
+    keys = [message.idempotency_key for message in await outbox(session_factory)]
+    assert keys == [
+        slot_key(task, MONDAY_9AM), slot_key(task, MONDAY_9AM + timedelta(hours=1))
+    ]
+
+
+async def test_digest_groups_due_tasks_in_one_message(session_factory, virtual_clock):
+    tasks = await add_tasks(session_factory, "Write report", "Review PR")
+    # Due within the digest window: pulled into this cycle's digest
+    [upcoming] = await add_tasks(
+        session_factory, "Deploy", next_reminder_at=MONDAY_9AM + timedelta(minutes=5)
+    )
+    await set_digest(session_factory, True)
+    await reminders.process_group_reminders()
+
+    [message] = await outbox(session_factory)
+    assert message.idempotency_key.startswith(f"digest:{GROUP}:")
+    assert message.chat_id == GROUP
+    assert "Task Reminders (3)" in message.text
+    for task in [*tasks, upcoming]:
+        assert f"#{task.id} " in message.text
+    # Every task moved on to its next slot
+    async with session_factory() as session:
+        slots = (await session.execute(select(Task.next_reminder_at))).scalars().all()
+    assert all(reminders._local(slot) == MONDAY_9AM + timedelta(hours=1) for slot in slots)
+
+
+async def test_digest_off_sends_one_message_per_task(session_factory, virtual_clock):
+    tasks = await add_tasks(session_factory, "Write report", "Review PR")
+    await set_digest(session_factory, False)
+    await reminders.process_group_reminders()
+
+    keys = [message.idempotency_key for message in await outbox(session_factory)]
+    assert keys == [slot_key(task, MONDAY_9AM) for task in tasks]
+
+
+def digest_tasks(count: int, title: str = "Task") -> list[tuple[Task, datetime]]:
+    return [
+        (Task(id=task_id, assignee_id=1 + task_id % 2, group_id=GROUP, title=f"{title} {task_id}"),
+         MONDAY_9AM)
+        for task_id in range(1, count + 1)
+    ]
+
+
+async def test_digest_key_depends_on_slots_not_run_time():
+    task_slots = digest_tasks(3)
+    first = reminders._digest_messages(GROUP, task_slots, MONDAY_9AM)
+    # An overlapping run for the same slots, a little later and in another order
+    again = reminders._digest_messages(
+        GROUP, task_slots[::-1], MONDAY_9AM + timedelta(seconds=20)
+    )
+    assert [m["idempotency_key"] for m in first] == [m["idempotency_key"] for m in again]
+
+    next_slot = [(task, slot + timedelta(hours=1)) for task, slot in task_slots]
+    later = reminders._digest_messages(GROUP, next_slot, MONDAY_9AM + timedelta(hours=1))
+    assert later[0]["idempotency_key"] != first[0]["idempotency_key"]
+
+
+async def test_long_digest_is_split_under_message_limit():
+    task_slots = digest_tasks(120, title="x" * 80)
+    messages = reminders._digest_messages(GROUP, task_slots, MONDAY_9AM)
+
+    assert len(messages) > 1
+    assert all(len(m["text"]) <= reminders.MESSAGE_LIMIT for m in messages)
+    keys = [m["idempotency_key"] for m in messages]
+    assert len(set(keys)) == len(keys) and keys[-1].endswith(f":{len(keys) - 1}")
+    text = "\n".join(m["text"] for m in messages)
+    assert all(f"#{task.id} " in text for task, _ in task_slots)
+    # A list continued in the next message repeats its assignee mention
+    assert all("tg://user?id=" in m["text"].split("(cont.)", 1)[-1] for m in messages[1:])
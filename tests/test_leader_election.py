@@ -0,0 +1,125 @@
+# tests/test_leader_election.py
+"""Leader election against a local redis-server."""
+import asyncio
+import importlib
+import time
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+LeaderElection = importlib.import_module("src.scheduler.leader-election").LeaderElection
+
+pytestmark = pytest.mark.asyncio
+
+LEASE = 0.6
+
+
+class Candidate:
+    """A LeaderElection plus a record of its callbacks."""
+
+    def __init__(self, redis: Redis, key: str):
+        self.events: list[str] = []
+        self.election = LeaderElection(
+            redis, on_elected=self._elected, on_demoted=self._demoted,
+            key=key, lease_seconds=LEASE,
+        )
+
+    async def _elected(self) -> None:
+        self.events.append("elected")
+
+    async def _demoted(self) -> None:
+        self.events.append("demoted")
+
+    def crash(self) -> None:
+        """Stop campaigning without releasing the lease, like a killed process."""
+        self.election._task.cancel()
+
+
+async def wait_for(condition, timeout: float) -> float:
+    """Seconds until condition() held; fails after timeout."""
+    started = time.monotonic()
+    while not condition():
+        if time.monotonic() - started > timeout:
+            pytest.fail(f"Condition not met within {timeout}s")
+        await asyncio.sleep(0.01)
+    return time.monotonic() - started
+
+
+@pytest.fixture
+def key(redis):
+    return f"test:leader:{uuid.uuid4().hex}"
+
+
+async def test_first_candidate_acquires_lease(redis, key):
+    first, second = Candidate(redis, key), Candidate(redis, key)
+    first.election.start()
+    await wait_for(lambda: first.election.is_leader, LEASE)
+    second.election.start()
+    await asyncio.sleep(LEASE)
+
+    assert await redis.get(key) == first.election.token.encode()
+    assert first.events == ["elected"]
+    assert not second.election.is_leader and second.events == []
+    await second.election.stop()
+    await first.election.stop()
+
+
+async def test_leader_renews_lease(redis, key):
+    leader = Candidate(redis, key)
+    leader.election.start()
+    await wait_for(lambda: leader.election.is_leader, LEASE)
+    await asyncio.sleep(3 * LEASE)
+
+    assert leader.election.is_leader
+    assert await redis.get(key) == leader.election.token.encode()
+    assert 0 < await redis.pttl(key) <= LEASE * 1000
+    assert leader.events == ["elected"]
+    await leader.election.stop()
+
+
+async def test_follower_takes_over_within_one_lease(redis, key):
+    first, second = Candidate(redis, key), Candidate(redis, key)
+    first.election.start()
+    await wait_for(lambda: first.election.is_leader, LEASE)
+    second.election.start()
+    await asyncio.sleep(LEASE / 3)
+
+    first.crash()
+    # The lease lapses, then the follower's next poll takes it
+    takeover = await wait_for(lambda: second.election.is_leader, 2 * LEASE)
+    assert takeover <= LEASE + second.election.renew_interval
+    assert await redis.get(key) == second.election.token.encode()
+    await second.election.stop()
+
+
+async def test_stop_releases_lease(redis, key):
+    first, second = Candidate(redis, key), Candidate(redis, key)
+    first.election.start()
+    await wait_for(lambda: first.election.is_leader, LEASE)
+    second.election.start()
+
+    await first.election.stop()
+    assert first.events == ["elected", "demoted"]
+    assert await redis.get(key) != first.election.token.encode()
+    # No waiting for the lease: the next poll of the follower wins
+    await wait_for(lambda: second.election.is_leader, second.election.renew_interval * 2)
+    await second.election.stop()
+    assert await redis.get(key) is None
+
+
+async def test_hung_renewal_steps_down_before_lease_expires(redis, key):
+    leader = Candidate(redis, key)
+    leader.election.start()
+    await wait_for(lambda: leader.election.is_leader, LEASE)
+    renewed_at = leader.election._renewed_at
+
+    async def hang():
+        await asyncio.sleep(3600)
+
+    leader.election._acquire_or_renew = hang
+    await wait_for(lambda: not leader.election.is_leader, LEASE)
+    # Demoted while the last renewal was still valid
+    assert time.monotonic() - renewed_at < LEASE
+    assert leader.events == ["elected", "demoted"]
+    await leader.election.stop()
@@ -0,0 +1,217 @@
+# tests/test_timer_engine.py
+"""Timer heap: lazy deletion, re-arming and change notices."""
+import asyncio
+import importlib
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database import Base, Task, User
+from src.database.models.task import TaskStatus
+
+timer_engine = importlib.import_module("src.scheduler.timer-engine")
+TimerEngine = timer_engine.TimerEngine
+TimerKind = timer_engine.TimerKind
+TimerNotifier = timer_engine.TimerNotifier
+TimerState = timer_engine.TimerState
+TIMEZONE = timer_engine.TIMEZONE
+
+pytestmark = pytest.mark.asyncio
+
+REMINDER, DEADLINE = TimerKind.REMINDER, TimerKind.DEADLINE
+
+
+@pytest.fixture(autouse=True)
+def always_working(monkeypatch):
+    """Fire times are not deferred to working hours."""
+    working_hours = importlib.import_module("src.services.working-hours")
+    monkeypatch.setattr(working_hours, "get_next_working_time", lambda dt=None: dt)
+
+
+@pytest.fixture
+def now():
+    return datetime.now(TIMEZONE)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'timers.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(User(id=1, first_name="Test"))
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+async def add_task(session_factory, **values) -> Task:
+    async with session_factory() as session:
+        task = Task(user_id=1, title="task", group_id=-100, **values)
+        session.add(task)
+        await session.commit()
+        return task
+
+
+class JobRecorder:
+    """Stands in for the group task jobs the engine fires."""
+
+    def __init__(self):
+        self.fired: list[tuple[str, list[int]]] = []
+
+    async def check_overdue_tasks(self, task_ids):
+        self.fired.append(("deadline", sorted(task_ids)))
+
+    async def process_group_reminders(self, task_ids):
+        self.fired.append(("reminder", sorted(task_ids)))
+
+
+async def wait_until(condition, timeout: float = 2) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+async def test_due_timers_pop_in_fire_order(now):
+    engine = TimerEngine(channel="")
+    engine.arm(2, REMINDER, now - timedelta(minutes=1))
+    engine.arm(1, DEADLINE, now - timedelta(minutes=2))
+    engine.arm(3, REMINDER, now + timedelta(minutes=1))
+    assert engine._pop_due(now) == {DEADLINE: [1], REMINDER: [2]}
+    assert len(engine) == 1
+
+
+async def test_rearmed_and_cancelled_timers_are_skipped_lazily(now):
+    engine = TimerEngine(channel="")
+    engine.arm(1, REMINDER, now - timedelta(minutes=5))
+    engine.arm(1, REMINDER, now + timedelta(minutes=5))  # Re-armed later
+    engine.arm(2, REMINDER, now - timedelta(minutes=5))
+    engine.cancel(2)
+    engine.arm(3, DEADLINE, now - timedelta(minutes=5))
+    engine.arm(3, DEADLINE, None)
+    # Stale entries stay in the heap until they surface
+    assert len(engine._heap) == 4
+
+    assert engine._pop_due(now) == {}
+    assert engine._armed == {(1, REMINDER): now + timedelta(minutes=5)}
+    assert engine._pop_due(now + timedelta(minutes=5)) == {REMINDER: [1]}
+    assert len(engine) == 0
+
+
+async def test_rearming_to_same_time_adds_no_entry(now):
+    engine = TimerEngine(channel="")
+    engine.arm(1, REMINDER, now)
+    engine.arm(1, REMINDER, now)
+    assert len(engine._heap) == 1
+
+
+async def test_heap_is_compacted_when_mostly_stale(now):
+    engine = TimerEngine(channel="")
+    for minute in range(2000):
+        engine.arm(1, REMINDER, now + timedelta(minutes=minute))
+    assert len(engine._heap) < 2000
+    assert engine._pop_due(now + timedelta(days=2)) == {REMINDER: [1]}
+
+
+async def test_apply_arms_both_timers_of_active_task(now):
+    engine = TimerEngine(channel="")
+    remind_at, due = now + timedelta(minutes=30), now + timedelta(hours=2)
+    engine.apply(TimerState(1, TaskStatus.PENDING, -100, remind_at, due), now)
+    assert engine._armed == {(1, REMINDER): remind_at, (1, DEADLINE): due}
+
+
+async def test_overdue_deadline_replaces_reminder(now):
+    engine = TimerEngine(channel="")
+    engine.apply(TimerState(
+        1, TaskStatus.PENDING, -100, now + timedelta(minutes=5), now - timedelta(minutes=1)
+    ), now)
+    assert set(engine._armed) == {(1, DEADLINE)}
+
+
+async def test_finished_or_personal_task_is_disarmed(now):
+    engine = TimerEngine(channel="")
+    state = TimerState(1, TaskStatus.PENDING, -100, now + timedelta(minutes=5), None)
+    engine.apply(state, now)
+    engine.apply(state._replace(status=TaskStatus.COMPLETED), now)
+    assert len(engine) == 0
+    engine.apply(state._replace(group_id=None), now)
+    assert len(engine) == 0
+
+
+async def test_commit_during_reload_is_reread(now):
+    engine = TimerEngine(channel="")
+    engine._loading = True
+    engine.committed([TimerState(1, TaskStatus.PENDING, -100, now, None)])
+    assert len(engine) == 0 and engine._changed == {1}
+    engine._loading = False
+    engine.committed([TimerState(2, TaskStatus.PENDING, -100, now, None)])
+    assert (2, REMINDER) in engine._armed
+
+
+async def test_refresh_reads_current_state(session_factory, now):
+    task = await add_task(session_factory, next_reminder_at=now + timedelta(minutes=10))
+    engine = TimerEngine(channel="")
+    engine._session_factory = session_factory
+    engine.arm(task.id, REMINDER, now + timedelta(minutes=1))  # Stale
+    engine.arm(999, DEADLINE, now)  # Task was deleted
+
+    found = await engine._refresh({task.id, 999})
+    assert found == {task.id}
+    assert set(engine._armed) == {(task.id, REMINDER)}
+    assert engine._armed[(task.id, REMINDER)].replace(tzinfo=None) == (
+        (now + timedelta(minutes=10)).replace(tzinfo=None)
+    )
+
+
+async def test_engine_fires_and_rearms_still_due_task(session_factory, monkeypatch, now):
+    jobs = JobRecorder()
+    monkeypatch.setattr(timer_engine, "_get_jobs", lambda: jobs)
+    task = await add_task(session_factory, due_date=now + timedelta(seconds=0.2))
+    engine = TimerEngine(channel="")
+    engine.start(session_factory)
+    try:
+        await wait_until(lambda: jobs.fired)
+        assert jobs.fired == [("deadline", [task.id])]
+        # The job left the task due, so it is retried later instead of spinning
+        await wait_until(
+            lambda: engine._armed.get((task.id, DEADLINE), now) > now + timedelta(seconds=30)
+        )
+        assert jobs.fired == [("deadline", [task.id])]
+    finally:
+        await engine.stop()
+
+
+async def test_changed_tasks_are_armed_without_reload(session_factory, monkeypatch, now):
+    monkeypatch.setattr(timer_engine, "_get_jobs", lambda: JobRecorder())
+    engine = TimerEngine(channel="")
+    engine.start(session_factory)
+    try:
+        await wait_until(lambda: engine._session_factory and not engine._reload)
+        await asyncio.sleep(0.05)  # Initial load done
+        task = await add_task(session_factory, due_date=now + timedelta(hours=1))
+        assert len(engine) == 0  # Committed elsewhere: unknown until notified
+        engine.changed([task.id])
+        await wait_until(lambda: (task.id, DEADLINE) in engine._armed)
+    finally:
+        await engine.stop()
+
+
+async def test_published_changes_reach_engine(redis, session_factory, monkeypatch, now):
+    monkeypatch.setattr(timer_engine, "_get_jobs", lambda: JobRecorder())
+    channel = f"test:timers:{uuid.uuid4().hex}"
+    engine = TimerEngine(channel=channel)
+    engine.start(session_factory, redis)
+    notifier = TimerNotifier(redis, channel)
+    try:
+        await asyncio.wait_for(engine._subscribed.wait(), 2)
+        task = await add_task(session_factory, due_date=now + timedelta(hours=1))
+        notifier.notify([task.id])
+        await notifier.close()
+        await wait_until(lambda: (task.id, DEADLINE) in engine._armed)
+    finally:
+        await engine.stop()
@@ -0,0 +1,191 @@
+# tests/test_update_dedup.py
+"""Redelivered update detection: stores and middleware."""
+import asyncio
+import importlib
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+from aiogram import Bot
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+from src.core.config import settings
+
+_store = importlib.import_module("src.services.update-dedup")
+_middleware = importlib.import_module("src.bot.middlewares.update-dedup")
+_executor = importlib.import_module("src.bot.update-executor")
+MemoryUpdateDedup = _store.MemoryUpdateDedup
+RedisUpdateDedup = _store.RedisUpdateDedup
+UpdateDedupMiddleware = _middleware.UpdateDedupMiddleware
+dedup_key = _middleware.dedup_key
+
+pytestmark = pytest.mark.asyncio
+
+USER = User(id=7, is_bot=False, first_name="Test")
+
+
+def message_update(update_id: int, message_id: int, chat_id: int = -100) -> Update:
+    chat = Chat(id=chat_id, type="group" if chat_id < 0 else "private")
+    return Update(update_id=update_id, message=Message(
+        message_id=message_id, date=datetime.now(), chat=chat, from_user=USER, text="/done 1"
+    ))
+
+
+def callback_update(update_id: int, callback_id: str) -> Update:
+    return Update(update_id=update_id, callback_query=CallbackQuery(
+        id=callback_id, from_user=USER, chat_instance="1", data="task:1"
+    ))
+
+
+class Recorder:
+    """Handler that records update ids and can fail or block on demand."""
+
+    def __init__(self):
+        self.handled: list[int] = []
+        self.fail: set[int] = set()
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, event: Update, data: dict) -> str:
+        if self.gate is not None:
+            await self.gate.wait()
+        if event.update_id in self.fail:
+            self.fail.discard(event.update_id)
+            raise RuntimeError("handler failed")
+        self.handled.append(event.update_id)
+        return "handled"
+
+
+@pytest.fixture
+def handler():
+    return Recorder()
+
+
+@pytest.fixture
+def middleware():
+    return UpdateDedupMiddleware(MemoryUpdateDedup())
+
+
+async def test_key_is_the_message_not_the_update():
+    assert dedup_key(message_update(1, 10)) == dedup_key(message_update(2, 10))
+    assert dedup_key(message_update(1, 10)) != dedup_key(message_update(1, 10, chat_id=-200))
+    assert dedup_key(callback_update(3, "abc")) == "callback:abc"
+
+
+async def test_redelivered_update_is_skipped(middleware, handler):
+    assert await middleware(handler, message_update(1, 10), {}) == "handled"
+    assert await middleware(handler, message_update(1, 10), {}) is None
+    assert await middleware(handler, callback_update(2, "cb"), {}) == "handled"
+    assert await middleware(handler, callback_update(2, "cb"), {}) is None
+    assert handler.handled == [1, 2]
+
+
+async def test_out_of_order_updates_are_all_handled(middleware, handler):
+    # Webhook deliveries of one chat can overtake each other
+    await middleware(handler, message_update(2, 11), {})
+    await middleware(handler, message_update(1, 10), {})
+    assert handler.handled == [2, 1]
+
+
+async def test_copy_arriving_while_first_is_handled_is_skipped(middleware, handler):
+    handler.gate = asyncio.Event()
+    first = asyncio.create_task(middleware(handler, message_update(1, 10), {}))
+    await asyncio.sleep(0)
+    assert await middleware(handler, message_update(1, 10), {}) is None
+    handler.gate.set()
+    assert await first == "handled"
+    assert handler.handled == [1]
+
+
+async def test_failed_update_is_retried_after_later_success(middleware, handler):
+    handler.fail.add(1)
+    with pytest.raises(RuntimeError):
+        await middleware(handler, message_update(1, 10), {})
+    # A later update of the same chat succeeds before the redelivery
+    await middleware(handler, message_update(2, 11), {})
+    assert await middleware(handler, message_update(1, 10), {}) == "handled"
+    assert handler.handled == [2, 1]
+
+
+async def test_restart_floor_skips_finished_updates(handler):
+    store = MemoryUpdateDedup()
+    finished = {"below": None}
+    first = UpdateDedupMiddleware(store, finished_below=lambda: finished["below"])
+    for update_id in (1, 2, 3):
+        # Updates are fed in order and the running one isn't finished yet
+        finished["below"] = update_id - 1
+        await first(handler, callback_update(update_id, f"cb{update_id}"), {})
+    assert await store.floor() == 2
+
+    # A restarted process that lost its seen-set still skips 1 and 2
+    store.seen.clear()
+    restarted = UpdateDedupMiddleware(store, finished_below=lambda: finished["below"])
+    assert await restarted(handler, callback_update(2, "cb2"), {}) is None
+    assert await restarted(handler, callback_update(3, "cb3"), {}) == "handled"
+    assert handler.handled == [1, 2, 3, 3]
+
+
+async def test_dispatcher_reports_updates_finished_in_feed_order():
+    gates = {update_id: asyncio.Event() for update_id in (1, 2, 3)}
+    executor = _executor.ChatOrderedExecutor(workers=3)
+    dp = _executor.ChatOrderedDispatcher(executor)
+
+    @dp.message()
+    async def wait_for_gate(message: Message, event_update: Update) -> None:
+        await gates[event_update.update_id].wait()
+
+    bot = Bot("123456:TEST")
+    for update_id in gates:
+        await dp.feed_update(bot, message_update(update_id, 10, chat_id=-update_id))
+    gates[2].set()
+    gates[3].set()
+    await asyncio.sleep(0.05)
+    assert dp.finished_below() is None  # Update 1 is still running
+    gates[1].set()
+    await asyncio.sleep(0.05)
+    assert dp.finished_below() == 3
+    await executor.close()
+    await bot.session.close()
+
+
+async def test_floor_never_goes_down():
+    store = MemoryUpdateDedup()
+    await store.advance_floor(5)
+    await store.advance_floor(3)
+    assert await store.floor() == 5
+
+
+async def test_redis_store_claim_commit_release(redis):
+    store = RedisUpdateDedup(redis, prefix=f"test:dedup:{uuid.uuid4().hex}", ttl=60, claim_ttl=5)
+    assert await store.claim("message:1:1")
+    assert not await store.claim("message:1:1")
+    await store.release("message:1:1")
+    assert await store.claim("message:1:1")
+    await store.commit("message:1:1")
+    assert not await store.claim("message:1:1")
+    # Handled updates are kept for the full TTL, not the claim TTL
+    assert await redis.pttl(f"{store.prefix}:seen:message:1:1") > 5000
+
+    assert await store.floor() is None
+    await store.advance_floor(10)
+    await store.advance_floor(4)
+    assert await store.floor() == 10
+
+
+async def test_redis_store_fails_open_when_redis_stalls(monkeypatch):
+    # A server that accepts connections but never answers
+    async def stall(reader, writer):
+        await asyncio.sleep(3600)
+
+    server = await asyncio.start_server(stall, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(settings, "UPDATE_DEDUP_BACKEND", "redis")
+    monkeypatch.setattr(settings, "REDIS_URL", f"redis://127.0.0.1:{port}/0")
+    store = _store.create_update_dedup()
+    try:
+        started = time.monotonic()
+        assert await store.claim("message:1:1")
+        assert time.monotonic() - started < 3
+    finally:
+        await store.redis.aclose()
+        server.close()
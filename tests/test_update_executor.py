@@ -0,0 +1,111 @@
+# tests/test_update_executor.py
+"""Per-chat ordered, cross-chat parallel update executor."""
+import asyncio
+import importlib
+
+import pytest
+
+ChatOrderedExecutor = importlib.import_module("src.bot.update-executor").ChatOrderedExecutor
+
+pytestmark = pytest.mark.asyncio
+
+
+def job(log: list, name, gate: asyncio.Event | None = None, fail: bool = False):
+    async def run() -> None:
+        log.append(("start", name))
+        if gate is not None:
+            await gate.wait()
+        log.append(("end", name))
+        if fail:
+            raise RuntimeError(name)
+    return run
+
+
+async def settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_jobs_of_one_chat_run_in_order_one_at_a_time():
+    executor = ChatOrderedExecutor(workers=4)
+    log, gate = [], asyncio.Event()
+    await executor.submit(-1, job(log, 1, gate))
+    await executor.submit(-1, job(log, 2))
+    await executor.submit(-1, job(log, 3))
+    await settle()
+    assert log == [("start", 1)]  # Free workers don't take the chat's next job
+
+    gate.set()
+    await executor.close()
+    assert log == [("start", 1), ("end", 1), ("start", 2), ("end", 2), ("start", 3), ("end", 3)]
+
+
+async def test_chats_run_in_parallel():
+    executor = ChatOrderedExecutor(workers=4)
+    log, gate = [], asyncio.Event()
+    for chat in (-1, -2, -3):
+        await executor.submit(chat, job(log, chat, gate))
+    await settle()
+    assert sorted(log) == [("start", -3), ("start", -2), ("start", -1)]
+    assert executor.stats()["running"] == 3
+    gate.set()
+    await executor.close()
+
+
+async def test_worker_count_bounds_concurrency():
+    executor = ChatOrderedExecutor(workers=2)
+    log, gate = [], asyncio.Event()
+    for chat in (-1, -2, -3):
+        await executor.submit(chat, job(log, chat, gate))
+    await settle()
+    assert len(log) == 2
+    gate.set()
+    await executor.close()
+    assert len(log) == 6
+
+
+async def test_busy_chat_takes_turns_with_others():
+    executor = ChatOrderedExecutor(workers=1)
+    log = []
+    for name in ("a1", "a2", "a3"):
+        await executor.submit("a", job(log, name))
+    await executor.submit("b", job(log, "b1"))
+    await executor.close()
+    starts = [name for event, name in log if event == "start"]
+    assert starts == ["a1", "b1", "a2", "a3"]
+
+
+async def test_submit_waits_when_full():
+    executor = ChatOrderedExecutor(workers=1, max_pending=2)
+    log, gate = [], asyncio.Event()
+    await executor.submit(-1, job(log, 1, gate))
+    await executor.submit(-2, job(log, 2))
+    third = asyncio.create_task(executor.submit(-3, job(log, 3)))
+    await settle()
+    assert not third.done()
+    assert executor.stats()["pending"] == 2
+
+    gate.set()
+    await asyncio.wait_for(third, 1)
+    await executor.close()
+    assert ("end", 3) in log
+
+
+async def test_failed_job_does_not_stop_its_chat():
+    executor = ChatOrderedExecutor(workers=1)
+    log = []
+    await executor.submit(-1, job(log, 1, fail=True))
+    await executor.submit(-1, job(log, 2))
+    await executor.close()
+    assert ("end", 2) in log
+    stats = executor.stats()
+    assert stats["processed"] == 2 and stats["pending"] == 0 and stats["chats"] == 0
+
+
+async def test_close_waits_for_queued_jobs():
+    executor = ChatOrderedExecutor(workers=1)
+    log = []
+    for name in range(5):
+        await executor.submit(-1, job(log, name))
+    await executor.close()
+    assert [name for event, name in log if event == "end"] == [0, 1, 2, 3, 4]
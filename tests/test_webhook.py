@@ -0,0 +1,93 @@
+# tests/test_webhook.py
+"""Webhook app: secret token check, update intake and health route."""
+import asyncio
+import importlib
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from aiogram import Bot, Router
+from aiogram.types import Message
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.core.config import settings
+
+_webhook = importlib.import_module("src.bot.webhook")
+_executor = importlib.import_module("src.bot.update-executor")
+
+pytestmark = pytest.mark.asyncio
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def update_json(update_id: int, text: str = "hello") -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(datetime.now().timestamp()),
+            "chat": {"id": 42, "type": "private"},
+            "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+            "text": text,
+        },
+    }
+
+
+@pytest.fixture
+def received():
+    """Texts of messages that reached a handler."""
+    return []
+
+
+@pytest_asyncio.fixture
+async def client(received):
+    router = Router()
+
+    @router.message()
+    async def record(message: Message) -> None:
+        received.append(message.text)
+
+    bot = Bot("123456:TEST")
+    dp = _executor.ChatOrderedDispatcher(_executor.get_update_executor())
+    dp.include_router(router)
+    async with TestClient(TestServer(_webhook.create_webhook_app(bot, dp))) as client:
+        yield client
+    await _executor.get_update_executor().close()
+    await bot.session.close()
+
+
+async def test_missing_or_wrong_secret_is_rejected(client, received):
+    response = await client.post(settings.WEBHOOK_PATH, json=update_json(1))
+    assert response.status == 401
+    response = await client.post(
+        settings.WEBHOOK_PATH, json=update_json(2), headers={SECRET_HEADER: "wrong"}
+    )
+    assert response.status == 401
+    await asyncio.sleep(0.05)
+    assert received == []
+    assert client.app[_webhook.WEBHOOK_HANDLER].stats() == {"received": 0, "rejected": 2}
+
+
+async def test_valid_update_is_fed_to_dispatcher(client, received):
+    response = await client.post(
+        settings.WEBHOOK_PATH, json=update_json(3, "/start"),
+        headers={SECRET_HEADER: _webhook.webhook_secret()},
+    )
+    assert response.status == 200
+
+    async def handled():
+        while not received:
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(handled(), 2)
+    assert received == ["/start"]
+    assert client.app[_webhook.WEBHOOK_HANDLER].stats() == {"received": 1, "rejected": 0}
+
+
+async def test_health_reports_webhook_and_queues(client):
+    response = await client.get(settings.WEBHOOK_HEALTH_PATH)
+    assert response.status == 200
+    body = await response.json()
+    assert body["status"] == "ok" and body["mode"] == "webhook"
+    assert body["webhook"] == {"received": 0, "rejected": 0}
+    assert {"pending", "running", "processed", "busiest"} <= set(body["updates"])
+    assert isinstance(body["outbound"], dict)